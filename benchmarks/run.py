@@ -0,0 +1,775 @@
+"""EScheduler SDK 基準測試
+
+以 escheduler_sdk.testing.FakeEScheduler 作為離線傳輸層，量測 SDK 熱路徑，
+結果以 JSON 輸出以便在不同 commit 之間比較。
+
+用法:
+    python benchmarks/run.py                          # 執行全部基準測試
+    python benchmarks/run.py --quick                  # 縮小資料量
+    python benchmarks/run.py --only parse_task_list   # 只執行指定項目
+    python benchmarks/run.py --output new.json --compare old.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from escheduler_sdk import (
+    ESchedulerSDK,
+    ScheduledTaskCreate,
+    ScheduledTaskResponse,
+    TargetType,
+    TaskRecord
+)
+from escheduler_sdk.testing import FakeEScheduler
+
+BASE_URL = "http://escheduler.test"
+
+BENCHMARKS: Dict[str, Callable[[bool], Dict[str, Any]]] = {}
+
+
+def benchmark(name: str):
+    """註冊基準測試函數，函數接收 quick 參數並返回指標字典"""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> float:
+    """執行多次並返回最短耗時（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+async def async_best_of(func: Callable[[], Any], repeat: int = 5) -> float:
+    """best_of 的異步版本"""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        await func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def sample_task_dicts(count: int) -> List[Dict[str, Any]]:
+    """產生 API 回傳格式的任務字典"""
+    fake = FakeEScheduler()
+    fake.seed_tasks(count)
+    return fake._list_tasks(None)
+
+
+def sample_task_create(index: int = 0) -> ScheduledTaskCreate:
+    """產生任務創建數據"""
+    return ScheduledTaskCreate(
+        name=f"bench-{index}",
+        description="基準測試任務",
+        schedule_expression="rate(5 minutes)",
+        target_type=TargetType.HTTP,
+        target_arn="https://httpbin.org/post",
+        target_input={"message": "hello", "index": index, "tags": ["a", "b", "c"]},
+        retry_policy={"backoff": "exponential", "base_seconds": 2}
+    )
+
+
+@benchmark("request_overhead")
+def bench_request_overhead(quick: bool) -> Dict[str, Any]:
+    """_request 相對於直接呼叫 httpx 的每次呼叫額外開銷"""
+    calls = 500 if quick else 3000
+
+    async def run():
+        fake = FakeEScheduler()
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            client = sdk.client
+            url = client._build_url("/api/scheduler/stats")
+
+            async def raw():
+                for _ in range(calls):
+                    (await client._client.request("GET", url)).json()
+
+            async def sdk_request():
+                for _ in range(calls):
+                    await client._request("GET", "/api/scheduler/stats")
+
+            raw_time = await async_best_of(raw, repeat=3)
+            sdk_time = await async_best_of(sdk_request, repeat=3)
+
+            limiter, client.limiter = client.limiter, None
+            unlimited_time = await async_best_of(sdk_request, repeat=3)
+            client.limiter = limiter
+        return raw_time, sdk_time, unlimited_time
+
+    raw_time, sdk_time, unlimited_time = asyncio.run(run())
+    return {
+        "calls": calls,
+        "httpx_us_per_call": raw_time / calls * 1e6,
+        "request_us_per_call": sdk_time / calls * 1e6,
+        "overhead_us_per_call": (sdk_time - raw_time) / calls * 1e6,
+        "limiter_us_per_call": (sdk_time - unlimited_time) / calls * 1e6,
+    }
+
+
+@benchmark("parse_task_list")
+def bench_parse_task_list(quick: bool) -> Dict[str, Any]:
+    """ScheduledTaskResponse 列表解析吞吐量"""
+    sizes = [1_000, 10_000] if quick else [1_000, 10_000, 100_000]
+    results = {}
+    for size in sizes:
+        data = sample_task_dicts(size)
+        elapsed = best_of(lambda: [ScheduledTaskResponse(**task) for task in data], repeat=3)
+        results[str(size)] = {"seconds": elapsed, "items_per_second": size / elapsed}
+    return results
+
+
+@benchmark("model_dump_create")
+def bench_model_dump_create(quick: bool) -> Dict[str, Any]:
+    """ScheduledTaskCreate.model_dump(exclude_none=True) 單次成本"""
+    iterations = 5_000 if quick else 50_000
+    task = sample_task_create()
+
+    def run():
+        for _ in range(iterations):
+            task.model_dump(exclude_none=True)
+
+    elapsed = best_of(run)
+    return {"iterations": iterations, "us_per_call": elapsed / iterations * 1e6}
+
+
+@benchmark("concurrent_create_get")
+def bench_concurrent_create_get(quick: bool) -> Dict[str, Any]:
+    """並發 create_task/get_task 的端對端吞吐量"""
+    operations = 1_000 if quick else 5_000
+    concurrency = 50
+
+    async def run():
+        fake = FakeEScheduler()
+        payloads = [sample_task_create(i) for i in range(operations)]
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def create(task_data):
+                async with semaphore:
+                    return await sdk.scheduler.create_task(task_data)
+
+            async def get(task_id):
+                async with semaphore:
+                    return await sdk.scheduler.get_task(task_id)
+
+            started = time.perf_counter()
+            created = await asyncio.gather(*(create(p) for p in payloads))
+            create_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            await asyncio.gather(*(get(task.id) for task in created))
+            get_time = time.perf_counter() - started
+        return create_time, get_time
+
+    create_time, get_time = asyncio.run(run())
+    return {
+        "operations": operations,
+        "concurrency": concurrency,
+        "create_ops_per_second": operations / create_time,
+        "get_ops_per_second": operations / get_time,
+    }
+
+
+@benchmark("get_all_tasks_memory")
+def bench_get_all_tasks_memory(quick: bool) -> Dict[str, Any]:
+    """get_all_tasks 的記憶體峰值（tracemalloc）"""
+    sizes = [10_000] if quick else [10_000, 100_000]
+    results = {}
+    for size in sizes:
+        async def run():
+            fake = FakeEScheduler()
+            fake.seed_tasks(size)
+            async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+                gc.collect()
+                tracemalloc.start()
+                started = time.perf_counter()
+                tasks = await sdk.scheduler.get_all_tasks()
+                elapsed = time.perf_counter() - started
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                assert len(tasks) == size
+            return elapsed, current, peak
+
+        elapsed, current, peak = asyncio.run(run())
+        results[str(size)] = {
+            "seconds": elapsed,
+            "retained_bytes": current,
+            "peak_bytes": peak,
+            "peak_bytes_per_task": peak / size,
+        }
+    return results
+
+
+@benchmark("task_record_memory")
+def bench_task_record_memory(quick: bool) -> Dict[str, Any]:
+    """常駐任務清單的記憶體：ScheduledTaskResponse 與 TaskRecord 比較"""
+    size = 20_000 if quick else 200_000
+    tasks = sample_task_dicts(size)
+    for i, task in enumerate(tasks):
+        task["target_input"] = {"message": "hello", "index": i}
+        task["updated_at"] = f"2024-01-15T09:{i // 60 % 60:02d}:{i % 60:02d}+00:00"
+    body = json.dumps(tasks).encode()
+    del tasks
+
+    results = {}
+    for name, convert in (
+        ("ScheduledTaskResponse", lambda task: ScheduledTaskResponse(**task)),
+        ("TaskRecord", TaskRecord.from_dict),
+    ):
+        convert(json.loads(body)[0])
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        items = [convert(task) for task in json.loads(body)]
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del items
+        results[name] = {
+            "seconds": elapsed,
+            "retained_bytes": retained,
+            "bytes_per_task": retained / size,
+        }
+    return results
+
+
+@benchmark("task_table_queries")
+def bench_task_table_queries(quick: bool) -> Dict[str, Any]:
+    """TaskTable 建立與向量化查詢（需要 numpy）"""
+    try:
+        from escheduler_sdk.table import TaskTable
+    except ImportError:
+        return {"skipped": "numpy 未安裝"}
+
+    size = 100_000 if quick else 1_000_000
+    tasks = sample_task_dicts(size)
+    started = time.perf_counter()
+    table = TaskTable.from_tasks(tasks)
+    build_time = time.perf_counter() - started
+    del tasks
+
+    queries = {
+        "count_by_state": lambda: table.count_by("state"),
+        "task_stats": table.task_stats,
+        "where_enabled_http": lambda: table.where(state="ENABLED", target_type="http"),
+        "overdue": table.overdue,
+        "sort_by_updated_at": lambda: table.sort_by("updated_at", descending=True),
+    }
+    results: Dict[str, Any] = {"rows": size, "build_seconds": build_time}
+    for name, query in queries.items():
+        results[f"{name}_ms"] = best_of(query, repeat=3) * 1e3
+    return results
+
+
+@benchmark("bulk_journal")
+def bench_bulk_journal(quick: bool) -> Dict[str, Any]:
+    """BulkJournal 寫入吞吐量，以及透過 BulkRunner 執行無延遲批量操作的速率"""
+    import tempfile
+
+    from escheduler_sdk.bulk import BulkJournal, BulkRunner
+
+    size = 5_000 if quick else 50_000
+    results: Dict[str, Any] = {"items": size}
+    with tempfile.TemporaryDirectory() as directory:
+        with BulkJournal(f"{directory}/record.journal") as journal:
+            started = time.perf_counter()
+            for i in range(size):
+                journal.record("bench", str(i), True, result=str(i))
+            results["record_ops_per_second"] = size / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            completed = journal.completed("bench")
+            results["load_completed_ms"] = (time.perf_counter() - started) * 1e3
+            assert len(completed) == size
+
+        async def noop() -> None:
+            return None
+
+        with BulkJournal(f"{directory}/run.journal") as journal:
+            runner = BulkRunner(None, journal, concurrency=50)  # type: ignore[arg-type]
+            started = time.perf_counter()
+            asyncio.run(runner.run("bench", ((str(i), noop) for i in range(size))))
+            results["runner_ops_per_second"] = size / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            resumed = asyncio.run(runner.run("bench", ((str(i), noop) for i in range(size))))
+            results["resume_skip_ops_per_second"] = size / (time.perf_counter() - started)
+            assert resumed.skipped == size
+    return results
+
+
+@benchmark("compression")
+def bench_compression(quick: bool) -> Dict[str, Any]:
+    """大型任務列表與批量創建的傳輸位元組數與端對端時間（壓縮與未壓縮）
+
+    模擬伺服器在行程內，沒有實際網路傳輸；wire_seconds_100mbps 在端對端時間上
+    加上以 100 Mbit/s 傳輸 wire_bytes 所需的時間。
+    """
+    from escheduler_sdk.bulk import BulkJournal, BulkRunner
+    from escheduler_sdk.compression import available_encodings
+
+    list_size = 10_000 if quick else 50_000
+    create_size = 200 if quick else 1_000
+    target_input = {
+        "rows": [{"id": i, "region": "ap-northeast-1", "enabled": True} for i in range(200)]
+    }
+    tasks = [
+        sample_task_create(i).model_copy(update={"target_input": target_input})
+        for i in range(create_size)
+    ]
+
+    def report(seconds: float, wire_bytes: int) -> Dict[str, float]:
+        return {
+            "seconds": seconds,
+            "wire_bytes": wire_bytes,
+            "wire_seconds_100mbps": seconds + wire_bytes * 8 / 100e6,
+        }
+
+    async def list_tasks(compress_responses: bool) -> Dict[str, float]:
+        fake = FakeEScheduler(compress_responses=compress_responses)
+        fake.seed_tasks(list_size)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            elapsed = await async_best_of(sdk.scheduler.get_all_tasks, repeat=3)
+        return report(elapsed, fake.response_bytes // 3)
+
+    async def create_tasks(compression: Optional[str]) -> Dict[str, float]:
+        best = float("inf")
+        for _ in range(3):
+            fake = FakeEScheduler()
+            async with ESchedulerSDK(base_url=BASE_URL, compression=compression, transport=fake.transport) as sdk:
+                with BulkJournal(":memory:") as journal:
+                    runner = BulkRunner(sdk.scheduler, journal, concurrency=50)
+                    started = time.perf_counter()
+                    result = await runner.create_tasks(tasks)
+                    best = min(best, time.perf_counter() - started)
+            assert result.succeeded == create_size
+        return report(best, fake.request_bytes)
+
+    async def run_all() -> Dict[str, Any]:
+        results: Dict[str, Any] = {
+            "list_tasks": list_size,
+            "list_identity": await list_tasks(False),
+            "list_negotiated": await list_tasks(True),
+            "create_tasks": create_size,
+            "create_identity": await create_tasks(None),
+        }
+        for encoding in available_encodings():
+            results[f"create_{encoding}"] = await create_tasks(encoding)
+        return results
+
+    return asyncio.run(run_all())
+
+
+@benchmark("task_template")
+def bench_task_template(quick: bool) -> Dict[str, Any]:
+    """TaskTemplate 與逐一建立 ScheduledTaskCreate 的每任務請求內容成本及批量建立吞吐量"""
+    from escheduler_sdk import TaskTemplate
+    from escheduler_sdk.bulk import BulkJournal, BulkRunner
+    from escheduler_sdk.compression import encode_json
+
+    size = 2_000 if quick else 10_000
+    target_input = {
+        "region": "ap-northeast-1",
+        "shard": 0,
+        "headers": {"X-Team": "platform", "X-Env": "prod"},
+        "payload": {"items": list(range(50))},
+    }
+    base = sample_task_create().model_copy(update={"target_input": target_input})
+    template = TaskTemplate(base, input_keys=("shard",))
+    items = [{"name": f"bench-task-{i}", "shard": i} for i in range(size)]
+
+    def per_model() -> None:
+        for values in items:
+            task = ScheduledTaskCreate(
+                name=values["name"],
+                schedule_expression=base.schedule_expression,
+                target_type=base.target_type,
+                target_arn=base.target_arn,
+                target_input={**target_input, "shard": values["shard"]},
+            )
+            encode_json(task.model_dump(exclude_none=True))
+
+    def per_template() -> None:
+        for values in items:
+            template.render(**values)
+
+    results: Dict[str, Any] = {
+        "tasks": size,
+        "model_us_per_task": best_of(per_model) / size * 1e6,
+        "template_us_per_task": best_of(per_template) / size * 1e6,
+    }
+
+    async def bulk(use_template: bool) -> float:
+        fake = FakeEScheduler()
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            with BulkJournal(":memory:") as journal:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=50)
+                started = time.perf_counter()
+                if use_template:
+                    result = await runner.create_from_template(template, items)
+                else:
+                    result = await runner.create_tasks(
+                        ScheduledTaskCreate(
+                            name=values["name"],
+                            schedule_expression=base.schedule_expression,
+                            target_type=base.target_type,
+                            target_arn=base.target_arn,
+                            target_input={**target_input, "shard": values["shard"]},
+                        )
+                        for values in items
+                    )
+                elapsed = time.perf_counter() - started
+        assert result.succeeded == size
+        return size / elapsed
+
+    results["bulk_model_tasks_per_second"] = asyncio.run(bulk(False))
+    results["bulk_template_tasks_per_second"] = asyncio.run(bulk(True))
+    return results
+
+
+@benchmark("task_mirror")
+def bench_task_mirror(quick: bool) -> Dict[str, Any]:
+    """TaskMirror 首次同步、無變更同步與本地索引查詢"""
+    from escheduler_sdk.mirror import TaskMirror
+
+    size = 20_000 if quick else 100_000
+    fake = FakeEScheduler()
+    fake.seed_tasks(size)
+
+    async def run() -> Dict[str, Any]:
+        results: Dict[str, Any] = {"tasks": size}
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            async with TaskMirror(sdk.scheduler, max_staleness=None) as mirror:
+                started = time.perf_counter()
+                await mirror.sync()
+                results["initial_sync_seconds"] = time.perf_counter() - started
+
+                started = time.perf_counter()
+                await mirror.sync()
+                results["unchanged_sync_seconds"] = time.perf_counter() - started
+
+                iterations = 20_000
+                for name, query in (
+                    ("get", lambda i: mirror.get(i % size + 1)),
+                    ("find_by_name", lambda i: mirror.find(name=f"task-{i % size + 1}")),
+                ):
+                    started = time.perf_counter()
+                    for i in range(iterations):
+                        await query(i)
+                    results[f"{name}_us"] = (time.perf_counter() - started) / iterations * 1e6
+        return results
+
+    return asyncio.run(run())
+
+
+@benchmark("search_index")
+def bench_search_index(quick: bool) -> Dict[str, Any]:
+    """TaskSearchIndex 建立、查詢與增量更新"""
+    import random
+
+    from escheduler_sdk.search import TaskSearchIndex
+
+    size = 20_000 if quick else 100_000
+    rng = random.Random(0)
+    words = ["daily", "report", "backup", "sync", "cleanup", "metrics", "billing", "每日報表", "資料同步"]
+    tasks = sample_task_dicts(size)
+    for task in tasks:
+        task["name"] = f"{rng.choice(words)}-{rng.choice(words)}-{task['id']}"
+        task["description"] = " ".join(rng.choice(words) for _ in range(5))
+
+    started = time.perf_counter()
+    index = TaskSearchIndex.from_tasks(tasks)
+    results: Dict[str, Any] = {"tasks": size, "build_seconds": time.perf_counter() - started}
+
+    queries = {
+        "exact_name": f"report-{size // 2}",
+        "single_char": "d",
+        "two_terms": "daily rep",
+        "cjk_substring": "報表",
+        "fuzzy": "bakcup",
+    }
+    iterations = 200
+    for name, keyword in queries.items():
+        index.search(keyword, limit=20)
+        elapsed = best_of(lambda: [index.search(keyword, limit=20) for _ in range(iterations)])
+        results[f"{name}_us"] = elapsed / iterations * 1e6
+
+    updates = tasks[:1000]
+    started = time.perf_counter()
+    for task in updates:
+        index.add({**task, "name": f"renamed-{task['id']}"})
+    results["update_us"] = (time.perf_counter() - started) / len(updates) * 1e6
+    return results
+
+
+@benchmark("middleware_chain")
+def bench_middleware_chain(quick: bool) -> Dict[str, Any]:
+    """中介層串接的每次呼叫成本（略過 httpx，只量測 SDK 端）"""
+    import httpx
+
+    from escheduler_sdk import ESchedulerClient
+
+    calls = 5_000 if quick else 20_000
+    response = httpx.Response(200, content=b'{"status":"ok"}')
+
+    async def send(**kwargs):
+        return response
+
+    def passthrough(call_next):
+        async def handler(request):
+            return await call_next(request)
+        return handler
+
+    async def measure(total_timeout: Optional[float] = None, **options) -> float:
+        client = ESchedulerClient(BASE_URL, **options)
+        client._client.request = send
+
+        async def run():
+            for _ in range(calls):
+                await client._request("GET", "/api/scheduler/stats", total_timeout=total_timeout)
+
+        elapsed = await async_best_of(run)
+        await client.close()
+        return elapsed / calls * 1e6
+
+    async def run_all() -> Dict[str, Any]:
+        return {
+            "calls": calls,
+            "bare_us_per_call": await measure(limiter=None),
+            "limiter_us_per_call": await measure(limiter="aimd"),
+            "five_middlewares_us_per_call": await measure(limiter=None, middlewares=[passthrough] * 5),
+            "deadline_us_per_call": await measure(total_timeout=10.0, limiter=None),
+        }
+
+    return asyncio.run(run_all())
+
+
+@benchmark("event_loop_lag")
+def bench_event_loop_lag(quick: bool) -> Dict[str, Any]:
+    """get_all_tasks 解碼大型回應期間事件迴圈的最大延遲（略過 httpx）"""
+    import httpx
+
+    size = 20_000 if quick else 100_000
+    body = json.dumps(sample_task_dicts(size)).encode()
+    interval = 0.001
+
+    async def measure(large_response_bytes: Optional[int]) -> Dict[str, float]:
+        sdk = ESchedulerSDK(base_url=BASE_URL, limiter=None, large_response_bytes=large_response_bytes)
+
+        async def send(**kwargs):
+            return httpx.Response(200, content=body)
+
+        sdk.client._client.request = send
+        lags: List[float] = []
+        done = False
+
+        async def ticker():
+            loop = asyncio.get_running_loop()
+            while not done:
+                expected = loop.time() + interval
+                await asyncio.sleep(interval)
+                lags.append(loop.time() - expected)
+
+        tick = asyncio.ensure_future(ticker())
+        await asyncio.sleep(interval * 2)
+        started = time.perf_counter()
+        tasks = await sdk.scheduler.get_all_tasks()
+        elapsed = time.perf_counter() - started
+        done = True
+        await tick
+        await sdk.close()
+        assert len(tasks) == size
+        lags.sort()
+        return {
+            "seconds": elapsed,
+            "p99_lag_ms": lags[int(len(lags) * 0.99)] * 1e3,
+            "max_lag_ms": lags[-1] * 1e3,
+        }
+
+    async def run_all() -> Dict[str, Any]:
+        return {
+            "tasks": size,
+            "response_bytes": len(body),
+            "blocking": await measure(None),
+            "cooperative": await measure(1 << 20),
+        }
+
+    return asyncio.run(run_all())
+
+
+@benchmark("cold_start")
+def bench_cold_start(quick: bool) -> Dict[str, Any]:
+    """並發請求突發的延遲：冷連線池 vs warmup 之後（本機 HTTP 伺服器，每條新連線延遲 100ms）"""
+    # 20 為 httpx 預設的 max_keepalive_connections
+    burst = 20
+    rounds = 3 if quick else 10
+    connect_delay = 0.1
+
+    async def measure(warm: bool) -> Dict[str, float]:
+        latencies: List[float] = []
+        opened = 0
+        for _ in range(rounds):
+            fake = FakeEScheduler()
+            fake.seed_tasks(1)
+            server = await fake.serve(connect_delay=connect_delay)
+            port = server.sockets[0].getsockname()[1]
+            async with ESchedulerSDK(base_url=f"http://127.0.0.1:{port}", limiter=None) as sdk:
+                if warm:
+                    await sdk.warmup(burst)
+                before = fake.connections_opened
+
+                async def timed() -> None:
+                    started = time.perf_counter()
+                    await sdk.scheduler.get_task(1)
+                    latencies.append(time.perf_counter() - started)
+
+                await asyncio.gather(*(timed() for _ in range(burst)))
+                opened += fake.connections_opened - before
+            server.close()
+            await server.wait_closed()
+        latencies.sort()
+        return {
+            "p50_ms": latencies[len(latencies) // 2] * 1e3,
+            "p99_ms": latencies[int(len(latencies) * 0.99)] * 1e3,
+            "connections_opened_per_burst": opened / rounds,
+        }
+
+    async def run_all() -> Dict[str, Any]:
+        return {
+            "burst": burst,
+            "connect_delay_ms": connect_delay * 1e3,
+            "cold": await measure(False),
+            "warm": await measure(True),
+        }
+
+    return asyncio.run(run_all())
+
+
+@benchmark("fleet_aggregation")
+def bench_fleet_aggregation(quick: bool) -> Dict[str, Any]:
+    """所有團隊的統計與任務清單：依序 auth_and_set_token vs FleetAggregator（每個請求 5ms）"""
+    from escheduler_sdk import FleetAggregator
+
+    team_count = 10 if quick else 40
+    tokens = {f"T{i:03d}": f"第{i}小隊" for i in range(1, team_count + 1)}
+
+    async def serial() -> float:
+        fake = FakeEScheduler(latency=0.005, teams=tokens, require_auth=True)
+        fake.seed_tasks(50)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport, limiter=None) as sdk:
+            started = time.perf_counter()
+            for token in tokens:
+                await sdk.team.auth_and_set_token(token)
+                await sdk.scheduler.get_scheduler_stats()
+                await sdk.scheduler.get_all_tasks()
+            return time.perf_counter() - started
+
+    async def aggregated() -> Dict[str, float]:
+        fake = FakeEScheduler(latency=0.005, teams=tokens, require_auth=True)
+        fake.seed_tasks(50)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport, limiter=None) as sdk:
+            # 模擬伺服器依 teams 的順序分配團隊 ID
+            aggregator = FleetAggregator(sdk, dict(enumerate(tokens, start=1)))
+            report = await aggregator.collect()
+        assert not report.failed
+        latencies = sorted(report.latencies.values())
+        return {
+            "seconds": report.elapsed,
+            "p50_team_ms": latencies[len(latencies) // 2] * 1e3,
+            "max_team_ms": latencies[-1] * 1e3,
+        }
+
+    async def run_all() -> Dict[str, Any]:
+        return {
+            "teams": team_count,
+            "serial_seconds": await serial(),
+            "aggregated": await aggregated(),
+        }
+
+    return asyncio.run(run_all())
+
+
+def git_revision() -> Optional[str]:
+    """取得目前的 git commit"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(metrics: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """將巢狀指標展平為 a.b.c 形式的鍵"""
+    flat = {}
+    for key, value in metrics.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """列印與基準結果的比值"""
+    old = flatten(baseline.get("results", {}))
+    new = flatten(current["results"])
+    print(f"\n與 {baseline.get('revision')} 比較 (新/舊):")
+    for name in sorted(new):
+        if name in old and old[name]:
+            print(f"  {name}: {new[name]:.4g} / {old[name]:.4g} = {new[name] / old[name]:.3f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="EScheduler SDK 基準測試")
+    parser.add_argument("--quick", action="store_true", help="縮小資料量")
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS), help="只執行指定項目")
+    parser.add_argument("--output", default="benchmark-results.json", help="JSON 結果輸出路徑")
+    parser.add_argument("--compare", help="要比較的舊結果 JSON 路徑")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        print(f"執行 {name} ...", flush=True)
+        results[name] = BENCHMARKS[name](args.quick)
+        print(json.dumps(results[name], indent=2, ensure_ascii=False))
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n結果已寫入 {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
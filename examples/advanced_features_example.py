@@ -6,10 +6,11 @@ from typing import List, Dict, Any
 
 from escheduler_sdk import (
     ESchedulerSDK,
+    ExecutionAnalyzer,
+    HealthChecker,
     ScheduledTaskCreate,
     ScheduledTaskUpdate,
-    TargetType,
-    TaskState
+    TargetType
 )
 
 
@@ -117,127 +118,44 @@ async def demonstrate_advanced_features():
         # 3. 任務執行歷史分析
         print("\n3. 任務執行歷史分析")
         
-        for task in demo_tasks[:2]:  # 只分析前兩個任務
-            try:
-                print(f"\n📈 分析任務: {task.name}")
-                
-                # 獲取任務執行歷史
-                history = await sdk.scheduler.get_task_execution_history(
-                    task.id,
-                    limit=10  # 獲取最近 10 次執行記錄
-                )
-                
-                if history:
-                    print(f"   最近 {len(history)} 次執行記錄:")
-                    
-                    success_count = 0
-                    failure_count = 0
-                    total_duration = 0
-                    
-                    for i, execution in enumerate(history, 1):
-                        status_emoji = "✅" if execution.status == "SUCCESS" else "❌"
-                        print(f"   {i}. {status_emoji} {execution.execution_time} - {execution.status}")
-                        
-                        if hasattr(execution, 'duration_ms') and execution.duration_ms:
-                            print(f"      執行時間: {execution.duration_ms}ms")
-                            total_duration += execution.duration_ms
-                        
-                        if execution.status == "SUCCESS":
-                            success_count += 1
-                        else:
-                            failure_count += 1
-                            if hasattr(execution, 'error_message') and execution.error_message:
-                                print(f"      錯誤信息: {execution.error_message}")
-                    
-                    # 執行統計
-                    total_executions = len(history)
-                    if total_executions > 0:
-                        success_rate = (success_count / total_executions) * 100
-                        print(f"   執行統計:")
-                        print(f"     成功: {success_count}/{total_executions} ({success_rate:.1f}%)")
-                        print(f"     失敗: {failure_count}/{total_executions}")
-                        
-                        if total_duration > 0:
-                            avg_duration = total_duration / total_executions
-                            print(f"     平均執行時間: {avg_duration:.1f}ms")
-                else:
-                    print("   暫無執行歷史")
-                
-            except Exception as e:
-                print(f"❌ 獲取任務 {task.name} 執行歷史失敗: {e}")
+        analyzer = ExecutionAnalyzer()
+        try:
+            # 並發取得每個任務最近 50 次執行記錄，邊取得邊累計統計
+            await analyzer.collect(sdk.scheduler, [task.id for task in demo_tasks], limit=50)
+        except Exception as e:
+            print(f"❌ 獲取執行歷史失敗: {e}")
+        
+        for task in demo_tasks[:2]:  # 只顯示前兩個任務
+            stats = analyzer.per_task.get(task.id)
+            print(f"\n📈 分析任務: {task.name}")
+            if stats is None or not stats.total:
+                print("   暫無執行歷史")
+                continue
+            
+            print(f"   執行次數: {stats.total}")
+            print(f"   成功: {stats.succeeded}/{stats.completed}")
+            print(f"   重試次數分佈: {dict(stats.attempt_counts)}")
+            if stats.durations_ms.count:
+                percentiles = stats.duration_percentiles()
+                print(f"   執行時間 p50: {percentiles['p50']:.1f}ms, p99: {percentiles['p99']:.1f}ms")
         
         # 4. 任務監控和健康檢查
         print("\n4. 任務監控和健康檢查")
         
-        async def check_task_health(task_id: str, task_name: str) -> Dict[str, Any]:
-            """檢查單個任務的健康狀態"""
-            health_info = {
-                "task_id": task_id,
-                "task_name": task_name,
-                "is_healthy": True,
-                "issues": []
-            }
-            
-            try:
-                # 獲取任務詳情
-                task_detail = await sdk.scheduler.get_task(task_id)
-                
-                # 檢查任務狀態
-                if task_detail.state != TaskState.ENABLED:
-                    health_info["is_healthy"] = False
-                    health_info["issues"].append(f"任務狀態異常: {task_detail.state}")
-                
-                # 檢查最近執行情況
-                try:
-                    recent_history = await sdk.scheduler.get_task_execution_history(
-                        task_id, limit=5
-                    )
-                    
-                    if recent_history:
-                        # 檢查最近 5 次執行的失敗率
-                        failed_count = sum(1 for exec in recent_history if exec.status != "SUCCESS")
-                        failure_rate = failed_count / len(recent_history)
-                        
-                        if failure_rate > 0.6:  # 失敗率超過 60%
-                            health_info["is_healthy"] = False
-                            health_info["issues"].append(f"最近執行失敗率過高: {failure_rate*100:.1f}%")
-                        
-                        # 檢查是否長時間沒有執行
-                        if recent_history:
-                            last_execution = recent_history[0]
-                            # 這裡假設 execution_time 是 datetime 對象
-                            # 實際使用時需要根據 API 返回的格式調整
-                            if hasattr(last_execution, 'execution_time'):
-                                # 如果超過預期間隔時間的 2 倍沒有執行，標記為異常
-                                # 這裡簡化處理，實際應該根據任務的調度表達式計算
-                                pass
-                    else:
-                        health_info["issues"].append("沒有執行歷史記錄")
-                        
-                except Exception as e:
-                    health_info["issues"].append(f"無法獲取執行歷史: {e}")
-                
-            except Exception as e:
-                health_info["is_healthy"] = False
-                health_info["issues"].append(f"無法獲取任務詳情: {e}")
-            
-            return health_info
-        
-        # 檢查所有演示任務的健康狀態
+        # 檢查所有演示任務的健康狀態（並發取得任務詳情與執行記錄，依完成順序輸出）
         print("🏥 任務健康檢查:")
         
         healthy_tasks = 0
         unhealthy_tasks = 0
         
-        for task in demo_tasks:
-            health_info = await check_task_health(task.id, task.name)
-            
-            if health_info["is_healthy"]:
-                print(f"   ✅ {health_info['task_name']}: 健康")
+        checker = HealthChecker(sdk.scheduler, concurrency=20, executions_limit=5)
+        async for report in checker.check(demo_tasks):
+            if report.is_healthy:
+                print(f"   ✅ {report.task_name}: 健康")
                 healthy_tasks += 1
             else:
-                print(f"   ❌ {health_info['task_name']}: 異常")
-                for issue in health_info["issues"]:
+                print(f"   ❌ {report.task_name or report.task_id}: 異常")
+                for issue in report.issues:
                     print(f"      - {issue}")
                 unhealthy_tasks += 1
         
@@ -295,66 +213,40 @@ async def demonstrate_advanced_features():
         # 7. 任務性能分析
         print("\n7. 任務性能分析")
         
-        async def analyze_task_performance(task_id: str, task_name: str):
-            """分析任務性能"""
-            try:
-                print(f"\n📊 分析任務性能: {task_name}")
-                
-                # 獲取更多執行歷史用於分析
-                history = await sdk.scheduler.get_task_execution_history(
-                    task_id, limit=50
-                )
-                
-                if not history:
-                    print("   暫無足夠的執行數據進行分析")
-                    return
-                
-                # 性能指標
-                durations = []
-                success_count = 0
-                failure_count = 0
-                
-                for execution in history:
-                    if execution.status == "SUCCESS":
-                        success_count += 1
-                    else:
-                        failure_count += 1
-                    
-                    if hasattr(execution, 'duration_ms') and execution.duration_ms:
-                        durations.append(execution.duration_ms)
-                
-                # 計算統計信息
-                total_executions = len(history)
-                success_rate = (success_count / total_executions) * 100
-                
-                print(f"   執行次數: {total_executions}")
-                print(f"   成功率: {success_rate:.2f}%")
-                
-                if durations:
-                    avg_duration = sum(durations) / len(durations)
-                    min_duration = min(durations)
-                    max_duration = max(durations)
-                    
-                    print(f"   平均執行時間: {avg_duration:.2f}ms")
-                    print(f"   最快執行時間: {min_duration}ms")
-                    print(f"   最慢執行時間: {max_duration}ms")
-                    
-                    # 性能建議
-                    if avg_duration > 10000:  # 超過 10 秒
-                        print(f"   ⚠️  建議: 執行時間較長，考慮優化任務邏輯")
-                    
-                    if max_duration > avg_duration * 3:  # 最慢執行時間是平均時間的 3 倍以上
-                        print(f"   ⚠️  建議: 執行時間不穩定，檢查資源使用情況")
+        for task in demo_tasks:
+            stats = analyzer.per_task.get(task.id)
+            print(f"\n📊 分析任務性能: {task.name}")
+            if stats is None or not stats.completed:
+                print("   暫無足夠的執行數據進行分析")
+                continue
+            
+            success_rate = stats.success_rate * 100
+            print(f"   執行次數: {stats.total}")
+            print(f"   成功率: {success_rate:.2f}%")
+            
+            durations = stats.durations_ms
+            if durations.count:
+                p95 = durations.quantile(0.95)
+                print(f"   平均執行時間: {durations.mean:.2f}ms")
+                print(f"   最快執行時間: {durations.min:.0f}ms")
+                print(f"   最慢執行時間: {durations.max:.0f}ms")
+                print(f"   p95 執行時間: {p95:.2f}ms")
                 
-                if success_rate < 95:
-                    print(f"   ⚠️  建議: 成功率較低，檢查任務配置和目標服務")
+                # 性能建議
+                if durations.mean > 10000:  # 超過 10 秒
+                    print(f"   ⚠️  建議: 執行時間較長，考慮優化任務邏輯")
                 
-            except Exception as e:
-                print(f"❌ 分析任務 {task_name} 性能失敗: {e}")
-        
-        # 分析所有演示任務的性能
-        for task in demo_tasks:
-            await analyze_task_performance(task.id, task.name)
+                if p95 > durations.quantile(0.5) * 3:  # 尾端延遲是中位數的 3 倍以上
+                    print(f"   ⚠️  建議: 執行時間不穩定，檢查資源使用情況")
+            
+            if success_rate < 95:
+                print(f"   ⚠️  建議: 成功率較低，檢查任務配置和目標服務")
+        
+        # 整體統計
+        fleet = analyzer.fleet
+        if fleet.completed:
+            print(f"\n整體成功率: {fleet.success_rate * 100:.2f}%")
+            print(f"整體執行時間百分位數: {fleet.duration_percentiles()}")
         
         # 8. 清理演示任務
         print("\n8. 清理演示任務")
@@ -1,42 +1,154 @@
 """EScheduler Python SDK
 
 A Python SDK for interacting with the EScheduler API.
+
+套件頂層的名稱採延遲匯入：只在第一次存取時才載入對應的子模組，
+因此只需要枚舉或異常類的程式不會載入 httpx 與 pydantic。
 """
 
-from .client import ESchedulerClient
-from .sdk import ESchedulerSDK
-from .models import (
-    ScheduledTaskCreate,
-    ScheduledTaskUpdate,
-    ScheduledTaskResponse,
-    TaskExecutionResponse,
-    SchedulerStatsResponse,
-    TaskStateUpdateRequest,
-    Team,
-    TeamAuthRequest,
-    TeamAuthResponse,
-    TaskState,
-    TargetType,
-    ExecutionStatus,
-    ScheduleType
-)
-from .exceptions import (
-    ESchedulerError,
-    AuthenticationError,
-    ValidationError,
-    NotFoundError,
-    ServerError
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "0.1.0"
 __author__ = "EScheduler Team"
 __email__ = "team@escheduler.com"
 
+# 名稱 -> 定義該名稱的子模組
+_LAZY_ATTRIBUTES = {
+    "ESchedulerClient": "client",
+    "ESchedulerSDK": "sdk",
+    "TriggerCoalescer": "coalescer",
+    "ExecutionWatcher": "executions",
+    "TaskRecord": "records",
+    "TaskTable": "table",
+    "ExecutionAnalyzer": "analytics",
+    "HealthChecker": "health",
+    "ImportResult": "transfer",
+    "BulkJournal": "bulk",
+    "BulkRunner": "bulk",
+    "BulkResult": "bulk",
+    "TaskMirror": "mirror",
+    "TaskSearchIndex": "search",
+    "TaskTemplate": "templates",
+    "FleetAggregator": "fleet",
+    "FleetReport": "fleet",
+    "EndpointPool": "balancer",
+    "AdaptiveLimiter": "limiter",
+    "request_priority": "limiter",
+    "request_deadline": "deadline",
+    "request_credentials": "credentials",
+    "ScheduledTaskCreate": "models",
+    "ScheduledTaskUpdate": "models",
+    "ScheduledTaskResponse": "models",
+    "TaskExecutionResponse": "models",
+    "SchedulerStatsResponse": "models",
+    "TaskStateUpdateRequest": "models",
+    "Team": "models",
+    "TeamAuthRequest": "models",
+    "TeamAuthResponse": "models",
+    "TaskChangeEvent": "models",
+    "TaskHealthReport": "models",
+    "TaskState": "enums",
+    "TargetType": "enums",
+    "ExecutionStatus": "enums",
+    "ScheduleType": "enums",
+    "TaskChangeType": "enums",
+    "RequestPriority": "enums",
+    "ESchedulerError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "ValidationError": "exceptions",
+    "NotFoundError": "exceptions",
+    "ServerError": "exceptions",
+}
+
+if TYPE_CHECKING:
+    from .client import ESchedulerClient
+    from .sdk import ESchedulerSDK
+    from .coalescer import TriggerCoalescer
+    from .executions import ExecutionWatcher
+    from .records import TaskRecord
+    from .table import TaskTable
+    from .analytics import ExecutionAnalyzer
+    from .health import HealthChecker
+    from .transfer import ImportResult
+    from .bulk import BulkJournal, BulkRunner, BulkResult
+    from .mirror import TaskMirror
+    from .search import TaskSearchIndex
+    from .templates import TaskTemplate
+    from .fleet import FleetAggregator, FleetReport
+    from .balancer import EndpointPool
+    from .limiter import AdaptiveLimiter, request_priority
+    from .deadline import request_deadline
+    from .credentials import request_credentials
+    from .models import (
+        ScheduledTaskCreate,
+        ScheduledTaskUpdate,
+        ScheduledTaskResponse,
+        TaskExecutionResponse,
+        SchedulerStatsResponse,
+        TaskStateUpdateRequest,
+        Team,
+        TeamAuthRequest,
+        TeamAuthResponse,
+        TaskChangeEvent,
+        TaskHealthReport
+    )
+    from .enums import (
+        TaskState,
+        TargetType,
+        ExecutionStatus,
+        ScheduleType,
+        TaskChangeType,
+        RequestPriority
+    )
+    from .exceptions import (
+        ESchedulerError,
+        AuthenticationError,
+        ValidationError,
+        NotFoundError,
+        ServerError
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """第一次存取時載入子模組，並將結果快取到套件命名空間"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
+
+
 __all__ = [
     "ESchedulerSDK",
     "ESchedulerClient",
+    "TriggerCoalescer",
+    "ExecutionWatcher",
+    "TaskRecord",
+    "TaskTable",
+    "ExecutionAnalyzer",
+    "HealthChecker",
+    "ImportResult",
+    "BulkJournal",
+    "BulkRunner",
+    "BulkResult",
+    "TaskMirror",
+    "TaskSearchIndex",
+    "TaskTemplate",
+    "FleetAggregator",
+    "FleetReport",
+    "EndpointPool",
+    "AdaptiveLimiter",
+    "request_priority",
+    "request_deadline",
+    "request_credentials",
     "ScheduledTaskCreate",
-    "ScheduledTaskUpdate", 
+    "ScheduledTaskUpdate",
     "ScheduledTaskResponse",
     "TaskExecutionResponse",
     "SchedulerStatsResponse",
@@ -48,9 +160,13 @@ __all__ = [
     "TargetType",
     "ExecutionStatus",
     "ScheduleType",
+    "TaskChangeType",
+    "RequestPriority",
+    "TaskChangeEvent",
+    "TaskHealthReport",
     "ESchedulerError",
     "AuthenticationError",
     "ValidationError",
     "NotFoundError",
     "ServerError"
-]
\ No newline at end of file
+]
@@ -0,0 +1,377 @@
+"""EScheduler SDK 執行記錄分析
+
+以串流方式累計任務執行記錄，計算各任務與整體的成功率、重試次數分佈
+與執行時間百分位數。執行時間使用對數分桶的分位數草圖（DDSketch 演算法），
+記憶體用量與執行記錄數無關，百分位數的相對誤差不超過 relative_accuracy。
+"""
+
+import asyncio
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, Iterable, List, Optional, Sequence
+
+from .enums import ExecutionStatus
+from .exceptions import ESchedulerError
+from .executions import FINAL_EXECUTION_STATUSES
+from .models import TaskExecutionResponse
+
+if TYPE_CHECKING:
+    from .scheduler import SchedulerAPI
+
+
+DEFAULT_PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """對數分桶的分位數草圖
+
+    每個值依 ceil(log_gamma(value)) 放入桶中，桶數超過 max_buckets 時
+    合併最低的桶，因此只有極小值的精度會受影響。
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        初始化分位數草圖
+
+        Args:
+            relative_accuracy: 分位數的相對誤差上限
+            max_buckets: 桶數上限
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy 必須介於 0 與 1 之間")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean(self) -> Optional[float]:
+        """平均值，沒有資料時為 None"""
+        return self.sum / self.count if self.count else None
+
+    def add(self, value: float) -> None:
+        """
+        加入一個非負值
+
+        Args:
+            value: 要加入的值
+        """
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if value <= 0:
+            self._zero_count += 1
+            return
+
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        合併另一個相同精度的草圖
+
+        Args:
+            other: 另一個草圖
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("只能合併相同 relative_accuracy 的草圖")
+
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        估計分位數
+
+        Args:
+            q: 介於 0 與 1 之間的分位
+
+        Returns:
+            分位數估計值，沒有資料時為 None
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q 必須介於 0 與 1 之間")
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def _collapse(self) -> None:
+        """將最低的兩個桶合併"""
+        lowest, second = sorted(self._buckets)[:2]
+        self._buckets[second] += self._buckets.pop(lowest)
+
+
+class ExecutionStats:
+    """一組執行記錄的累計統計"""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        初始化統計
+
+        Args:
+            relative_accuracy: 執行時間百分位數的相對誤差上限
+        """
+        self.total = 0
+        self.status_counts: Counter = Counter()
+        self.attempt_counts: Counter = Counter()
+        self.durations_ms = QuantileSketch(relative_accuracy)
+
+    @property
+    def completed(self) -> int:
+        """已到達最終狀態的執行數"""
+        return sum(self.status_counts[status] for status in FINAL_EXECUTION_STATUSES)
+
+    @property
+    def succeeded(self) -> int:
+        """成功的執行數"""
+        return self.status_counts[ExecutionStatus.SUCCEEDED]
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        """成功率（成功數 / 已完成數），沒有已完成的執行時為 None"""
+        completed = self.completed
+        return self.succeeded / completed if completed else None
+
+    @property
+    def retry_rate(self) -> Optional[float]:
+        """attempt_number 大於 1 的執行比例"""
+        if not self.total:
+            return None
+        return (self.total - self.attempt_counts[1]) / self.total
+
+    def add(self, execution: TaskExecutionResponse) -> None:
+        """
+        加入一筆執行記錄
+
+        Args:
+            execution: 執行記錄
+        """
+        self.total += 1
+        self.status_counts[ExecutionStatus(execution.status)] += 1
+        self.attempt_counts[execution.attempt_number] += 1
+        if execution.completed_at is not None:
+            duration = (execution.completed_at - execution.started_at).total_seconds() * 1000
+            self.durations_ms.add(max(duration, 0.0))
+
+    def merge(self, other: "ExecutionStats") -> None:
+        """
+        合併另一組統計
+
+        Args:
+            other: 另一組統計
+        """
+        self.total += other.total
+        self.status_counts.update(other.status_counts)
+        self.attempt_counts.update(other.attempt_counts)
+        self.durations_ms.merge(other.durations_ms)
+
+    def duration_percentiles(
+        self,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Optional[float]]:
+        """
+        執行時間百分位數（毫秒）
+
+        Args:
+            percentiles: 要計算的分位
+
+        Returns:
+            如 {"p50": 120.0, "p99": 980.0}
+        """
+        return {
+            f"p{q * 100:g}": self.durations_ms.quantile(q)
+            for q in percentiles
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """轉換為可序列化的字典"""
+        durations = self.durations_ms
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "succeeded": self.succeeded,
+            "success_rate": self.success_rate,
+            "status_counts": {status.value: count for status, count in self.status_counts.items()},
+            "attempt_counts": dict(sorted(self.attempt_counts.items())),
+            "retry_rate": self.retry_rate,
+            "duration_ms": {
+                "count": durations.count,
+                "mean": durations.mean,
+                "min": durations.min if durations.count else None,
+                "max": durations.max if durations.count else None,
+                **self.duration_percentiles(),
+            },
+        }
+
+
+class ExecutionAnalyzer:
+    """執行記錄串流分析器
+
+    範例:
+        analyzer = ExecutionAnalyzer()
+        await analyzer.collect(sdk.scheduler, [task.id for task in tasks], limit=50)
+        print(analyzer.fleet.success_rate, analyzer.fleet.duration_percentiles())
+        for task_id, stats in analyzer.per_task.items():
+            ...
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        初始化分析器
+
+        Args:
+            relative_accuracy: 執行時間百分位數的相對誤差上限
+        """
+        self.relative_accuracy = relative_accuracy
+        self.fleet = ExecutionStats(relative_accuracy)
+        self.per_task: Dict[int, ExecutionStats] = {}
+        # collect 取得失敗的任務 ID -> 錯誤
+        self.errors: Dict[int, ESchedulerError] = {}
+
+    def add(self, execution: TaskExecutionResponse) -> None:
+        """
+        加入一筆執行記錄
+
+        Args:
+            execution: 執行記錄
+        """
+        stats = self.per_task.get(execution.task_id)
+        if stats is None:
+            stats = self.per_task[execution.task_id] = ExecutionStats(self.relative_accuracy)
+        stats.add(execution)
+        self.fleet.add(execution)
+
+    def add_all(self, executions: Iterable[TaskExecutionResponse]) -> None:
+        """
+        加入多筆執行記錄
+
+        Args:
+            executions: 執行記錄的可迭代物件
+        """
+        for execution in executions:
+            self.add(execution)
+
+    async def add_stream(self, executions: AsyncIterable[TaskExecutionResponse]) -> None:
+        """
+        從異步串流加入執行記錄
+
+        Args:
+            executions: 執行記錄的異步可迭代物件
+        """
+        async for execution in executions:
+            self.add(execution)
+
+    async def collect(
+        self,
+        scheduler: "SchedulerAPI",
+        task_ids: Iterable[int],
+        limit: Optional[int] = None,
+        concurrency: int = 10
+    ) -> Dict[int, ESchedulerError]:
+        """
+        並發取得多個任務的執行記錄並加入分析
+
+        每個任務的執行記錄在取得後立即累計並釋放，不會全部保留在記憶體中；
+        分析不需要回應內容，因此以摘要模式取得。單一任務的 ESchedulerError
+        （任務不存在、逾時等）記錄在 errors 中，其他任務照常分析。
+
+        Args:
+            scheduler: 排程任務 API 實例
+            task_ids: 任務 ID 列表
+            limit: 每個任務取得的最近執行記錄數
+            concurrency: 同時進行中的請求上限
+
+        Returns:
+            這次取得失敗的任務 ID -> 錯誤
+
+        Raises:
+            Exception: 任務取得時發生 ESchedulerError 以外的錯誤，在所有請求結束後拋出
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        task_ids = list(task_ids)
+
+        async def fetch(task_id: int) -> None:
+            async with semaphore:
+                executions = await scheduler.get_task_executions(
+                    task_id, limit=limit, summary=True, body_preview=0
+                )
+            self.add_all(executions)
+
+        results = await asyncio.gather(
+            *(fetch(task_id) for task_id in task_ids), return_exceptions=True
+        )
+        errors: Dict[int, ESchedulerError] = {}
+        unexpected: Optional[BaseException] = None
+        for task_id, result in zip(task_ids, results):
+            if isinstance(result, ESchedulerError):
+                errors[task_id] = result
+            elif isinstance(result, BaseException) and unexpected is None:
+                unexpected = result
+        self.errors.update(errors)
+        if unexpected is not None:
+            raise unexpected
+        return errors
+
+    def slowest_tasks(self, count: int = 10, percentile: float = 0.95) -> List[int]:
+        """
+        依執行時間百分位數找出最慢的任務
+
+        Args:
+            count: 返回的任務數
+            percentile: 用於比較的分位
+
+        Returns:
+            任務 ID 列表，由慢到快
+        """
+        ranked = [
+            (stats.durations_ms.quantile(percentile), task_id)
+            for task_id, stats in self.per_task.items()
+            if stats.durations_ms.count
+        ]
+        ranked.sort(reverse=True)
+        return [task_id for _, task_id in ranked[:count]]
+
+    def report(self) -> Dict[str, Any]:
+        """
+        產生整體與各任務的統計報告
+
+        Returns:
+            {"fleet": {...}, "tasks": {task_id: {...}}, "errors": {task_id: 錯誤訊息}}
+        """
+        return {
+            "fleet": self.fleet.to_dict(),
+            "tasks": {task_id: stats.to_dict() for task_id, stats in self.per_task.items()},
+            "errors": {task_id: str(error) for task_id, error in self.errors.items()},
+        }
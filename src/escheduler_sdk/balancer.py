@@ -0,0 +1,181 @@
+"""EScheduler SDK 多端點負載平衡
+
+EndpointPool 為每個請求從多個 API 副本中選擇一個端點：
+
+- "ewma"：以指數加權移動平均延遲乘以（進行中請求數 + 1）評分，選擇最低者
+- "least_outstanding"：選擇進行中請求最少的端點，相同時輪流使用
+
+連續失敗達到 failure_threshold 次的端點會被暫時剔除，剔除時間在每次探測
+失敗後加倍。剔除時間結束後，端點進入半開狀態，只允許一個冪等請求作為探測；
+探測成功即恢復，失敗則再次剔除。
+"""
+
+import itertools
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+LOAD_BALANCING_STRATEGIES = ("ewma", "least_outstanding")
+
+
+class Endpoint:
+    """單一 API 端點的狀態"""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.ewma_latency: Optional[float] = None
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.probing = False
+        self.requests = 0
+        self.failures = 0
+
+    def is_ejected(self, now: float) -> bool:
+        """是否仍在剔除期間"""
+        return now < self.ejected_until
+
+    def is_half_open(self, now: float) -> bool:
+        """剔除期間已結束但尚未以探測恢復"""
+        return self.ejections > 0 and not self.is_ejected(now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """轉換為可序列化的狀態字典"""
+        now = time.monotonic()
+        return {
+            "url": self.url,
+            "ewma_latency_ms": self.ewma_latency * 1000 if self.ewma_latency is not None else None,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "healthy": self.ejections == 0,
+            "ejected_for": max(0.0, self.ejected_until - now),
+        }
+
+
+class EndpointPool:
+    """多端點選擇與健康狀態追蹤"""
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        strategy: str = "ewma",
+        decay: float = 0.3,
+        failure_threshold: int = 3,
+        ejection_time: float = 5.0,
+        max_ejection_time: float = 120.0
+    ):
+        """
+        初始化端點池
+
+        Args:
+            urls: 端點基礎 URL 列表
+            strategy: "ewma" 或 "least_outstanding"
+            decay: EWMA 中新樣本的權重
+            failure_threshold: 連續失敗幾次後剔除
+            ejection_time: 第一次剔除的秒數，之後每次探測失敗加倍
+            max_ejection_time: 剔除秒數上限
+        """
+        if not urls:
+            raise ValueError("至少需要一個端點")
+        if strategy not in LOAD_BALANCING_STRATEGIES:
+            raise ValueError(
+                f"不支援的負載平衡策略: {strategy}，可用策略: {', '.join(LOAD_BALANCING_STRATEGIES)}"
+            )
+
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.strategy = strategy
+        self.decay = decay
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self.max_ejection_time = max_ejection_time
+        self._rotation = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def choose(self, exclude: Iterable[Endpoint] = (), idempotent: bool = True) -> Endpoint:
+        """
+        選擇本次請求使用的端點
+
+        Args:
+            exclude: 本次呼叫已失敗、應避開的端點
+            idempotent: 請求是否冪等；非冪等請求不會被用來探測半開的端點
+
+        Returns:
+            選中的端點；所有端點都不可用時，返回最早結束剔除的端點
+        """
+        now = time.monotonic()
+        excluded = set(map(id, exclude))
+        candidates = []
+        probes = []
+        for endpoint in self.endpoints:
+            if id(endpoint) in excluded or endpoint.is_ejected(now):
+                continue
+            if endpoint.is_half_open(now):
+                if idempotent and not endpoint.probing:
+                    probes.append(endpoint)
+                continue
+            candidates.append(endpoint)
+
+        if probes:
+            # 探測優先：同一時間每個半開端點只送出一個請求
+            endpoint = probes[0]
+            endpoint.probing = True
+            return endpoint
+        if candidates:
+            return self._best(candidates)
+
+        remaining = [e for e in self.endpoints if id(e) not in excluded] or self.endpoints
+        return min(remaining, key=lambda e: e.ejected_until)
+
+    def record_success(self, endpoint: Endpoint, latency: float) -> None:
+        """
+        記錄收到回應
+
+        Args:
+            endpoint: 端點
+            latency: 請求耗時（秒）
+        """
+        endpoint.requests += 1
+        endpoint.consecutive_failures = 0
+        endpoint.ejections = 0
+        endpoint.probing = False
+        if endpoint.ewma_latency is None:
+            endpoint.ewma_latency = latency
+        else:
+            endpoint.ewma_latency += self.decay * (latency - endpoint.ewma_latency)
+
+    def record_failure(self, endpoint: Endpoint) -> None:
+        """
+        記錄連線失敗、逾時或 5xx 回應
+
+        Args:
+            endpoint: 端點
+        """
+        endpoint.requests += 1
+        endpoint.failures += 1
+        endpoint.consecutive_failures += 1
+        was_probing = endpoint.probing
+        endpoint.probing = False
+        if was_probing or endpoint.consecutive_failures >= self.failure_threshold:
+            duration = min(self.ejection_time * 2 ** endpoint.ejections, self.max_ejection_time)
+            endpoint.ejections += 1
+            endpoint.ejected_until = time.monotonic() + duration
+
+    def release(self, endpoint: Endpoint) -> None:
+        """請求結束但沒有可判斷健康狀態的結果時，釋放探測名額"""
+        endpoint.probing = False
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """各端點的狀態"""
+        return [endpoint.to_dict() for endpoint in self.endpoints]
+
+    def _best(self, candidates: List[Endpoint]) -> Endpoint:
+        # 從輪流的起點開始比較，分數相同時不會總是選中第一個端點
+        offset = next(self._rotation) % len(candidates)
+        ordered = candidates[offset:] + candidates[:offset]
+        if self.strategy == "least_outstanding":
+            return min(ordered, key=lambda e: e.outstanding)
+        # 尚無樣本的端點分數為 0，會優先取得第一個請求
+        return min(ordered, key=lambda e: (e.ewma_latency or 0.0) * (e.outstanding + 1))
@@ -0,0 +1,404 @@
+"""EScheduler SDK 可續傳的批量操作
+
+BulkRunner 以有上限的並發數執行批量建立、刪除與狀態變更，每個項目的結果
+立即寫入 BulkJournal（SQLite WAL 模式的本地檔案）。程序中斷後以相同的
+日誌與操作名稱重新執行，已成功的項目會直接略過，只重試失敗與未完成的項目。
+
+日誌以 synchronous=NORMAL 寫入：每筆結果各自提交，程序崩潰不會遺失已提交
+的結果；寫入成本約為數十微秒，不會成為每秒數千筆操作的瓶頸。中斷當下仍在
+進行中的項目沒有結果記錄，續傳時會再執行一次。
+"""
+
+import asyncio
+import functools
+import sqlite3
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union
+)
+
+from .enums import RequestPriority, TaskState
+from .exceptions import AuthenticationError, ESchedulerError, NotFoundError
+from .deadline import current_deadline, request_deadline
+from .limiter import request_priority
+from .models import ScheduledTaskCreate, TaskStateUpdateRequest
+
+if TYPE_CHECKING:
+    import os
+
+    from .scheduler import SchedulerAPI
+    from .templates import TaskTemplate
+
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# (項目鍵, 執行操作的函數)
+BulkItem = Tuple[str, Callable[[], Awaitable[Any]]]
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    operation TEXT NOT NULL,
+    key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (operation, key)
+) WITHOUT ROWID
+"""
+
+
+class BulkJournal:
+    """批量操作的本地結果日誌
+
+    每個 (operation, key) 只保留最後一次結果，因此重試成功會覆蓋先前的失敗記錄。
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        開啟或建立日誌
+
+        Args:
+            path: SQLite 檔案路徑，":memory:" 表示不持久化
+        """
+        self.path = path
+        self._connection = sqlite3.connect(str(path), isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    def __enter__(self) -> "BulkJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """關閉日誌"""
+        self._connection.close()
+
+    def record(
+        self,
+        operation: str,
+        key: str,
+        succeeded: bool,
+        result: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        記錄一個項目的結果
+
+        Args:
+            operation: 操作名稱
+            key: 項目鍵
+            succeeded: 是否成功
+            result: 成功時的結果（如建立的任務 ID）
+            error: 失敗時的錯誤訊息
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO outcomes VALUES (?, ?, ?, ?, ?, ?)",
+            (operation, key, SUCCEEDED if succeeded else FAILED, result, error, time.time())
+        )
+
+    def completed(self, operation: str) -> Set[str]:
+        """
+        已成功的項目鍵
+
+        Args:
+            operation: 操作名稱
+
+        Returns:
+            項目鍵集合
+        """
+        rows = self._connection.execute(
+            "SELECT key FROM outcomes WHERE operation = ? AND status = ?",
+            (operation, SUCCEEDED)
+        )
+        return {key for key, in rows}
+
+    def results(self, operation: str) -> Dict[str, Optional[str]]:
+        """
+        已成功項目的結果
+
+        Args:
+            operation: 操作名稱
+
+        Returns:
+            項目鍵 -> 結果
+        """
+        rows = self._connection.execute(
+            "SELECT key, result FROM outcomes WHERE operation = ? AND status = ?",
+            (operation, SUCCEEDED)
+        )
+        return dict(rows)
+
+    def failures(self, operation: str) -> Dict[str, Optional[str]]:
+        """
+        最後一次執行失敗的項目
+
+        Args:
+            operation: 操作名稱
+
+        Returns:
+            項目鍵 -> 錯誤訊息
+        """
+        rows = self._connection.execute(
+            "SELECT key, error FROM outcomes WHERE operation = ? AND status = ?",
+            (operation, FAILED)
+        )
+        return dict(rows)
+
+    def summary(self, operation: str) -> Dict[str, int]:
+        """
+        各狀態的項目數
+
+        Args:
+            operation: 操作名稱
+
+        Returns:
+            如 {"succeeded": 980, "failed": 20}
+        """
+        rows = self._connection.execute(
+            "SELECT status, COUNT(*) FROM outcomes WHERE operation = ? GROUP BY status",
+            (operation,)
+        )
+        counts = {SUCCEEDED: 0, FAILED: 0}
+        counts.update(rows)
+        return counts
+
+
+class BulkResult:
+    """單次批量執行的結果"""
+
+    def __init__(self) -> None:
+        self.succeeded = 0
+        self.skipped = 0
+        # 是否因超過 total_timeout 而停止，未開始的項目沒有結果記錄
+        self.deadline_exceeded = False
+        # 項目鍵 -> 錯誤訊息
+        self.errors: Dict[str, str] = {}
+
+    @property
+    def failed(self) -> int:
+        """失敗的項目數"""
+        return len(self.errors)
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkResult(succeeded={self.succeeded}, skipped={self.skipped}, failed={self.failed}, "
+            f"deadline_exceeded={self.deadline_exceeded})"
+        )
+
+
+class BulkRunner:
+    """可續傳的批量操作執行器
+
+    範例:
+        with BulkJournal("cleanup.journal") as journal:
+            runner = BulkRunner(sdk.scheduler, journal, concurrency=20)
+            result = await runner.delete_tasks(task_ids, operation="cleanup-2024-01")
+    """
+
+    def __init__(
+        self,
+        scheduler: "SchedulerAPI",
+        journal: BulkJournal,
+        concurrency: int = 10,
+        priority: Union[RequestPriority, str] = RequestPriority.BULK,
+        item_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None
+    ):
+        """
+        初始化批量操作執行器
+
+        Args:
+            scheduler: 排程任務 API 實例
+            journal: 結果日誌
+            concurrency: 同時進行中的請求上限
+            priority: 批量請求的優先級，預設為 bulk，不會擠佔互動請求的並發名額
+            item_timeout: 每個項目包含重試的總逾時（秒）
+            total_timeout: 整次執行的總逾時（秒），到期後不再開始新的項目
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency 必須大於 0")
+
+        self.scheduler = scheduler
+        self.journal = journal
+        self.concurrency = concurrency
+        self.priority = RequestPriority(priority)
+        self.item_timeout = item_timeout
+        self.total_timeout = total_timeout
+
+    async def run(self, operation: str, items: Iterable[BulkItem]) -> BulkResult:
+        """
+        執行一組批量操作
+
+        日誌中已成功的項目會被略過。ESchedulerError 會記錄為該項目失敗並繼續，
+        AuthenticationError 與其他例外會中止執行。區塊外以 request_deadline() 設定的
+        期限與 total_timeout 一樣，到期後不再開始新的項目。
+
+        Args:
+            operation: 操作名稱，續傳時必須相同
+            items: (項目鍵, 執行操作的函數) 的可迭代物件，函數的返回值會以字串記錄
+
+        Returns:
+            本次執行的結果
+
+        Raises:
+            AuthenticationError: 當認證失敗時
+        """
+        completed = self.journal.completed(operation)
+        result = BulkResult()
+        iterator = iter(items)
+
+        async def worker() -> None:
+            deadline = current_deadline()
+            for key, call in iterator:
+                if key in completed:
+                    result.skipped += 1
+                    continue
+                if deadline is not None and time.monotonic() >= deadline:
+                    # 已到期：這個與之後的項目都不記錄結果，續傳時再執行
+                    result.deadline_exceeded = True
+                    return
+                try:
+                    with request_deadline(self.item_timeout):
+                        value = await call()
+                except AuthenticationError:
+                    raise
+                except ESchedulerError as e:
+                    self.journal.record(operation, key, False, error=str(e))
+                    result.errors[key] = str(e)
+                    continue
+                self.journal.record(
+                    operation, key, True, result=str(value) if value is not None else None
+                )
+                result.succeeded += 1
+
+        # 工作任務建立時複製目前的 context，區塊外的請求不受影響
+        with request_priority(self.priority), request_deadline(self.total_timeout):
+            workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for future in workers:
+                future.cancel()
+        return result
+
+    async def create_tasks(
+        self,
+        tasks: Iterable[ScheduledTaskCreate],
+        operation: str = "create"
+    ) -> BulkResult:
+        """
+        批量建立任務
+
+        項目鍵為任務在 tasks 中的位置，續傳時必須以相同順序傳入；
+        建立的任務 ID 可透過 journal.results(operation) 取得。
+
+        Args:
+            tasks: 任務創建數據
+            operation: 操作名稱
+
+        Returns:
+            本次執行的結果
+        """
+        async def create(task_data: ScheduledTaskCreate) -> int:
+            return (await self.scheduler.create_task(task_data)).id
+
+        return await self.run(operation, (
+            (str(position), functools.partial(create, task_data))
+            for position, task_data in enumerate(tasks)
+        ))
+
+    async def create_from_template(
+        self,
+        template: "TaskTemplate",
+        items: Iterable[Mapping[str, Any]],
+        operation: str = "create"
+    ) -> BulkResult:
+        """
+        以任務範本批量建立任務
+
+        共用部分只序列化一次，每個項目只驗證與編碼變數的值。項目鍵為項目在
+        items 中的位置，續傳時必須以相同順序傳入。
+
+        Args:
+            template: 任務範本
+            items: 每個任務的變數值
+            operation: 操作名稱
+
+        Returns:
+            本次執行的結果
+        """
+        async def create(values: Mapping[str, Any]) -> int:
+            return (await self.scheduler.create_task_from_template(template, **values)).id
+
+        return await self.run(operation, (
+            (str(position), functools.partial(create, values))
+            for position, values in enumerate(items)
+        ))
+
+    async def delete_tasks(self, task_ids: Iterable[int], operation: str = "delete") -> BulkResult:
+        """
+        批量刪除任務
+
+        任務已不存在時視為成功，因此中斷當下已送出的刪除不會在續傳時失敗。
+
+        Args:
+            task_ids: 任務 ID
+            operation: 操作名稱
+
+        Returns:
+            本次執行的結果
+        """
+        async def delete(task_id: int) -> None:
+            try:
+                await self.scheduler.delete_task(task_id)
+            except NotFoundError:
+                pass
+
+        return await self.run(operation, (
+            (str(task_id), functools.partial(delete, task_id))
+            for task_id in task_ids
+        ))
+
+    async def set_task_state(
+        self,
+        task_ids: Iterable[int],
+        state: TaskState,
+        operation: Optional[str] = None
+    ) -> BulkResult:
+        """
+        批量變更任務狀態
+
+        Args:
+            task_ids: 任務 ID
+            state: 目標狀態
+            operation: 操作名稱，預設為 "state:<狀態>"
+
+        Returns:
+            本次執行的結果
+        """
+        state_data = TaskStateUpdateRequest(state=state)
+
+        async def update(task_id: int) -> None:
+            await self.scheduler.update_task_state(task_id, state_data)
+
+        return await self.run(operation or f"state:{state.value}", (
+            (str(task_id), functools.partial(update, task_id))
+            for task_id in task_ids
+        ))
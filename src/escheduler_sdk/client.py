@@ -1,21 +1,29 @@
 """EScheduler SDK 客戶端類"""
 
 import asyncio
-from typing import Optional, Dict, Any, Union
+import time
+from typing import Optional, Dict, Any, Sequence, Union
 from urllib.parse import urljoin
 
 import httpx
 from pydantic import BaseModel
 
-from .exceptions import (
-    ESchedulerError,
-    AuthenticationError,
-    ValidationError,
-    NotFoundError,
-    ServerError,
-    RateLimitError,
-    TimeoutError,
-    NetworkError
+from .balancer import EndpointPool
+from .compression import DEFAULT_COMPRESSION_THRESHOLD, accept_encoding, compression_middleware
+from .credentials import current_jwt_token
+from .deadline import resolve_deadline
+from .decoding import LARGE_RESPONSE_BYTES
+from .limiter import AdaptiveLimiter, PriorityLike
+from .middleware import (
+    Handler,
+    Middleware,
+    Request,
+    balancer_middleware,
+    build_handler,
+    error_mapping_middleware,
+    limiter_middleware,
+    raise_for_response,
+    retry_middleware
 )
 
 
@@ -24,34 +32,67 @@ class ESchedulerClient:
     
     def __init__(
         self,
-        base_url: str,
+        base_url: Union[str, Sequence[str]],
         token: Optional[str] = None,
         jwt_token: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        load_balancing: str = "ewma",
+        limiter: Union[str, AdaptiveLimiter, None] = None,
+        middlewares: Sequence[Middleware] = (),
+        large_response_bytes: Optional[int] = LARGE_RESPONSE_BYTES,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
         **kwargs
     ):
         """
         初始化 EScheduler 客戶端
         
         Args:
-            base_url: EScheduler API 基礎 URL
+            base_url: EScheduler API 基礎 URL，或多個副本的 URL 列表
             token: 團隊認證 token (4位字符)
             jwt_token: JWT 認證 token
             timeout: 請求超時時間（秒）
             max_retries: 最大重試次數
+            load_balancing: 多個 URL 時的端點選擇策略，"ewma" 或 "least_outstanding"
+            limiter: 自適應並發限制，"aimd"、"gradient" 或 AdaptiveLimiter 實例；預設 None 不限制，
+                超過上限的請求會排隊等待
+            middlewares: 自訂中介層，第一個位於最外層，見 escheduler_sdk.middleware
+            large_response_bytes: 超過此大小的回應分段解碼，不長時間阻塞事件迴圈；None 表示停用
+            compression: 請求內容壓縮格式，"auto"、"zstd"、"br" 或 "gzip"；None 表示停用（需要伺服器支援）
+            compression_threshold: 小於此大小（位元組）的請求內容不壓縮
             **kwargs: 其他 httpx.AsyncClient 參數
         """
-        self.base_url = base_url.rstrip('/')
+        if isinstance(base_url, str):
+            base_urls = [base_url]
+        else:
+            base_urls = list(base_url)
+        # 單一 URL 時不建立端點池，請求路徑與過去完全相同
+        self.endpoint_pool: Optional[EndpointPool] = (
+            EndpointPool(base_urls, strategy=load_balancing) if len(base_urls) > 1 else None
+        )
+        self.base_url = base_urls[0].rstrip('/')
+        self._limiter: Optional[AdaptiveLimiter] = (
+            AdaptiveLimiter(limiter) if isinstance(limiter, str) else limiter
+        )
         self.token = token
         self.jwt_token = jwt_token
         self.timeout = timeout
-        self.max_retries = max_retries
+        self._max_retries = max_retries
+        self._middlewares = list(middlewares)
+        self.large_response_bytes = large_response_bytes
+        self._compression = (
+            compression_middleware(compression, compression_threshold) if compression else None
+        )
+        self._handler = self._build_handler()
+        self._last_activity = 0.0
+        self._keepalive_task: Optional[asyncio.Task] = None
         
         # 設置預設 headers
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": accept_encoding(),
             "User-Agent": "EScheduler-Python-SDK/0.1.0"
         }
         
@@ -67,6 +108,75 @@ class ESchedulerClient:
             **kwargs
         )
     
+    @property
+    def max_retries(self) -> int:
+        """最大重試次數"""
+        return self._max_retries
+    
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        self._max_retries = value
+        self._handler = self._build_handler()
+    
+    @property
+    def limiter(self) -> Optional[AdaptiveLimiter]:
+        """自適應並發限制器，None 表示停用"""
+        return self._limiter
+    
+    @limiter.setter
+    def limiter(self, value: Optional[AdaptiveLimiter]) -> None:
+        self._limiter = value
+        self._handler = self._build_handler()
+    
+    @property
+    def middlewares(self) -> Sequence[Middleware]:
+        """自訂中介層"""
+        return tuple(self._middlewares)
+    
+    def add_middleware(self, middleware: Middleware) -> None:
+        """
+        在最內層的自訂中介層之後加入中介層
+        
+        Args:
+            middleware: 中介層函數
+        """
+        self._middlewares.append(middleware)
+        self._handler = self._build_handler()
+    
+    def _build_handler(self) -> Handler:
+        """串接中介層；停用的功能不會出現在呼叫路徑上"""
+        chain = [*self._middlewares]
+        if self._compression is not None:
+            chain.append(self._compression)
+        chain += [
+            retry_middleware(self._max_retries, self.timeout),
+            error_mapping_middleware(self.large_response_bytes),
+        ]
+        if self._limiter is not None:
+            chain.append(limiter_middleware(self._limiter))
+        if self.endpoint_pool is not None:
+            chain.append(balancer_middleware(self.endpoint_pool, self._build_url))
+        return build_handler(self._send, chain)
+    
+    async def _send(self, request: Request) -> httpx.Response:
+        """最內層：以 httpx 送出請求"""
+        self._last_activity = time.monotonic()
+        kwargs = request.kwargs
+        jwt_token = current_jwt_token()
+        if jwt_token is not None:
+            # request_credentials() 的 token 只套用在這次請求，不修改共用的客戶端標頭
+            kwargs = {
+                **kwargs,
+                "headers": {**(kwargs.get("headers") or {}), "Authorization": f"Bearer {jwt_token}"}
+            }
+        return await self._client.request(
+            method=request.method,
+            url=request.url,
+            json=request.json,
+            params=request.params,
+            **kwargs
+        )
+    
     async def __aenter__(self):
         """異步上下文管理器入口"""
         return self
@@ -77,34 +187,73 @@ class ESchedulerClient:
     
     async def close(self):
         """關閉客戶端連接"""
+        await self.stop_keepalive()
         await self._client.aclose()
     
-    def _build_url(self, endpoint: str) -> str:
+    async def warmup(self, connections: int = 10) -> int:
+        """
+        預先建立連線池中的連線
+        
+        對每個端點同時送出 connections 個 HEAD 請求，不經過重試與並發限制。
+        任何 HTTP 回應（包含 404）都代表連線已建立並回到連線池；超過 httpx
+        max_keepalive_connections（預設 20）的連線在回應後會被關閉。
+        
+        Args:
+            connections: 每個端點要建立的連線數
+            
+        Returns:
+            成功建立的連線數
+        """
+        urls = (
+            [endpoint.url for endpoint in self.endpoint_pool.endpoints]
+            if self.endpoint_pool is not None else [self.base_url]
+        )
+        results = await asyncio.gather(
+            *(self._client.head(url) for url in urls for _ in range(connections)),
+            return_exceptions=True
+        )
+        return sum(not isinstance(result, BaseException) for result in results)
+    
+    def start_keepalive(self, min_connections: int = 4, interval: float = 4.0) -> None:
+        """
+        在背景維持最少的暖連線
+        
+        每 interval 秒檢查一次；期間沒有任何請求時以 warmup(min_connections)
+        重新使用或補足連線，避免閒置連線被 httpx（keepalive_expiry 預設 5 秒）
+        或中間的代理與負載平衡器關閉。interval 應小於這些閒置逾時。
+        
+        Args:
+            min_connections: 每個端點維持的連線數
+            interval: 檢查間隔（秒）
+        """
+        if self._keepalive_task is not None and not self._keepalive_task.done():
+            raise RuntimeError("keep-alive 已在執行中")
+        
+        async def keepalive() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                if time.monotonic() - self._last_activity >= interval:
+                    await self.warmup(min_connections)
+        
+        self._keepalive_task = asyncio.ensure_future(keepalive())
+    
+    async def stop_keepalive(self) -> None:
+        """停止背景 keep-alive"""
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    def _build_url(self, endpoint: str, base_url: Optional[str] = None) -> str:
         """構建完整的 API URL"""
-        return urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        return urljoin((base_url or self.base_url) + "/", endpoint.lstrip("/"))
     
     def _handle_response_error(self, response: httpx.Response) -> None:
         """處理 HTTP 回應錯誤"""
-        status_code = response.status_code
-        
-        try:
-            error_data = response.json()
-            message = error_data.get("detail", error_data.get("message", "未知錯誤"))
-        except Exception:
-            message = response.text or f"HTTP {status_code} 錯誤"
-        
-        if status_code == 400:
-            raise ValidationError(message, status_code=status_code, response_data=error_data)
-        elif status_code == 401:
-            raise AuthenticationError(message, status_code=status_code, response_data=error_data)
-        elif status_code == 404:
-            raise NotFoundError(message, status_code=status_code, response_data=error_data)
-        elif status_code == 429:
-            raise RateLimitError(message, status_code=status_code, response_data=error_data)
-        elif 500 <= status_code < 600:
-            raise ServerError(message, status_code=status_code, response_data=error_data)
-        else:
-            raise ESchedulerError(message, status_code=status_code, response_data=error_data)
+        raise_for_response(response)
     
     async def _request(
         self,
@@ -112,70 +261,44 @@ class ESchedulerClient:
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        priority: Optional[PriorityLike] = None,
+        total_timeout: Optional[float] = None,
         **kwargs
-    ) -> Dict[str, Any]:
-        """發送 HTTP 請求"""
-        url = self._build_url(endpoint)
+    ) -> Any:
+        """發送 HTTP 請求，返回解碼後的 JSON（物件或列表）
         
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    json=json_data,
-                    params=params,
-                    **kwargs
-                )
-                
-                # 檢查回應狀態
-                if response.is_success:
-                    try:
-                        return response.json()
-                    except Exception:
-                        # 如果回應不是 JSON，返回空字典
-                        return {}
-                else:
-                    self._handle_response_error(response)
-                    
-            except httpx.TimeoutException:
-                if attempt == self.max_retries:
-                    raise TimeoutError(f"請求超時: {url}")
-                await asyncio.sleep(2 ** attempt)  # 指數退避
-                
-            except httpx.NetworkError as e:
-                if attempt == self.max_retries:
-                    raise NetworkError(f"網路錯誤: {str(e)}")
-                await asyncio.sleep(2 ** attempt)
-                
-            except (AuthenticationError, ValidationError, NotFoundError, RateLimitError, ServerError):
-                # 這些錯誤不需要重試
-                raise
-                
-            except Exception as e:
-                if attempt == self.max_retries:
-                    raise ESchedulerError(f"未知錯誤: {str(e)}")
-                await asyncio.sleep(2 ** attempt)
-        
-        # 這行理論上不會執行到
-        raise ESchedulerError("請求失敗")
+        priority 為並發限制器的排隊優先級，None 時使用 request_priority() 設定的值。
+        total_timeout 為包含所有重試與退避等待的總逾時（秒），與 request_deadline()
+        設定的期限取較早者。
+        """
+        return await self._handler(Request(
+            method,
+            endpoint,
+            self._build_url(endpoint),
+            json_data,
+            params,
+            priority,
+            kwargs,
+            resolve_deadline(total_timeout)
+        ))
     
-    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
         """發送 GET 請求"""
         return await self._request("GET", endpoint, params=params, **kwargs)
     
-    async def post(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    async def post(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
         """發送 POST 請求"""
         return await self._request("POST", endpoint, json_data=json_data, **kwargs)
     
-    async def put(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    async def put(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
         """發送 PUT 請求"""
         return await self._request("PUT", endpoint, json_data=json_data, **kwargs)
     
-    async def patch(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    async def patch(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
         """發送 PATCH 請求"""
         return await self._request("PATCH", endpoint, json_data=json_data, **kwargs)
     
-    async def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+    async def delete(self, endpoint: str, **kwargs) -> Any:
         """發送 DELETE 請求"""
         return await self._request("DELETE", endpoint, **kwargs)
     
@@ -0,0 +1,160 @@
+"""EScheduler SDK 任務觸發微批次合併器"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from .models import MessageResponse
+from .scheduler import SchedulerAPI
+
+
+class TriggerCoalescer:
+    """trigger_task 微批次合併器
+
+    在一個短暫的時間窗口內緩衝觸發請求，合併重複的任務 ID，
+    再以有上限的並發數派送。同一窗口內對同一任務的多次觸發只會
+    發出一次請求，所有呼叫者共享該次請求的結果。
+
+    範例:
+        coalescer = TriggerCoalescer(sdk.scheduler, window=0.01, max_concurrency=20)
+        result = await coalescer.trigger(task_id)
+        ...
+        await coalescer.close()
+    """
+
+    def __init__(
+        self,
+        scheduler: SchedulerAPI,
+        window: float = 0.01,
+        max_concurrency: int = 10,
+        max_batch_size: Optional[int] = None
+    ):
+        """
+        初始化觸發合併器
+
+        Args:
+            scheduler: 排程任務 API 實例
+            window: 緩衝窗口（秒），窗口結束時派送已累積的觸發
+            max_concurrency: 同時進行中的觸發請求上限
+            max_batch_size: 單一窗口累積的不同任務數上限，達到時立即派送
+        """
+        if window < 0:
+            raise ValueError("window 不可為負數")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency 必須大於 0")
+
+        self.scheduler = scheduler
+        self.window = window
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: List[asyncio.Task] = []
+        self._closed = False
+
+        # 統計信息
+        self.requested = 0
+        self.dispatched = 0
+
+    async def __aenter__(self) -> "TriggerCoalescer":
+        """異步上下文管理器入口"""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """異步上下文管理器出口"""
+        await self.close()
+
+    @property
+    def pending_count(self) -> int:
+        """尚未派送的不同任務數"""
+        return len(self._pending)
+
+    async def trigger(self, task_id: int) -> MessageResponse:
+        """
+        排入一次任務觸發並等待結果
+
+        Args:
+            task_id: 任務 ID
+
+        Returns:
+            觸發結果消息（同一窗口內的重複觸發共享同一結果）
+
+        Raises:
+            ESchedulerError: 觸發請求失敗時
+            RuntimeError: 合併器已關閉時
+        """
+        if self._closed:
+            raise RuntimeError("TriggerCoalescer 已關閉")
+
+        self.requested += 1
+        future = self._pending.get(task_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[task_id] = future
+
+            if self.max_batch_size and len(self._pending) >= self.max_batch_size:
+                self._schedule_flush(0)
+            elif self._flush_handle is None:
+                self._schedule_flush(self.window)
+
+        # shield 確保單一呼叫者取消時不影響共享同一請求的其他呼叫者
+        return await asyncio.shield(future)
+
+    async def flush(self) -> None:
+        """立即派送所有已緩衝的觸發並等待完成"""
+        self._dispatch_pending()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def close(self) -> None:
+        """停止接受新的觸發，派送剩餘觸發並等待完成"""
+        self._closed = True
+        await self.flush()
+
+    def _schedule_flush(self, delay: float) -> None:
+        """安排在 delay 秒後派送緩衝中的觸發"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._flush_handle = loop.call_later(delay, self._dispatch_pending)
+
+    def _dispatch_pending(self) -> None:
+        """取出目前緩衝的觸發並建立派送任務"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        semaphore = self._semaphore
+
+        for task_id, future in batch.items():
+            task = asyncio.ensure_future(self._dispatch(task_id, future, semaphore))
+            self._inflight.append(task)
+            task.add_done_callback(self._inflight.remove)
+
+    async def _dispatch(
+        self, task_id: int, future: asyncio.Future, semaphore: asyncio.Semaphore
+    ) -> None:
+        """在並發上限內發送單一觸發請求，並將結果交給所有等待者"""
+        async with semaphore:
+            self.dispatched += 1
+            try:
+                result = await self.scheduler.trigger_task(task_id)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                    # 避免沒有等待者時出現 "exception was never retrieved" 警告
+                    future.exception()
+            else:
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,176 @@
+"""EScheduler SDK 請求與回應壓縮
+
+回應壓縮由 Accept-Encoding 協商：依偏好順序列出 httpx 能解碼的格式
+（zstd、br 需要安裝 zstandard 與 brotli：pip install "escheduler-sdk[compression]"），
+伺服器選擇其中之一後由 httpx 自動解壓。
+
+請求壓縮需要伺服器支援 Content-Encoding，因此預設停用；啟用後超過門檻的 JSON
+請求內容在送出前壓縮一次，重試時沿用同一份壓縮結果。
+"""
+
+import gzip
+import itertools
+import json
+from typing import Any, Tuple
+
+import httpx
+
+from .middleware import Handler, Middleware, Request
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 取決於安裝環境
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 取決於安裝環境
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+# 請求壓縮的偏好順序
+COMPRESSION_ENCODINGS = ("zstd", "br", "gzip")
+
+# 小於此大小（位元組）的請求內容不壓縮
+DEFAULT_COMPRESSION_THRESHOLD = 8 * 1024
+
+# 以速度為主的壓縮等級：批量請求的內容重複度高，高等級只多省下少量位元組
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+_BROTLI_QUALITY = 5
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """目前環境可用於請求壓縮的格式，依偏好順序"""
+    modules = {"zstd": zstandard, "br": brotli, "gzip": gzip}
+    return tuple(encoding for encoding in COMPRESSION_ENCODINGS if modules[encoding] is not None)
+
+
+def _httpx_version() -> Tuple[int, ...]:
+    """已安裝 httpx 的版本號，例如 (0, 27, 1)"""
+    parts = []
+    for part in httpx.__version__.split(".")[:3]:
+        digits = "".join(itertools.takewhile(str.isdigit, part))
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+def accept_encoding() -> str:
+    """
+    依偏好順序列出 httpx 能解碼的回應壓縮格式
+
+    httpx 在 zstandard、brotli（或 brotlicffi）可匯入時才能解碼 zstd 與 br，
+    zstd 解碼從 httpx 0.27.1 開始支援。
+
+    Returns:
+        Accept-Encoding 標頭值，例如 "zstd, br;q=0.9, gzip;q=0.8, deflate;q=0.7"
+    """
+    encodings = []
+    if zstandard is not None and _httpx_version() >= (0, 27, 1):
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings += ["gzip", "deflate"]
+    return ", ".join(
+        encoding if i == 0 else f"{encoding};q={1 - i / 10:.1f}"
+        for i, encoding in enumerate(encodings)
+    )
+
+
+def resolve_encoding(encoding: str) -> str:
+    """
+    解析請求壓縮格式
+
+    Args:
+        encoding: "auto"（最偏好的可用格式）、"zstd"、"br" 或 "gzip"
+
+    Returns:
+        Content-Encoding 值
+
+    Raises:
+        ValueError: 格式不支援或需要的套件未安裝時
+    """
+    available = available_encodings()
+    if encoding == "auto":
+        return available[0]
+    if encoding not in COMPRESSION_ENCODINGS:
+        raise ValueError(
+            f"不支援的壓縮格式: {encoding}，可用格式: auto, {', '.join(COMPRESSION_ENCODINGS)}"
+        )
+    if encoding not in available:
+        raise ValueError(
+            f'壓縮格式 {encoding} 需要額外套件，請執行 pip install "escheduler-sdk[compression]"'
+        )
+    return encoding
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """以指定格式壓縮"""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    if encoding == "br":
+        compressed: bytes = brotli.compress(data, quality=_BROTLI_QUALITY)
+        return compressed
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=_GZIP_LEVEL)
+    raise ValueError(f"不支援的壓縮格式: {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """解壓指定格式的內容"""
+    if encoding == "zstd":
+        # 串流壓縮的 frame 可能沒有記錄原始大小，decompress() 無法處理
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if encoding == "br":
+        decompressed: bytes = brotli.decompress(data)
+        return decompressed
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding in ("", "identity"):
+        return data
+    raise ValueError(f"不支援的壓縮格式: {encoding}")
+
+
+def encode_json(data: Any) -> bytes:
+    """與 httpx json= 參數相同格式的 JSON 編碼"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def compression_middleware(
+    encoding: str = "auto",
+    threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+) -> Middleware:
+    """
+    壓縮超過門檻的 JSON 請求內容
+
+    Args:
+        encoding: 壓縮格式，見 resolve_encoding
+        threshold: 小於此大小（位元組）的請求內容不壓縮
+    """
+    encoding = resolve_encoding(encoding)
+
+    def middleware(call_next: Handler) -> Handler:
+        async def handler(request: Request) -> Any:
+            kwargs = request.kwargs
+            if request.json is not None:
+                # 編碼後的內容直接送出，不需要 httpx 再編碼一次
+                body = encode_json(request.json)
+                request.json = None
+            elif isinstance(kwargs.get("content"), bytes) and "headers" not in kwargs:
+                # 已編碼的內容，例如 TaskTemplate.render() 的結果
+                body = kwargs["content"]
+            else:
+                return await call_next(request)
+
+            if len(body) >= threshold:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Encoding": encoding}
+                body = compress(body, encoding)
+            kwargs["content"] = body
+            return await call_next(request)
+
+        return handler
+
+    return middleware
+
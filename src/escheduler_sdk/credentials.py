@@ -0,0 +1,40 @@
+"""EScheduler SDK 請求憑證
+
+同一個客戶端（共用連線池、並發限制與端點選擇）代表多個團隊送出請求時，以
+request_credentials() 設定區塊內（包含其中建立的 asyncio 任務）使用的 JWT token，
+取代客戶端的 Authorization 標頭。與 set_jwt_token() 不同，設定只影響目前的
+context，不同團隊的並發請求不會互相覆蓋。
+"""
+
+import contextlib
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_jwt_token: ContextVar[Optional[str]] = ContextVar(
+    "escheduler_request_jwt_token", default=None
+)
+
+
+def current_jwt_token() -> Optional[str]:
+    """目前 context 的 JWT token，None 表示使用客戶端的設定"""
+    return _current_jwt_token.get()
+
+
+@contextlib.contextmanager
+def request_credentials(jwt_token: str) -> Iterator[str]:
+    """
+    區塊內的請求以指定的 JWT token 認證
+
+    範例:
+        auth = await sdk.team.auth_team("ABCD")
+        with request_credentials(auth.access_token):
+            stats = await sdk.scheduler.get_scheduler_stats()
+
+    Args:
+        jwt_token: JWT 認證 token
+    """
+    token = _current_jwt_token.set(jwt_token)
+    try:
+        yield jwt_token
+    finally:
+        _current_jwt_token.reset(token)
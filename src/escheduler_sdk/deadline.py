@@ -0,0 +1,69 @@
+"""EScheduler SDK 端對端請求期限
+
+期限是單次 API 呼叫（包含所有重試、退避等待與並發限制的排隊時間）必須完成
+的時間點，以 time.monotonic() 表示。設定方式：
+
+- request_deadline(seconds)：區塊內（包含其中建立的 asyncio 任務）的所有請求
+- 客戶端方法的 total_timeout 參數：單次呼叫
+
+兩者同時存在或巢狀設定時取最早的期限。每次嘗試的 httpx 逾時會縮短為剩餘時間，
+退避等待後已經來不及的重試直接放棄，拋出 DeadlineExceededError。
+"""
+
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "escheduler_request_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[float]:
+    """目前 context 的請求期限（time.monotonic() 時間點），None 表示沒有期限"""
+    return _current_deadline.get()
+
+
+def resolve_deadline(total_timeout: Optional[float] = None) -> Optional[float]:
+    """
+    合併目前 context 的期限與單次呼叫的總逾時
+
+    Args:
+        total_timeout: 單次呼叫的總逾時（秒）
+
+    Returns:
+        最早的期限，None 表示沒有期限
+    """
+    deadline = _current_deadline.get()
+    if total_timeout is None:
+        return deadline
+    call_deadline = time.monotonic() + total_timeout
+    return call_deadline if deadline is None else min(deadline, call_deadline)
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """距離期限的剩餘秒數，None 表示沒有期限"""
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def request_deadline(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    區塊內的請求必須在 timeout 秒內完成
+
+    巢狀使用時內層不會延長外層的期限；timeout 為 None 時不改變目前的期限。
+
+    範例:
+        with request_deadline(5):
+            task = await sdk.scheduler.get_task(task_id)
+
+    Args:
+        timeout: 從現在起算的秒數
+    """
+    deadline = resolve_deadline(timeout)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
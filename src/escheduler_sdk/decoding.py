@@ -0,0 +1,147 @@
+"""EScheduler SDK 大型回應的協作式解碼
+
+json.loads 與 pydantic 驗證都在持有 GIL 的情況下執行，丟到執行緒池也會阻塞
+事件迴圈；行程池則需要在主行程重新反序列化結果。因此大型回應改為在事件迴圈上
+分段處理，每執行 time_slice 秒就讓出一次控制權：
+
+- decode_json：頂層 JSON 陣列依元素邊界切成約 CHUNK_CHARS 字元的區塊，
+  每塊以 json.loads 解析，速度與一次解析整份文件相近
+- build_list：逐批將字典轉換為模型或記錄
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, Callable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# 超過此大小（位元組）的回應以協作方式解碼
+LARGE_RESPONSE_BYTES = 1 << 20
+
+# 每次讓出控制權之間的最長執行時間（秒）
+DEFAULT_SLICE = 0.005
+
+# 每個 json.loads 區塊的大約字元數
+CHUNK_CHARS = 256 * 1024
+
+# build_list 每批轉換的項目數，少於此數時直接同步轉換
+BATCH_SIZE = 256
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# 物件陣列中相鄰元素的邊界；可能落在字串內，解析失敗時改為逐個元素解析
+_BOUNDARY = re.compile(r"\}[ \t\n\r]*,[ \t\n\r]*(?=\{)")
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+def _skip_whitespace(text: str, pos: int = 0) -> int:
+    """返回 pos 之後第一個非空白字元的位置"""
+    match = _WHITESPACE.match(text, pos)
+    if match is None:  # pragma: no cover - 空白的模式可以比對空字串
+        raise ValueError(f"無法比對空白: 位置 {pos}")
+    return match.end()
+
+
+def iter_array_chunks(text: str, chunk_chars: int = CHUNK_CHARS) -> Iterator[List[Any]]:
+    """
+    逐塊解析頂層 JSON 陣列
+
+    Args:
+        text: 以 "[" 開頭（可有前導空白）的 JSON 文字
+        chunk_chars: 每塊的大約字元數
+
+    Yields:
+        依序的元素列表
+
+    Raises:
+        ValueError: JSON 格式錯誤時
+    """
+    loads = json.loads
+    pos = _skip_whitespace(text, _skip_whitespace(text) + 1)
+    exact_until = 0
+    while True:
+        if pos >= exact_until:
+            cut = _BOUNDARY.search(text, pos + chunk_chars)
+            if cut is None:
+                # 剩餘部分包含結尾的 "]"
+                yield loads("[" + text[pos:])
+                return
+            try:
+                chunk = loads("[" + text[pos:cut.start() + 1] + "]")
+            except ValueError:
+                # 邊界落在字串內：逐個元素解析到這個邊界之後再恢復分塊
+                exact_until = cut.end()
+            else:
+                yield chunk
+                pos = cut.end()
+                continue
+
+        value, pos = _raw_decode(text, pos)
+        pos = _skip_whitespace(text, pos)
+        separator = text[pos:pos + 1]
+        if separator == "]":
+            if text[pos + 1:].strip():
+                raise ValueError(f"JSON 陣列之後有多餘的資料: 位置 {pos + 1}")
+            yield [value]
+            return
+        if separator != ",":
+            raise ValueError(f"JSON 陣列元素之間缺少逗號: 位置 {pos}")
+        pos = _skip_whitespace(text, pos + 1)
+        yield [value]
+
+
+async def decode_json(text: str, time_slice: float = DEFAULT_SLICE) -> Any:
+    """
+    解碼 JSON，頂層陣列分段解析並定期讓出事件迴圈
+
+    Args:
+        text: JSON 文字
+        time_slice: 每次讓出控制權之間的最長執行時間（秒）
+
+    Returns:
+        解碼結果，與 json.loads 相同
+
+    Raises:
+        ValueError: JSON 格式錯誤時
+    """
+    if not text.startswith("[", _skip_whitespace(text)):
+        return json.loads(text)
+
+    items: List[Any] = []
+    deadline = time.perf_counter() + time_slice
+    for chunk in iter_array_chunks(text):
+        items.extend(chunk)
+        if time.perf_counter() >= deadline:
+            await asyncio.sleep(0)
+            deadline = time.perf_counter() + time_slice
+    return items
+
+
+async def build_list(
+    convert: Callable[[Any], T],
+    items: Sequence[Any],
+    time_slice: float = DEFAULT_SLICE
+) -> List[T]:
+    """
+    將列表中的每個項目轉換為模型，大型列表分批轉換並定期讓出事件迴圈
+
+    Args:
+        convert: 轉換函數，例如 ScheduledTaskResponse.model_validate
+        items: 要轉換的項目
+        time_slice: 每次讓出控制權之間的最長執行時間（秒）
+
+    Returns:
+        轉換後的列表
+    """
+    if len(items) <= BATCH_SIZE:
+        return [convert(item) for item in items]
+
+    result: List[T] = []
+    deadline = time.perf_counter() + time_slice
+    for start in range(0, len(items), BATCH_SIZE):
+        result.extend([convert(item) for item in items[start:start + BATCH_SIZE]])
+        if time.perf_counter() >= deadline:
+            await asyncio.sleep(0)
+            deadline = time.perf_counter() + time_slice
+    return result
@@ -0,0 +1,53 @@
+"""EScheduler SDK 枚舉類型
+
+不依賴 pydantic 或 httpx，只需要枚舉的程式可以直接匯入而不載入整個 SDK。
+"""
+
+from enum import Enum
+
+
+class TaskState(str, Enum):
+    """任務狀態枚舉"""
+    ENABLED = "ENABLED"
+    DISABLED = "DISABLED"
+    PAUSED = "PAUSED"
+
+
+class TargetType(str, Enum):
+    """目標類型枚舉"""
+    HTTP = "http"
+    WEBHOOK = "webhook"
+    RABBITMQ = "rabbitmq"
+    EMAIL = "email"
+
+
+class ExecutionStatus(str, Enum):
+    """執行狀態枚舉"""
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    TIMEOUT = "TIMEOUT"
+    CANCELLED = "CANCELLED"
+
+
+class ScheduleType(str, Enum):
+    """排程類型枚舉"""
+    CRON = "cron"
+    RATE = "rate"
+    ONE_TIME = "one_time"
+    AT = "at"
+
+
+class TaskChangeType(str, Enum):
+    """任務變更類型枚舉"""
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+class RequestPriority(str, Enum):
+    """請求優先級枚舉"""
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
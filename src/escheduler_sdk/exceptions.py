@@ -64,4 +64,11 @@ class NetworkError(ESchedulerError):
     """網路錯誤異常"""
     
     def __init__(self, message: str = "網路連接錯誤", **kwargs):
-        super().__init__(message, **kwargs)
\ No newline at end of file
+        super().__init__(message, **kwargs)
+
+
+class DeadlineExceededError(TimeoutError):
+    """超過端對端請求期限異常"""
+    
+    def __init__(self, message: str = "超過請求期限", **kwargs: Any):
+        super().__init__(message, **kwargs)
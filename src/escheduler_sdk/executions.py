@@ -0,0 +1,255 @@
+"""EScheduler SDK 任務執行結果監看"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .deadline import _current_deadline
+from .exceptions import NetworkError, RateLimitError, ServerError, TimeoutError
+from .limiter import PriorityLike
+from .models import ExecutionStatus, TaskExecutionResponse
+
+if TYPE_CHECKING:
+    from .scheduler import SchedulerAPI
+
+
+FINAL_EXECUTION_STATUSES = frozenset({
+    ExecutionStatus.SUCCEEDED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.TIMEOUT,
+    ExecutionStatus.CANCELLED,
+})
+
+# 下一輪輪詢時重試、不讓等待者失敗的暫時性錯誤；其他錯誤（404、認證失敗等）
+# 會傳遞給等待者
+_TRANSIENT_ERRORS = (ServerError, RateLimitError, TimeoutError, NetworkError)
+
+
+class _Waiter:
+    """等待單一執行結果的登記項"""
+
+    __slots__ = ("task_id", "after_id", "execution_id", "future")
+
+    def __init__(self, task_id: int, after_id: int, future: asyncio.Future):
+        self.task_id = task_id
+        self.after_id = after_id
+        self.execution_id: Optional[int] = None
+        self.future = future
+
+
+class ExecutionWatcher:
+    """多工的任務執行結果輪詢器
+
+    所有等待者共用同一個輪詢迴圈：每一輪對每個不同的任務只發送一次
+    執行記錄查詢，再將結果分派給等待該任務的所有等待者。
+    有進展時輪詢間隔重設為最小值，沒有進展時逐步拉長到最大值。
+    """
+
+    def __init__(
+        self,
+        scheduler: "SchedulerAPI",
+        min_interval: float = 0.2,
+        max_interval: float = 5.0,
+        backoff: float = 1.5,
+        poll_limit: int = 20
+    ):
+        """
+        初始化執行結果輪詢器
+
+        Args:
+            scheduler: 排程任務 API 實例
+            min_interval: 最小輪詢間隔（秒）
+            max_interval: 最大輪詢間隔（秒）
+            backoff: 沒有進展時輪詢間隔的放大倍數
+            poll_limit: 每次查詢單一任務時取得的最近執行記錄數
+        """
+        self.scheduler = scheduler
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.poll_limit = poll_limit
+
+        self._waiters: Dict[int, List[_Waiter]] = {}
+        self._poller: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def pending_count(self) -> int:
+        """等待中的執行數"""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def latest_execution_id(
+        self,
+        task_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> int:
+        """
+        取得任務目前最新的執行記錄 ID
+
+        Args:
+            task_id: 任務 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+
+        Returns:
+            最新執行記錄 ID，沒有執行記錄時為 0
+        """
+        executions = await self.scheduler.get_task_executions(
+            task_id, limit=self.poll_limit, priority=priority
+        )
+        return max((execution.id for execution in executions), default=0)
+
+    async def wait(
+        self,
+        task_id: int,
+        after_id: int,
+        timeout: Optional[float] = None
+    ) -> TaskExecutionResponse:
+        """
+        等待任務在 after_id 之後的下一次執行到達最終狀態
+
+        Args:
+            task_id: 任務 ID
+            after_id: 只考慮 ID 大於此值的執行記錄
+            timeout: 最長等待時間（秒），None 表示不限制
+
+        Returns:
+            到達最終狀態的執行記錄
+
+        Raises:
+            TimeoutError: 超過等待時間時
+            ESchedulerError: 查詢執行記錄失敗時
+        """
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(task_id, after_id, loop.create_future())
+        self._waiters.setdefault(task_id, []).append(waiter)
+        self._ensure_poller()
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"等待任務 {task_id} 執行結果超時")
+        finally:
+            self._remove(waiter)
+
+    def _ensure_poller(self) -> None:
+        """啟動輪詢迴圈，或喚醒正在休眠的迴圈"""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.ensure_future(self._poll_loop(self._wakeup))
+        else:
+            self._wakeup.set()
+
+    def _remove(self, waiter: _Waiter) -> None:
+        """移除等待者"""
+        waiters = self._waiters.get(waiter.task_id)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[waiter.task_id]
+
+    async def _poll_loop(self, wakeup: asyncio.Event) -> None:
+        """輪詢所有等待中的任務，直到沒有等待者為止"""
+        # 輪詢迴圈由所有等待者共用，不繼承啟動它的呼叫的請求期限
+        _current_deadline.set(None)
+        interval = self.min_interval
+        while self._waiters:
+            wakeup.clear()
+            task_ids = list(self._waiters)
+            results = await asyncio.gather(
+                *(self.scheduler.get_task_executions(task_id, limit=self.poll_limit)
+                  for task_id in task_ids),
+                return_exceptions=True
+            )
+
+            progressed = False
+            hidden: List[_Waiter] = []
+            for task_id, result in zip(task_ids, results):
+                if self._dispatch(task_id, result, hidden):
+                    progressed = True
+            if hidden and await self._poll_hidden(hidden):
+                progressed = True
+
+            if not self._waiters:
+                break
+
+            interval = self.min_interval if progressed else min(interval * self.backoff, self.max_interval)
+            try:
+                await asyncio.wait_for(wakeup.wait(), interval)
+                interval = self.min_interval
+            except asyncio.TimeoutError:
+                pass
+
+    def _fail(self, waiter: _Waiter, error: BaseException) -> None:
+        """以錯誤結束等待者"""
+        if not waiter.future.done():
+            waiter.future.set_exception(error)
+        self._remove(waiter)
+
+    def _resolve(self, waiter: _Waiter, execution: TaskExecutionResponse) -> bool:
+        """執行到達最終狀態時結束等待者，返回是否已結束"""
+        if execution.status not in FINAL_EXECUTION_STATUSES:
+            return False
+        if not waiter.future.done():
+            waiter.future.set_result(execution)
+        self._remove(waiter)
+        return True
+
+    def _dispatch(self, task_id: int, result: Any, hidden: List[_Waiter]) -> bool:
+        """
+        將一個任務的查詢結果分派給等待者，返回是否有進展
+
+        已綁定但不在最近 poll_limit 筆執行記錄中的等待者加入 hidden，改以執行記錄 ID 查詢。
+        """
+        waiters = self._waiters.get(task_id)
+        if not waiters:
+            return False
+
+        if isinstance(result, _TRANSIENT_ERRORS):
+            return False
+        if isinstance(result, BaseException):
+            for waiter in list(waiters):
+                self._fail(waiter, result)
+            return True
+
+        executions = sorted(result, key=lambda execution: execution.id)
+        by_id = {execution.id: execution for execution in executions}
+        claimed = {waiter.execution_id for waiter in waiters if waiter.execution_id is not None}
+        progressed = False
+
+        for waiter in list(waiters):
+            if waiter.execution_id is None:
+                # 依登記順序綁定 after_id 之後尚未被其他等待者綁定的第一筆執行
+                for execution in executions:
+                    if execution.id > waiter.after_id and execution.id not in claimed:
+                        waiter.execution_id = execution.id
+                        claimed.add(execution.id)
+                        progressed = True
+                        break
+                else:
+                    continue
+
+            execution = by_id.get(waiter.execution_id)
+            if execution is None:
+                hidden.append(waiter)
+            elif self._resolve(waiter, execution):
+                progressed = True
+
+        return progressed
+
+    async def _poll_hidden(self, waiters: List[_Waiter]) -> bool:
+        """逐筆查詢已移出最近執行記錄範圍的執行，返回是否有進展"""
+        results = await asyncio.gather(
+            *(self.scheduler.get_task_execution(waiter.task_id, waiter.execution_id)
+              for waiter in waiters if waiter.execution_id is not None),
+            return_exceptions=True
+        )
+        progressed = False
+        for waiter, result in zip(waiters, results):
+            if isinstance(result, _TRANSIENT_ERRORS):
+                continue
+            if isinstance(result, BaseException):
+                self._fail(waiter, result)
+                progressed = True
+            elif self._resolve(waiter, result):
+                progressed = True
+        return progressed
@@ -0,0 +1,229 @@
+"""EScheduler SDK 跨團隊統計與任務清單彙總
+
+FleetAggregator 以同一個 SDK（共用連線池與並發限制）同時認證並查詢多個團隊：
+每個團隊以 auth_team 取得自己的 JWT token，只在該團隊的請求中以
+request_credentials() 使用，不修改客戶端的共用認證。單一團隊失敗時記錄錯誤並
+繼續，結果合併為一份統計與任務清單，並附上每個團隊的延遲。
+"""
+
+import asyncio
+import time
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
+
+from .credentials import request_credentials
+from .deadline import request_deadline
+from .enums import RequestPriority, TaskState
+from .exceptions import AuthenticationError, ESchedulerError
+from .limiter import request_priority
+from .models import ScheduledTaskResponse, SchedulerStatsResponse, Team
+
+if TYPE_CHECKING:
+    from .sdk import ESchedulerSDK
+
+
+class TeamSnapshot:
+    """單一團隊的查詢結果"""
+
+    def __init__(self, team: Team) -> None:
+        self.team = team
+        self.stats: Optional[SchedulerStatsResponse] = None
+        self.tasks: Optional[List[ScheduledTaskResponse]] = None
+        # 失敗時的錯誤，成功時為 None
+        self.error: Optional[ESchedulerError] = None
+        # 認證與查詢的總耗時（秒）
+        self.latency = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """是否查詢成功"""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"TeamSnapshot(team={self.team.name!r}, {status}, latency={self.latency:.3f})"
+
+
+class FleetReport:
+    """所有團隊的彙總結果"""
+
+    def __init__(self, snapshots: List[TeamSnapshot], elapsed: float) -> None:
+        # 依團隊列表順序排列
+        self.snapshots = snapshots
+        # 整次彙總的耗時（秒）
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self) -> List[TeamSnapshot]:
+        """查詢成功的團隊"""
+        return [snapshot for snapshot in self.snapshots if snapshot.ok]
+
+    @property
+    def failed(self) -> List[TeamSnapshot]:
+        """查詢失敗的團隊"""
+        return [snapshot for snapshot in self.snapshots if not snapshot.ok]
+
+    @property
+    def errors(self) -> Dict[int, str]:
+        """團隊 ID -> 錯誤訊息"""
+        return {snapshot.team.id: str(snapshot.error) for snapshot in self.failed}
+
+    @property
+    def latencies(self) -> Dict[int, float]:
+        """團隊 ID -> 延遲（秒）"""
+        return {snapshot.team.id: snapshot.latency for snapshot in self.snapshots}
+
+    @property
+    def stats(self) -> SchedulerStatsResponse:
+        """成功團隊的統計加總"""
+        stats = [snapshot.stats for snapshot in self.succeeded if snapshot.stats is not None]
+        return SchedulerStatsResponse(**{
+            field: sum(getattr(item, field) for item in stats)
+            for field in SchedulerStatsResponse.model_fields
+        })
+
+    def inventory(self) -> Iterator[Tuple[Team, ScheduledTaskResponse]]:
+        """依團隊順序逐一產生 (團隊, 任務)"""
+        for snapshot in self.succeeded:
+            for task in snapshot.tasks or ():
+                yield snapshot.team, task
+
+    @property
+    def task_count(self) -> int:
+        """成功團隊的任務總數"""
+        return sum(len(snapshot.tasks or ()) for snapshot in self.succeeded)
+
+    def __repr__(self) -> str:
+        return (
+            f"FleetReport(teams={len(self.snapshots)}, failed={len(self.failed)}, "
+            f"tasks={self.task_count}, elapsed={self.elapsed:.3f})"
+        )
+
+
+class FleetAggregator:
+    """跨團隊統計與任務清單彙總器
+
+    範例:
+        aggregator = FleetAggregator(sdk, tokens={1: "ABCD", 2: "EFGH"})
+        report = await aggregator.collect()
+        print(report.stats.total_tasks, report.errors, report.latencies)
+    """
+
+    def __init__(
+        self,
+        sdk: "ESchedulerSDK",
+        tokens: Mapping[Union[int, str], str],
+        concurrency: int = 8,
+        include_tasks: bool = True,
+        state: Optional[TaskState] = None,
+        priority: Union[RequestPriority, str] = RequestPriority.NORMAL,
+        team_timeout: Optional[float] = None
+    ):
+        """
+        初始化彙總器
+
+        Args:
+            sdk: SDK 實例，所有團隊共用其連線池、並發限制與端點選擇
+            tokens: 團隊 ID 或名稱 -> 團隊認證 token；沒有 token 的團隊記錄為認證失敗
+            concurrency: 同時查詢的團隊數上限
+            include_tasks: 是否取得每個團隊的任務清單；False 時只取得統計
+            state: 任務清單的狀態過濾
+            priority: 查詢請求的優先級
+            team_timeout: 每個團隊包含認證與重試的總逾時（秒）
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency 必須大於 0")
+
+        self.sdk = sdk
+        self.tokens = tokens
+        self.concurrency = concurrency
+        self.include_tasks = include_tasks
+        self.state = state
+        self.priority = RequestPriority(priority)
+        self.team_timeout = team_timeout
+
+    def _token_for(self, team: Team) -> Optional[str]:
+        """團隊的認證 token，先以 ID 再以名稱查找"""
+        token = self.tokens.get(team.id)
+        return token if token is not None else self.tokens.get(team.name)
+
+    async def _query_team(self, snapshot: TeamSnapshot) -> None:
+        """認證並查詢單一團隊"""
+        team = snapshot.team
+        token = self._token_for(team)
+        if token is None:
+            raise AuthenticationError(f"沒有團隊 {team.name} 的 token")
+
+        auth = await self.sdk.team.auth_team(token)
+        if not auth.status or not auth.access_token:
+            raise AuthenticationError(f"團隊 {team.name} 認證失敗")
+        if auth.team is not None and auth.team.id != team.id:
+            raise AuthenticationError(f"token 屬於團隊 {auth.team.name}，不是 {team.name}")
+
+        scheduler = self.sdk.scheduler
+        with request_credentials(auth.access_token):
+            if not self.include_tasks:
+                snapshot.stats = await scheduler.get_scheduler_stats()
+                return
+            # 等兩個請求都結束再拋出錯誤，不留下仍在執行的請求
+            stats, tasks = await asyncio.gather(
+                scheduler.get_scheduler_stats(),
+                scheduler.get_all_tasks(self.state),
+                return_exceptions=True
+            )
+        if isinstance(stats, BaseException):
+            raise stats
+        if isinstance(tasks, BaseException):
+            raise tasks
+        snapshot.stats, snapshot.tasks = stats, tasks
+
+    async def collect(self, teams: Optional[Sequence[Team]] = None) -> FleetReport:
+        """
+        同時查詢所有團隊並彙總
+
+        單一團隊的 ESchedulerError（認證失敗、逾時、伺服器錯誤等）記錄在該團隊的
+        結果中，不影響其他團隊。
+
+        Args:
+            teams: 要查詢的團隊，None 時以 get_all_teams 取得所有團隊
+
+        Returns:
+            彙總結果
+
+        Raises:
+            ESchedulerError: 取得團隊列表失敗時
+        """
+        started = time.perf_counter()
+        if teams is None:
+            teams = await self.sdk.team.get_all_teams()
+        snapshots = [TeamSnapshot(team) for team in teams]
+        iterator = iter(snapshots)
+
+        async def worker() -> None:
+            for snapshot in iterator:
+                team_started = time.perf_counter()
+                try:
+                    with request_deadline(self.team_timeout):
+                        await self._query_team(snapshot)
+                except ESchedulerError as e:
+                    snapshot.error = e
+                snapshot.latency = time.perf_counter() - team_started
+
+        # 工作任務建立時複製目前的 context，區塊外的請求不受影響
+        with request_priority(self.priority):
+            workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for future in workers:
+                future.cancel()
+        return FleetReport(snapshots, time.perf_counter() - started)
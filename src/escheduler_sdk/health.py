@@ -0,0 +1,317 @@
+"""EScheduler SDK 任務健康檢查
+
+HealthChecker 在全域並發上限內同時取得任務詳情與最近執行記錄，
+套用可插拔的檢查規則，並在每個任務完成時立即產出結果。
+"""
+
+import asyncio
+import re
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union
+)
+
+from .enums import ExecutionStatus, TaskState
+from .executions import FINAL_EXECUTION_STATUSES
+from .models import ScheduledTaskResponse, TaskExecutionResponse, TaskHealthReport
+
+if TYPE_CHECKING:
+    from .scheduler import SchedulerAPI
+
+
+# 檢查規則：返回問題描述，健康時返回 None
+HealthRule = Callable[
+    [ScheduledTaskResponse, List[TaskExecutionResponse], datetime],
+    Optional[str]
+]
+
+_RATE_EXPRESSION = re.compile(r"^rate\((\d+)\s+(minute|minutes|hour|hours|day|days)\)$")
+_RATE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+
+def schedule_interval(expression: str) -> Optional[timedelta]:
+    """
+    估計排程表達式的執行間隔
+
+    rate 表達式可精確換算；cron 表達式依最細的非萬用欄位估計上限，
+    例如 cron(*/15 * * * *) 為 15 分鐘、cron(0 2 * * *) 為 1 天、
+    cron(0 9 * * MON) 為 7 天。
+
+    Args:
+        expression: rate(...) 或 cron(...) 排程表達式
+
+    Returns:
+        估計的執行間隔，無法判斷時為 None
+    """
+    expression = expression.strip()
+    match = _RATE_EXPRESSION.match(expression)
+    if match:
+        return int(match.group(1)) * _RATE_UNITS[match.group(2).rstrip("s")]
+
+    if not (expression.startswith("cron(") and expression.endswith(")")):
+        return None
+    fields = expression[5:-1].split()
+    if len(fields) < 5:
+        return None
+    minute, hour, day_of_month, month, day_of_week = fields[:5]
+
+    def step(field: str) -> Optional[int]:
+        if field == "*":
+            return 1
+        if field.startswith("*/") and field[2:].isdigit():
+            return int(field[2:])
+        return None
+
+    minute_step = step(minute)
+    if minute_step is not None:
+        return timedelta(minutes=minute_step)
+    hour_step = step(hour)
+    if hour_step is not None:
+        return timedelta(hours=hour_step)
+
+    wildcard = ("*", "?")
+    if day_of_month in wildcard and day_of_week in wildcard:
+        return timedelta(days=1)
+    if day_of_month in wildcard:
+        # 指定星期：單一值每週一次，範圍或列表至少每週一次
+        return timedelta(days=7)
+    if month in wildcard:
+        return timedelta(days=31)
+    return timedelta(days=366)
+
+
+def state_rule(
+    task: ScheduledTaskResponse,
+    executions: List[TaskExecutionResponse],
+    now: datetime
+) -> Optional[str]:
+    """任務狀態不是 ENABLED"""
+    if task.state != TaskState.ENABLED:
+        return f"任務狀態異常: {task.state}"
+    return None
+
+
+def failure_rate_rule(threshold: float = 0.6) -> HealthRule:
+    """
+    建立最近執行失敗率規則
+
+    Args:
+        threshold: 失敗率超過此值視為異常
+
+    Returns:
+        檢查規則
+    """
+    def rule(
+        task: ScheduledTaskResponse,
+        executions: List[TaskExecutionResponse],
+        now: datetime
+    ) -> Optional[str]:
+        completed = [e for e in executions if e.status in FINAL_EXECUTION_STATUSES]
+        if not completed:
+            return None
+        failed = sum(1 for e in completed if e.status != ExecutionStatus.SUCCEEDED)
+        failure_rate = failed / len(completed)
+        if failure_rate > threshold:
+            return f"最近執行失敗率過高: {failure_rate * 100:.1f}%"
+        return None
+
+    return rule
+
+
+def overdue_rule(intervals: float = 2.0) -> HealthRule:
+    """
+    建立執行逾期規則
+
+    Args:
+        intervals: next_execution_time 落後超過幾個排程間隔視為異常
+
+    Returns:
+        檢查規則
+    """
+    def rule(
+        task: ScheduledTaskResponse,
+        executions: List[TaskExecutionResponse],
+        now: datetime
+    ) -> Optional[str]:
+        if task.state != TaskState.ENABLED or task.next_execution_time is None:
+            return None
+        interval = schedule_interval(task.schedule_expression)
+        if interval is None:
+            return None
+
+        next_execution_time = task.next_execution_time
+        if next_execution_time.tzinfo is None:
+            next_execution_time = next_execution_time.replace(tzinfo=timezone.utc)
+        lag = now - next_execution_time
+        if lag > interval * intervals:
+            return f"執行逾期: 下次執行時間已過 {lag}，超過 {intervals:g} 個排程間隔"
+        return None
+
+    return rule
+
+
+DEFAULT_RULES: Sequence[HealthRule] = (state_rule, failure_rate_rule(), overdue_rule())
+
+
+class HealthChecker:
+    """並發的任務健康檢查器
+
+    範例:
+        checker = HealthChecker(sdk.scheduler, concurrency=50)
+        async for report in checker.check_all():
+            if not report.is_healthy:
+                print(report.task_name, report.issues)
+    """
+
+    def __init__(
+        self,
+        scheduler: "SchedulerAPI",
+        rules: Optional[Sequence[HealthRule]] = None,
+        concurrency: int = 20,
+        executions_limit: int = 5
+    ):
+        """
+        初始化健康檢查器
+
+        Args:
+            scheduler: 排程任務 API 實例
+            rules: 檢查規則，預設為 DEFAULT_RULES
+            concurrency: 全域同時進行中的請求上限
+            executions_limit: 每個任務檢查的最近執行記錄數
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency 必須大於 0")
+
+        self.scheduler = scheduler
+        self.rules = list(rules) if rules is not None else list(DEFAULT_RULES)
+        self.concurrency = concurrency
+        self.executions_limit = executions_limit
+
+    async def check_all(self, state: Optional[TaskState] = None) -> AsyncIterator[TaskHealthReport]:
+        """
+        以一次列表請求取得所有任務，再逐一檢查執行記錄
+
+        Args:
+            state: 可選的任務狀態過濾
+
+        Yields:
+            每個任務的健康檢查結果（依完成順序）
+        """
+        tasks = await self.scheduler.get_all_tasks(state=state)
+        async for report in self.check(tasks):
+            yield report
+
+    async def check(
+        self,
+        tasks: Iterable[Union[int, ScheduledTaskResponse]]
+    ) -> AsyncIterator[TaskHealthReport]:
+        """
+        檢查多個任務的健康狀態
+
+        傳入任務 ID 時會同時取得任務詳情與執行記錄；傳入已取得的
+        ScheduledTaskResponse 時只取得執行記錄。
+
+        Args:
+            tasks: 任務 ID 或任務模型的可迭代物件
+
+        Yields:
+            每個任務的健康檢查結果（依完成順序）
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # 有上限的佇列：呼叫端處理較慢時，工作者會暫停而不是累積結果
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        iterator = iter(tasks)
+        done = object()
+
+        async def worker() -> None:
+            for task in iterator:
+                await results.put(await self._check_one(task, semaphore))
+
+        async def run_workers() -> None:
+            try:
+                await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+            except Exception as e:
+                await results.put(e)
+            await results.put(done)
+
+        runner = asyncio.ensure_future(run_workers())
+        try:
+            while True:
+                item = await results.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            runner.cancel()
+
+    async def _check_one(
+        self,
+        task: Union[int, ScheduledTaskResponse],
+        semaphore: asyncio.Semaphore
+    ) -> TaskHealthReport:
+        """檢查單一任務"""
+        task_id = task if isinstance(task, int) else task.id
+
+        async def limited(
+            coroutine_function: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+        ) -> Any:
+            async with semaphore:
+                return await coroutine_function(*args, **kwargs)
+
+        executions_request = limited(
+            self.scheduler.get_task_executions,
+            task_id,
+            limit=self.executions_limit,
+            summary=True,
+            body_preview=0
+        )
+        if isinstance(task, int):
+            task_result, executions_result = await asyncio.gather(
+                limited(self.scheduler.get_task, task_id),
+                executions_request,
+                return_exceptions=True
+            )
+        else:
+            task_result = task
+            executions_result = (await asyncio.gather(executions_request, return_exceptions=True))[0]
+
+        if isinstance(task_result, BaseException):
+            return TaskHealthReport(
+                task_id=task_id,
+                task_name=None,
+                is_healthy=False,
+                issues=[f"無法獲取任務詳情: {task_result}"]
+            )
+
+        issues: List[str] = []
+        if isinstance(executions_result, BaseException):
+            issues.append(f"無法獲取執行歷史: {executions_result}")
+            executions_result = []
+
+        now = datetime.now(timezone.utc)
+        for rule in self.rules:
+            issue = rule(task_result, executions_result, now)
+            if issue:
+                issues.append(issue)
+
+        return TaskHealthReport(
+            task_id=task_id,
+            task_name=task_result.name,
+            is_healthy=not issues,
+            issues=issues
+        )
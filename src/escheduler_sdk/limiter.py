@@ -0,0 +1,302 @@
+"""EScheduler SDK 自適應並發限制
+
+AdaptiveLimiter 依每個請求的延遲與錯誤訊號調整同時進行中的請求上限，
+超過上限的請求在佇列中等待：
+
+- "aimd"：成功且上限已被用到一半以上時加 1，收到 429、5xx 或逾時時乘以 backoff_ratio
+- "gradient"：以長期平均延遲與本次延遲的比值（梯度）縮放上限，並保留 sqrt(limit)
+  的排隊空間；延遲上升時上限平滑下降，延遲回落時上限回升
+
+等待中的請求依優先級（interactive/normal/bulk）分佇列，以加權公平佇列
+（start-time fair queuing）分配釋出的名額：各優先級都在排隊時，名額依權重比例
+分配，大量 bulk 請求不會讓 interactive 請求餓死。優先級以 request_priority()
+設定在目前的 context，或在呼叫客戶端方法時以 priority 參數指定。
+"""
+
+import asyncio
+import contextlib
+import math
+from collections import deque
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional, Tuple, Type, Union
+
+import httpx
+
+from .enums import RequestPriority
+
+LIMIT_ALGORITHMS = ("aimd", "gradient")
+
+DEFAULT_PRIORITY_WEIGHTS: Mapping[RequestPriority, float] = {
+    RequestPriority.INTERACTIVE: 8.0,
+    RequestPriority.NORMAL: 4.0,
+    RequestPriority.BULK: 1.0,
+}
+
+PriorityLike = Union[RequestPriority, str]
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "escheduler_request_priority", default=RequestPriority.NORMAL
+)
+
+
+def current_priority() -> RequestPriority:
+    """目前 context 的請求優先級"""
+    return _current_priority.get()
+
+
+@contextlib.contextmanager
+def request_priority(priority: PriorityLike) -> Iterator[RequestPriority]:
+    """
+    在區塊內以指定優先級送出請求
+
+    區塊內建立的 asyncio 任務會繼承此優先級。
+
+    範例:
+        with request_priority(RequestPriority.BULK):
+            await runner.delete_tasks(task_ids)
+
+    Args:
+        priority: 請求優先級
+    """
+    priority = RequestPriority(priority)
+    token = _current_priority.set(priority)
+    try:
+        yield priority
+    finally:
+        _current_priority.reset(token)
+
+# 視為過載訊號的例外
+_OVERLOAD_ERRORS = (httpx.TimeoutException, asyncio.TimeoutError)
+
+
+class LimiterSlot:
+    """一個進行中請求占用的名額
+
+    在 async with 區塊中拋出 httpx 逾時例外視為過載訊號，其他例外不計入樣本。
+    """
+
+    __slots__ = ("_limiter", "_priority", "_started", "_dropped")
+
+    def __init__(self, limiter: "AdaptiveLimiter", priority: Optional[PriorityLike] = None):
+        self._limiter = limiter
+        self._priority = priority
+        self._dropped = False
+
+    def drop(self) -> None:
+        """標記本次請求收到過載回應（429/5xx）"""
+        self._dropped = True
+
+    async def __aenter__(self) -> "LimiterSlot":
+        await self._limiter.acquire(self._priority)
+        self._started = asyncio.get_running_loop().time()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        limiter = self._limiter
+        if exc_type is None:
+            rtt = asyncio.get_running_loop().time() - self._started
+            limiter.release(rtt, dropped=self._dropped)
+        elif issubclass(exc_type, _OVERLOAD_ERRORS):
+            limiter.release(None, dropped=True)
+        else:
+            limiter.release(None)
+
+
+class AdaptiveLimiter:
+    """依延遲與錯誤自動調整的並發上限
+
+    範例:
+        limiter = AdaptiveLimiter("gradient", initial_limit=20, max_limit=200)
+        async with ESchedulerSDK(base_url=url, limiter=limiter) as sdk:
+            ...
+            print(limiter.limit, limiter.in_flight, limiter.queue_depth)
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "aimd",
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.9,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        long_window: int = 600,
+        weights: Optional[Mapping[PriorityLike, float]] = None
+    ):
+        """
+        初始化並發限制器
+
+        Args:
+            algorithm: "aimd" 或 "gradient"
+            initial_limit: 初始並發上限
+            min_limit: 並發上限的下限
+            max_limit: 並發上限的上限，通常不超過連線池大小
+            backoff_ratio: 收到過載訊號時上限乘上的比例
+            tolerance: gradient 演算法可容忍的延遲上升倍數
+            smoothing: gradient 演算法每個樣本調整上限的權重
+            long_window: gradient 演算法長期平均延遲的樣本窗口
+            weights: 各優先級的權重，預設 interactive 8、normal 4、bulk 1
+        """
+        if algorithm not in LIMIT_ALGORITHMS:
+            raise ValueError(
+                f"不支援的並發限制演算法: {algorithm}，可用演算法: {', '.join(LIMIT_ALGORITHMS)}"
+            )
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("必須滿足 1 <= min_limit <= initial_limit <= max_limit")
+
+        self.algorithm = algorithm
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self._long_decay = 2 / (long_window + 1)
+        self._long_rtt: Optional[float] = None
+        self._limit = float(initial_limit)
+        self._update = self._update_aimd if algorithm == "aimd" else self._update_gradient
+
+        self.weights: Dict[RequestPriority, float] = dict(DEFAULT_PRIORITY_WEIGHTS)
+        if weights:
+            self.weights.update((RequestPriority(k), float(v)) for k, v in weights.items())
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError("優先級權重必須大於 0")
+
+        self.in_flight = 0
+        # 每個優先級一個 (start tag, future) 佇列；virtual time 為最近出列請求的 start tag
+        self._waiters: Dict[RequestPriority, Deque[Tuple[float, asyncio.Future]]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._last_finish: Dict[RequestPriority, float] = dict.fromkeys(RequestPriority, 0.0)
+        self._virtual_time = 0.0
+        self._queued = 0
+
+        # 統計信息
+        self.requests = 0
+        self.drops = 0
+
+    @property
+    def limit(self) -> int:
+        """目前的並發上限"""
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        """等待名額的請求數"""
+        return self._queued
+
+    def queue_depths(self) -> Dict[str, int]:
+        """各優先級等待名額的請求數"""
+        return {priority.value: len(queue) for priority, queue in self._waiters.items()}
+
+    def slot(self, priority: Optional[PriorityLike] = None) -> LimiterSlot:
+        """
+        取得名額的異步上下文管理器，離開時自動回報延遲
+
+        Args:
+            priority: 請求優先級，None 時使用目前 context 的優先級
+        """
+        return LimiterSlot(self, priority)
+
+    async def acquire(self, priority: Optional[PriorityLike] = None) -> None:
+        """
+        等待並取得一個名額
+
+        Args:
+            priority: 請求優先級，None 時使用目前 context 的優先級
+        """
+        if self.in_flight < self.limit and not self._queued:
+            self.in_flight += 1
+            return
+
+        priority = RequestPriority(priority) if priority is not None else _current_priority.get()
+        start = max(self._virtual_time, self._last_finish[priority])
+        self._last_finish[priority] = start + 1 / self.weights[priority]
+        entry = (start, asyncio.get_running_loop().create_future())
+        self._waiters[priority].append(entry)
+        self._queued += 1
+        try:
+            await entry[1]
+        except asyncio.CancelledError:
+            if not entry[1].cancelled():
+                # 名額已轉交給這個等待者，取消時歸還
+                self._release_slot()
+            elif entry in self._waiters[priority]:
+                self._waiters[priority].remove(entry)
+                self._queued -= 1
+            raise
+
+    def release(self, rtt: Optional[float], dropped: bool = False) -> None:
+        """
+        歸還名額並回報本次請求的結果
+
+        Args:
+            rtt: 請求耗時（秒），None 表示沒有可用的延遲樣本
+            dropped: 是否收到過載訊號（429、5xx 或逾時）
+        """
+        self.requests += 1
+        if dropped:
+            self.drops += 1
+            self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        elif rtt is not None:
+            self._update(rtt)
+        self._release_slot()
+
+    def stats(self) -> Dict[str, Any]:
+        """目前的上限、進行中請求數與佇列深度"""
+        return {
+            "algorithm": self.algorithm,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "queue_depths": self.queue_depths(),
+            "requests": self.requests,
+            "drops": self.drops,
+        }
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """在上限允許的範圍內，依 start tag 由小到大把名額轉交給等待中的請求"""
+        limit = self.limit
+        while self._queued and self.in_flight < limit:
+            queue = min(
+                (queue for queue in self._waiters.values() if queue),
+                key=lambda queue: queue[0][0]
+            )
+            start, waiter = queue.popleft()
+            self._queued -= 1
+            if waiter.done():
+                # 已取消但尚未從佇列移除的等待者
+                continue
+            self._virtual_time = start
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def _update_aimd(self, rtt: float) -> None:
+        # 只有上限確實被用到時才增加，避免低負載時上限無限制成長
+        if self.in_flight * 2 >= self._limit:
+            self._limit = min(self.max_limit, self._limit + 1)
+
+    def _update_gradient(self, rtt: float) -> None:
+        long_rtt = self._long_rtt
+        if long_rtt is None:
+            self._long_rtt = rtt
+            return
+        long_rtt += self._long_decay * (rtt - long_rtt)
+        self._long_rtt = long_rtt
+        if self.in_flight * 2 < self._limit:
+            return
+
+        gradient = max(0.5, min(1.0, self.tolerance * long_rtt / rtt)) if rtt > 0 else 1.0
+        target = self._limit * gradient + math.sqrt(self._limit)
+        limit = self._limit * (1 - self.smoothing) + target * self.smoothing
+        self._limit = max(self.min_limit, min(self.max_limit, limit))
@@ -0,0 +1,337 @@
+"""EScheduler SDK 請求中介層
+
+每個中介層是一個函數：接收下一層的處理函數，返回包裝後的處理函數。
+ESchedulerClient 在建構時由外到內把中介層串成一個處理函數：
+
+    自訂中介層 -> 重試 -> 錯誤對應 -> 並發限制 -> 負載平衡 -> httpx 傳輸
+
+自訂中介層位於最外層，收到的是解碼後的 JSON 結果，適合實作快取、合併、
+限速與指標收集；錯誤對應以內的中介層收到 httpx.Response。串接只在建構時
+進行一次，沒有自訂中介層、停用並發限制或只有單一端點時，對應的層不會出現在
+呼叫路徑上。
+
+範例:
+    def timing(call_next):
+        async def handler(request):
+            started = time.perf_counter()
+            try:
+                return await call_next(request)
+            finally:
+                metrics.observe(request.method, request.endpoint, time.perf_counter() - started)
+        return handler
+
+    sdk = ESchedulerSDK(base_url=url, middlewares=[timing])
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import httpx
+
+from .balancer import Endpoint, EndpointPool
+from .decoding import LARGE_RESPONSE_BYTES, decode_json
+from .exceptions import (
+    DeadlineExceededError,
+    ESchedulerError,
+    AuthenticationError,
+    ValidationError,
+    NotFoundError,
+    ServerError,
+    RateLimitError,
+    TimeoutError,
+    NetworkError
+)
+from .limiter import AdaptiveLimiter, PriorityLike
+
+# 重送不會產生副作用的方法，可以在讀取逾時等錯誤後改送到其他端點
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 連線建立階段的錯誤代表請求尚未送出，任何方法都可以改送到其他端點
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Python 3.11+ 的 asyncio.timeout 不需要像 wait_for 一樣建立新任務
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+# 不需要重試的錯誤
+_FINAL_ERRORS = (
+    AuthenticationError,
+    ValidationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    DeadlineExceededError
+)
+
+
+class Request:
+    """在中介層之間傳遞的單次 API 呼叫"""
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "url",
+        "json",
+        "params",
+        "priority",
+        "kwargs",
+        "retry_now",
+        "failed_endpoints",
+        "deadline",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        priority: Optional[PriorityLike] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.json = json
+        self.params = params
+        self.priority = priority
+        self.kwargs = kwargs if kwargs is not None else {}
+        # 由內層中介層設定：下一次重試可以立即進行，不需要退避等待
+        self.retry_now = False
+        self.failed_endpoints: Optional[List[Endpoint]] = None
+        # 所有嘗試必須完成的時間點（time.monotonic()），None 表示沒有期限
+        self.deadline = deadline
+
+    def __repr__(self) -> str:
+        return f"Request({self.method} {self.url})"
+
+
+Handler = Callable[[Request], Awaitable[Any]]
+Middleware = Callable[[Handler], Handler]
+
+
+def build_handler(handler: Handler, middlewares: Iterable[Middleware]) -> Handler:
+    """
+    由外到內串接中介層
+
+    Args:
+        handler: 最內層的處理函數
+        middlewares: 中介層，第一個位於最外層
+
+    Returns:
+        串接後的處理函數
+    """
+    for middleware in reversed(list(middlewares)):
+        handler = middleware(handler)
+    return handler
+
+
+def raise_for_response(response: httpx.Response) -> None:
+    """將錯誤回應轉換為對應的 ESchedulerError"""
+    status_code = response.status_code
+
+    error_data = None
+    try:
+        error_data = response.json()
+        message = error_data.get("detail", error_data.get("message", "未知錯誤"))
+    except Exception:
+        message = response.text or f"HTTP {status_code} 錯誤"
+
+    if status_code == 400:
+        raise ValidationError(message, status_code=status_code, response_data=error_data)
+    elif status_code == 401:
+        raise AuthenticationError(message, status_code=status_code, response_data=error_data)
+    elif status_code == 404:
+        raise NotFoundError(message, status_code=status_code, response_data=error_data)
+    elif status_code == 429:
+        raise RateLimitError(message, status_code=status_code, response_data=error_data)
+    elif 500 <= status_code < 600:
+        raise ServerError(message, status_code=status_code, response_data=error_data)
+    else:
+        raise ESchedulerError(message, status_code=status_code, response_data=error_data)
+
+
+def error_mapping_middleware(large_response_bytes: Optional[int] = LARGE_RESPONSE_BYTES) -> Middleware:
+    """
+    將 httpx.Response 解碼為 JSON，錯誤狀態碼轉換為 ESchedulerError
+
+    Args:
+        large_response_bytes: 超過此大小的回應分段解碼並定期讓出事件迴圈，None 表示停用
+    """
+
+    def middleware(call_next: Handler) -> Handler:
+        async def handler(request: Request) -> Any:
+            response = await call_next(request)
+            if response.is_success:
+                try:
+                    content = response.content
+                    if (
+                        large_response_bytes is not None
+                        and isinstance(content, bytes)
+                        and len(content) >= large_response_bytes
+                    ):
+                        return await decode_json(response.text)
+                    return response.json()
+                except Exception:
+                    # 如果回應不是 JSON，返回空字典
+                    return {}
+            raise_for_response(response)
+
+        return handler
+
+    return middleware
+
+
+def retry_middleware(max_retries: int, timeout: Optional[float] = None) -> Middleware:
+    """
+    逾時、網路錯誤與其他非預期錯誤時以指數退避重試
+
+    請求有期限時，每次嘗試（包含並發限制的排隊時間）以剩餘時間為上限，
+    httpx 逾時縮短為剩餘時間；退避等待後已經來不及的重試直接放棄。
+
+    Args:
+        max_retries: 最大重試次數
+        timeout: 客戶端的 httpx 逾時（秒），有期限時與剩餘時間取較小值
+    """
+
+    def middleware(call_next: Handler) -> Handler:
+        async def handler(request: Request) -> Any:
+            deadline = request.deadline
+            base_timeout = request.kwargs.get("timeout", timeout) if deadline is not None else None
+            for attempt in range(max_retries + 1):
+                try:
+                    if deadline is None:
+                        return await call_next(request)
+                    return await _attempt_before(deadline, base_timeout, call_next, request)
+
+                except httpx.TimeoutException:
+                    if attempt == max_retries:
+                        raise TimeoutError(f"請求超時: {request.url}")
+                    error: Exception = TimeoutError(f"請求超時: {request.url}")
+
+                except httpx.NetworkError as e:
+                    if attempt == max_retries:
+                        raise NetworkError(f"網路錯誤: {str(e)}")
+                    error = NetworkError(f"網路錯誤: {str(e)}")
+
+                except _FINAL_ERRORS:
+                    # 這些錯誤不需要重試
+                    raise
+
+                except Exception as e:
+                    if attempt == max_retries:
+                        raise ESchedulerError(f"未知錯誤: {str(e)}")
+                    error = e
+
+                delay = 0 if request.retry_now else 2 ** attempt  # 指數退避
+                request.retry_now = False
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise DeadlineExceededError(
+                        f"請求期限內無法完成重試: {request.url}（最後錯誤: {error}）"
+                    ) from error
+                if delay:
+                    await asyncio.sleep(delay)
+
+            # 這行理論上不會執行到
+            raise ESchedulerError("請求失敗")
+
+        return handler
+
+    return middleware
+
+
+async def _attempt_before(
+    deadline: float,
+    base_timeout: Any,
+    call_next: Handler,
+    request: Request
+) -> Any:
+    """在期限前完成一次嘗試，逾時拋出 DeadlineExceededError"""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError(f"超過請求期限: {request.url}")
+    # httpx.Timeout 等非數值設定保留各階段的值，由外層的 wait_for 限制總時間
+    if base_timeout is None or isinstance(base_timeout, (int, float)):
+        request.kwargs["timeout"] = remaining if base_timeout is None else min(base_timeout, remaining)
+    try:
+        if _asyncio_timeout is not None:
+            async with _asyncio_timeout(remaining):
+                return await call_next(request)
+        return await asyncio.wait_for(call_next(request), remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError(f"超過請求期限: {request.url}") from None
+
+
+def limiter_middleware(limiter: AdaptiveLimiter) -> Middleware:
+    """
+    每次嘗試都先取得自適應並發限制器的名額
+
+    Args:
+        limiter: 並發限制器
+    """
+
+    def middleware(call_next: Handler) -> Handler:
+        async def handler(request: Request) -> httpx.Response:
+            async with limiter.slot(request.priority) as slot:
+                response: httpx.Response = await call_next(request)
+                if not response.is_success and (
+                    response.status_code == 429 or response.status_code >= 500
+                ):
+                    slot.drop()
+                return response
+
+        return handler
+
+    return middleware
+
+
+def balancer_middleware(pool: EndpointPool, build_url: Callable[[str, str], str]) -> Middleware:
+    """
+    每次嘗試從端點池選擇端點，記錄延遲與失敗
+
+    連線錯誤，或冪等請求的逾時與網路錯誤，在還有未嘗試的端點時設定
+    request.retry_now，由重試中介層立即改送。
+
+    Args:
+        pool: 端點池
+        build_url: (endpoint, base_url) -> 完整 URL
+    """
+
+    def middleware(call_next: Handler) -> Handler:
+        async def handler(request: Request) -> httpx.Response:
+            failed = request.failed_endpoints
+            if failed is None:
+                failed = request.failed_endpoints = []
+            idempotent = request.method.upper() in IDEMPOTENT_METHODS
+            target = pool.choose(exclude=failed, idempotent=idempotent)
+            request.url = build_url(request.endpoint, target.url)
+
+            target.outstanding += 1
+            started = time.monotonic()
+            try:
+                response: httpx.Response = await call_next(request)
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                pool.record_failure(target)
+                failed.append(target)
+                # 還有尚未嘗試的端點時立即改送，全部失敗過才回到指數退避
+                request.retry_now = (
+                    (idempotent or isinstance(e, _CONNECT_ERRORS)) and len(failed) < len(pool)
+                )
+                raise
+            except BaseException:
+                pool.release(target)
+                raise
+            finally:
+                target.outstanding -= 1
+
+            if response.status_code >= 500:
+                pool.record_failure(target)
+            else:
+                pool.record_success(target, time.monotonic() - started)
+            return response
+
+        return handler
+
+    return middleware
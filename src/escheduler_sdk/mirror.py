@@ -0,0 +1,273 @@
+"""EScheduler SDK 本地任務鏡像
+
+TaskMirror 在本地 SQLite 資料庫中保存任務清單的副本，以 name、target_arn、
+state 與 target_type 建立索引，查詢在本地完成而不需要呼叫 API。
+
+鏡像是完整重新整理的快取：API 沒有依更新時間過濾的參數，每次同步都取得完整的
+任務清單，再比對每個任務的 updated_at，只寫入新增或變更的任務並刪除已不存在的
+任務；未變更的任務不會被重新寫入。查詢前若距離上次同步已超過 max_staleness，
+會先自動同步一次。
+"""
+
+import asyncio
+import json
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from .enums import TaskState
+from .records import TaskRecord
+
+if TYPE_CHECKING:
+    import os
+
+    from .scheduler import SchedulerAPI
+
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+INDEXED_COLUMNS: Tuple[str, ...] = ("name", "target_arn", "state", "target_type")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    target_arn TEXT NOT NULL,
+    state TEXT NOT NULL,
+    target_type TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_name ON tasks (name);
+CREATE INDEX IF NOT EXISTS tasks_target_arn ON tasks (target_arn);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state);
+CREATE INDEX IF NOT EXISTS tasks_target_type ON tasks (target_type);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SyncResult:
+    """單次同步的結果"""
+
+    def __init__(self, upserted: int = 0, deleted: int = 0, unchanged: int = 0):
+        self.upserted = upserted
+        self.deleted = deleted
+        self.unchanged = unchanged
+
+    @property
+    def changed(self) -> int:
+        """新增、變更與刪除的任務數"""
+        return self.upserted + self.deleted
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncResult(upserted={self.upserted}, deleted={self.deleted}, "
+            f"unchanged={self.unchanged})"
+        )
+
+
+class TaskMirror:
+    """以 SQLite 保存的本地任務鏡像
+
+    範例:
+        async with TaskMirror(sdk.scheduler, "tasks.db", max_staleness=30) as mirror:
+            task = await mirror.get(42)
+            webhooks = await mirror.find(target_arn="https://example.com/hook")
+            paused = await mirror.find(state=TaskState.PAUSED)
+    """
+
+    def __init__(
+        self,
+        scheduler: "SchedulerAPI",
+        path: PathLike = ":memory:",
+        max_staleness: Optional[float] = 60.0
+    ):
+        """
+        初始化任務鏡像
+
+        Args:
+            scheduler: 排程任務 API 實例
+            path: SQLite 檔案路徑，":memory:" 表示不持久化
+            max_staleness: 查詢時可接受的最長資料時間（秒），None 表示只在呼叫 sync() 時同步
+        """
+        self.scheduler = scheduler
+        self.path = path
+        self.max_staleness = max_staleness
+        self._connection = sqlite3.connect(str(path), isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._sync_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "TaskMirror":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """關閉資料庫連線"""
+        self._connection.close()
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        """上次同步完成的時間（time.time()），從未同步時為 None"""
+        value = self._get_meta("synced_at")
+        return float(value) if value is not None else None
+
+    @property
+    def age(self) -> Optional[float]:
+        """距離上次同步的秒數，從未同步時為 None"""
+        synced_at = self.synced_at
+        return time.time() - synced_at if synced_at is not None else None
+
+    def __len__(self) -> int:
+        count: int = self._connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        return count
+
+    async def sync(self) -> SyncResult:
+        """
+        立即與伺服器同步
+
+        同時有多個呼叫時只會送出一次列表請求。
+
+        Returns:
+            同步結果
+        """
+        lock_requested = time.time()
+        async with self._sync_lock:
+            synced_at = self.synced_at
+            if synced_at is not None and synced_at >= lock_requested:
+                # 等待期間已有其他呼叫完成同步
+                return SyncResult()
+
+            response_data = await self.scheduler.client.get(self.scheduler.base_endpoint)
+            return self._apply(response_data)
+
+    async def ensure_fresh(self) -> None:
+        """資料超過 max_staleness 時同步"""
+        if self.max_staleness is None:
+            return
+        age = self.age
+        if age is None or age > self.max_staleness:
+            await self.sync()
+
+    async def get(self, task_id: int) -> Optional[TaskRecord]:
+        """
+        依 ID 取得任務
+
+        Args:
+            task_id: 任務 ID
+
+        Returns:
+            任務記錄，不存在時為 None
+        """
+        await self.ensure_fresh()
+        row = self._connection.execute(
+            "SELECT data FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        return TaskRecord.from_dict(json.loads(row[0])) if row is not None else None
+
+    async def find(
+        self,
+        limit: Optional[int] = None,
+        **conditions: Union[str, TaskState]
+    ) -> List[TaskRecord]:
+        """
+        以索引欄位查詢任務
+
+        Args:
+            limit: 可選的最大筆數
+            **conditions: name、target_arn、state、target_type 的完全相符條件
+
+        Returns:
+            依 ID 排序的任務記錄
+        """
+        unknown = set(conditions) - set(INDEXED_COLUMNS)
+        if unknown:
+            raise ValueError(f"不支援的查詢欄位: {', '.join(sorted(unknown))}")
+
+        await self.ensure_fresh()
+        sql = "SELECT data FROM tasks"
+        parameters: List[Any] = []
+        if conditions:
+            sql += " WHERE " + " AND ".join(f"{name} = ?" for name in conditions)
+            parameters.extend(
+                value.value if isinstance(value, TaskState) else value
+                for value in conditions.values()
+            )
+        sql += " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+
+        rows = self._connection.execute(sql, parameters)
+        return [TaskRecord.from_dict(json.loads(data)) for data, in rows]
+
+    async def count_by(self, column: str) -> Dict[str, int]:
+        """
+        依索引欄位分組計數
+
+        Args:
+            column: state、target_type 等索引欄位
+
+        Returns:
+            欄位值 -> 任務數
+        """
+        if column not in INDEXED_COLUMNS:
+            raise ValueError(f"不支援的分組欄位: {column}")
+
+        await self.ensure_fresh()
+        return dict(self._connection.execute(
+            f"SELECT {column}, COUNT(*) FROM tasks GROUP BY {column}"
+        ))
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _apply(self, tasks: List[Dict[str, Any]]) -> SyncResult:
+        """將完整的任務列表套用到鏡像，只寫入變更的列"""
+        known = dict(self._connection.execute("SELECT id, updated_at FROM tasks"))
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+        upserts = []
+        for task in tasks:
+            updated_at = task["updated_at"]
+            task_id = task["id"]
+            if known.pop(task_id, None) != updated_at:
+                upserts.append((
+                    task_id,
+                    task["name"],
+                    task["target_arn"],
+                    task["state"],
+                    task["target_type"],
+                    updated_at,
+                    dumps(task),
+                ))
+
+        deleted = list(known)
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?)", upserts
+            )
+            connection.executemany("DELETE FROM tasks WHERE id = ?", ((i,) for i in deleted))
+
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('synced_at', ?)", (repr(time.time()),)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        return SyncResult(
+            upserted=len(upserts),
+            deleted=len(deleted),
+            unchanged=len(tasks) - len(upserts)
+        )
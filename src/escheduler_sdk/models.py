@@ -1,48 +1,26 @@
 """EScheduler SDK 數據模型"""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Awaitable
 from datetime import datetime
-from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
+from .enums import (
+    TaskState,
+    TargetType,
+    ExecutionStatus,
+    ScheduleType,
+    TaskChangeType
+)
 
-# 枚舉類型
-class TaskState(str, Enum):
-    """任務狀態枚舉"""
-    ENABLED = "ENABLED"
-    DISABLED = "DISABLED"
-    PAUSED = "PAUSED"
 
-
-class TargetType(str, Enum):
-    """目標類型枚舉"""
-    HTTP = "http"
-    WEBHOOK = "webhook"
-    RABBITMQ = "rabbitmq"
-    EMAIL = "email"
-
-
-class ExecutionStatus(str, Enum):
-    """執行狀態枚舉"""
-    PENDING = "PENDING"
-    RUNNING = "RUNNING"
-    SUCCEEDED = "SUCCEEDED"
-    FAILED = "FAILED"
-    TIMEOUT = "TIMEOUT"
-    CANCELLED = "CANCELLED"
-
-
-class ScheduleType(str, Enum):
-    """排程類型枚舉"""
-    CRON = "cron"
-    RATE = "rate"
-    ONE_TIME = "one_time"
-    AT = "at"
+class ESchedulerModel(BaseModel):
+    """SDK 模型基礎類，驗證器與序列化器延遲到第一次使用時才建立"""
+    model_config = ConfigDict(defer_build=True)
 
 
 # 排程任務相關模型
-class ScheduledTaskCreate(BaseModel):
+class ScheduledTaskCreate(ESchedulerModel):
     """創建排程任務請求模型"""
     name: str = Field(..., min_length=1, max_length=255, description="任務名稱")
     description: Optional[str] = Field(None, description="任務描述")
@@ -67,7 +45,7 @@ class ScheduledTaskCreate(BaseModel):
             raise ValueError('排程表達式必須是 cron(expression) 或 rate(expression) 格式')
 
 
-class ScheduledTaskUpdate(BaseModel):
+class ScheduledTaskUpdate(ESchedulerModel):
     """更新排程任務請求模型"""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
@@ -82,7 +60,7 @@ class ScheduledTaskUpdate(BaseModel):
     dead_letter_config: Optional[Dict[str, Any]] = None
 
 
-class ScheduledTaskResponse(BaseModel):
+class ScheduledTaskResponse(ESchedulerModel):
     """排程任務回應模型"""
     id: int
     name: str
@@ -103,7 +81,14 @@ class ScheduledTaskResponse(BaseModel):
     updated_at: datetime
 
 
-class TaskExecutionResponse(BaseModel):
+class TaskChangeEvent(ESchedulerModel):
+    """任務變更事件模型"""
+    type: TaskChangeType = Field(..., description="變更類型")
+    task_id: int = Field(..., description="任務 ID")
+    task: Optional[ScheduledTaskResponse] = Field(None, description="變更後的任務信息，刪除事件時為 None")
+
+
+class TaskExecutionResponse(ESchedulerModel):
     """任務執行記錄回應模型"""
     id: int
     task_id: int
@@ -114,9 +99,38 @@ class TaskExecutionResponse(BaseModel):
     response_body: Optional[str]
     error_message: Optional[str]
     attempt_number: int
+    response_body_size: Optional[int] = Field(None, description="完整回應內容的 UTF-8 位元組數，摘要模式下提供")
+    response_body_truncated: bool = Field(False, description="response_body 是否只是截斷的預覽")
+
+    _body_loader: Optional[Callable[[], Awaitable[Optional[str]]]] = PrivateAttr(None)
+
+    async def load_response_body(self) -> Optional[str]:
+        """
+        取得完整的回應內容
+
+        摘要模式取得的執行記錄在第一次呼叫時才向伺服器取得完整內容，之後使用快取。
+
+        Returns:
+            完整的回應內容
+        """
+        if self.response_body_truncated:
+            if self._body_loader is None:
+                raise ValueError(f"執行記錄 {self.id} 沒有可用的完整內容來源")
+            self.response_body = await self._body_loader()
+            self.response_body_truncated = False
+            self._body_loader = None
+        return self.response_body
+
+
+class TaskHealthReport(ESchedulerModel):
+    """任務健康檢查結果模型"""
+    task_id: int = Field(..., description="任務 ID")
+    task_name: Optional[str] = Field(None, description="任務名稱，無法取得任務詳情時為 None")
+    is_healthy: bool = Field(..., description="是否健康")
+    issues: List[str] = Field(default_factory=list, description="發現的問題")
 
 
-class SchedulerStatsResponse(BaseModel):
+class SchedulerStatsResponse(ESchedulerModel):
     """排程器統計回應模型"""
     total_tasks: int
     enabled_tasks: int
@@ -126,24 +140,24 @@ class SchedulerStatsResponse(BaseModel):
     failed_executions_today: int
 
 
-class TaskStateUpdateRequest(BaseModel):
+class TaskStateUpdateRequest(ESchedulerModel):
     """任務狀態更新請求模型"""
     state: TaskState = Field(..., description="新的任務狀態")
 
 
 # 團隊相關模型
-class Team(BaseModel):
+class Team(ESchedulerModel):
     """團隊模型"""
     id: int = Field(..., description="團隊 ID")
     name: str = Field(..., description="團隊名稱", examples=["第1小隊"])
 
 
-class TeamAuthRequest(BaseModel):
+class TeamAuthRequest(ESchedulerModel):
     """團隊認證請求模型"""
     token: str = Field(..., min_length=4, max_length=4, description="團隊認證 token", examples=["ABCD"])
 
 
-class TeamAuthResponse(BaseModel):
+class TeamAuthResponse(ESchedulerModel):
     """團隊認證回應模型"""
     status: bool = Field(..., description="認證狀態", examples=[False])
     team: Optional[Team] = Field(None, description="團隊信息")
@@ -151,13 +165,13 @@ class TeamAuthResponse(BaseModel):
 
 
 # 通用回應模型
-class MessageResponse(BaseModel):
+class MessageResponse(ESchedulerModel):
     """通用消息回應模型"""
     message: str = Field(..., description="回應消息")
     status_code: Optional[int] = Field(None, description="狀態碼")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ESchedulerModel):
     """錯誤回應模型"""
     detail: str = Field(..., description="錯誤詳情")
     error_code: Optional[str] = Field(None, description="錯誤代碼")
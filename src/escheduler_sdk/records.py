@@ -0,0 +1,110 @@
+"""EScheduler SDK 精簡任務記錄
+
+大量任務清單常駐記憶體時，ScheduledTaskResponse 實例的額外開銷
+（__dict__、欄位集合、驗證後的副本）相當可觀。TaskRecord 以 tuple 儲存，
+列舉類字串會被 intern 共用，需要完整模型時再透過 to_response() 轉換。
+"""
+
+import sys
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional, Union, overload
+
+from pydantic import TypeAdapter
+
+from .models import ScheduledTaskResponse
+
+# 與 ScheduledTaskResponse 相同的時間解析規則；Python 3.9/3.10 的 datetime.fromisoformat
+# 不接受非 3 或 6 位的小數秒等 pydantic 可以解析的格式
+_validate_datetime = TypeAdapter(datetime).validate_python
+
+
+@overload
+def parse_datetime(value: None) -> None: ...
+
+
+@overload
+def parse_datetime(value: Union[str, datetime]) -> datetime: ...
+
+
+@overload
+def parse_datetime(value: Any) -> Optional[datetime]: ...
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    解析 API 回傳的 ISO 8601 時間字串
+
+    Args:
+        value: ISO 8601 字串、datetime 或 None
+
+    Returns:
+        datetime 或 None
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    return _validate_datetime(value)
+
+
+def _intern(value: str) -> str:
+    return sys.intern(value)
+
+
+class TaskRecord(NamedTuple):
+    """唯讀的精簡任務記錄，欄位與 ScheduledTaskResponse 相同"""
+    id: int
+    name: str
+    description: Optional[str]
+    schedule_expression: str
+    timezone: str
+    target_type: str
+    target_arn: str
+    target_input: Optional[Dict[str, Any]]
+    state: str
+    last_execution_time: Optional[datetime]
+    next_execution_time: Optional[datetime]
+    execution_count: int
+    max_retry_attempts: int
+    retry_policy: Optional[Dict[str, Any]]
+    dead_letter_config: Optional[Dict[str, Any]]
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskRecord":
+        """
+        從 API 回傳的任務字典建立記錄
+
+        Args:
+            data: 原始任務字典
+
+        Returns:
+            任務記錄
+        """
+        return cls(
+            data["id"],
+            data["name"],
+            data.get("description"),
+            _intern(data["schedule_expression"]),
+            _intern(data["timezone"]),
+            _intern(data["target_type"]),
+            data["target_arn"],
+            data.get("target_input"),
+            _intern(data["state"]),
+            parse_datetime(data.get("last_execution_time")),
+            parse_datetime(data.get("next_execution_time")),
+            data["execution_count"],
+            data["max_retry_attempts"],
+            data.get("retry_policy"),
+            data.get("dead_letter_config"),
+            parse_datetime(data["created_at"]),
+            parse_datetime(data["updated_at"]),
+        )
+
+    def to_response(self) -> ScheduledTaskResponse:
+        """
+        轉換為完整的 ScheduledTaskResponse 模型
+
+        Returns:
+            任務回應模型
+        """
+        return ScheduledTaskResponse(**self._asdict())
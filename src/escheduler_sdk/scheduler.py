@@ -1,8 +1,14 @@
 """EScheduler SDK 排程任務 API 封裝"""
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import functools
+import time
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Dict, Any
 
 from .client import ESchedulerClient
+from .deadline import remaining_time, request_deadline
+from .decoding import build_list
+from .limiter import PriorityLike
 from .models import (
     ScheduledTaskCreate,
     ScheduledTaskUpdate,
@@ -11,8 +17,20 @@ from .models import (
     SchedulerStatsResponse,
     TaskStateUpdateRequest,
     TaskState,
+    TaskChangeEvent,
     MessageResponse
 )
+from .executions import ExecutionWatcher
+from .records import TaskRecord
+from .watch import TaskIndex
+
+# 摘要模式下預設保留的回應內容字元數
+DEFAULT_BODY_PREVIEW = 256
+
+if TYPE_CHECKING:
+    from .table import TaskTable
+    from .templates import TaskTemplate
+    from .transfer import ImportResult, PathLike
 
 
 class SchedulerAPI:
@@ -27,13 +45,19 @@ class SchedulerAPI:
         """
         self.client = client
         self.base_endpoint = "/api/scheduler"
+        self._execution_watcher: Optional[ExecutionWatcher] = None
     
-    async def create_task(self, task_data: ScheduledTaskCreate) -> ScheduledTaskResponse:
+    async def create_task(
+        self,
+        task_data: ScheduledTaskCreate,
+        priority: Optional[PriorityLike] = None
+    ) -> ScheduledTaskResponse:
         """
         創建新的排程任務
         
         Args:
             task_data: 任務創建數據
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             創建的任務信息
@@ -45,19 +69,52 @@ class SchedulerAPI:
         """
         response_data = await self.client.post(
             self.base_endpoint,
-            json_data=task_data.model_dump(exclude_none=True)
+            json_data=task_data.model_dump(exclude_none=True),
+            priority=priority
+        )
+        return ScheduledTaskResponse(**response_data)
+    
+    async def create_task_from_template(
+        self,
+        template: "TaskTemplate",
+        *,
+        priority: Optional[PriorityLike] = None,
+        **values: Any
+    ) -> ScheduledTaskResponse:
+        """
+        以任務範本創建排程任務，只驗證與編碼變數的值
+        
+        Args:
+            template: 任務範本
+            priority: 請求優先級，None 時使用 request_priority() 設定的值；
+                因此範本變數不能命名為 priority
+            **values: 範本變數的值，未提供的使用範本預設值
+            
+        Returns:
+            創建的任務信息
+            
+        Raises:
+            ValueError: 當變數名稱不存在或欄位值驗證失敗時
+            ValidationError: 當伺服器拒絕任務數據時
+        """
+        response_data = await self.client.post(
+            self.base_endpoint,
+            content=template.render(**values),
+            priority=priority
         )
         return ScheduledTaskResponse(**response_data)
     
     async def get_all_tasks(
         self, 
-        state: Optional[TaskState] = None
+        state: Optional[TaskState] = None,
+        priority: Optional[PriorityLike] = None
     ) -> List[ScheduledTaskResponse]:
         """
         獲取所有排程任務
         
         Args:
             state: 可選的任務狀態過濾
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             任務列表
@@ -68,16 +125,142 @@ class SchedulerAPI:
         
         response_data = await self.client.get(
             self.base_endpoint,
-            params=params
+            params=params,
+            priority=priority
+        )
+        return await build_list(ScheduledTaskResponse.model_validate, response_data)
+    
+    async def get_all_task_records(
+        self,
+        state: Optional[TaskState] = None,
+        priority: Optional[PriorityLike] = None
+    ) -> List[TaskRecord]:
+        """
+        獲取所有排程任務的精簡記錄
+        
+        與 get_all_tasks 相同，但返回以 tuple 儲存的 TaskRecord，
+        適合將大量任務清單常駐於記憶體。
+        
+        Args:
+            state: 可選的任務狀態過濾
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+            
+        Returns:
+            任務記錄列表
+        """
+        params = {}
+        if state:
+            params["state"] = state.value
+        
+        response_data = await self.client.get(
+            self.base_endpoint,
+            params=params,
+            priority=priority
+        )
+        return await build_list(TaskRecord.from_dict, response_data)
+    
+    async def get_task_table(
+        self,
+        state: Optional[TaskState] = None,
+        priority: Optional[PriorityLike] = None
+    ) -> "TaskTable":
+        """
+        獲取所有排程任務並建立欄式任務表
+        
+        需要安裝 numpy：pip install "escheduler-sdk[table]"
+        
+        Args:
+            state: 可選的任務狀態過濾
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+            
+        Returns:
+            欄式任務表
+        """
+        from .table import TaskTable
+        
+        params = {}
+        if state:
+            params["state"] = state.value
+        
+        response_data = await self.client.get(
+            self.base_endpoint,
+            params=params,
+            priority=priority
         )
-        return [ScheduledTaskResponse(**task) for task in response_data]
+        return TaskTable.from_tasks(response_data)
+    
+    async def export_tasks(
+        self,
+        path: "PathLike",
+        format: Optional[str] = None,
+        state: Optional[TaskState] = None
+    ) -> int:
+        """
+        匯出所有排程任務到 NDJSON 或 Parquet 檔案
+        
+        Parquet 需要安裝 pyarrow：pip install "escheduler-sdk[parquet]"
+        
+        Args:
+            path: 輸出檔案路徑
+            format: "ndjson" 或 "parquet"，None 時依副檔名判斷
+            state: 可選的任務狀態過濾
+            
+        Returns:
+            匯出的任務數
+        """
+        from .transfer import export_tasks
+        
+        return await export_tasks(self, path, format=format, state=state)
     
-    async def get_task(self, task_id: int) -> ScheduledTaskResponse:
+    async def import_tasks(
+        self,
+        path: "PathLike",
+        format: Optional[str] = None,
+        concurrency: int = 10,
+        checkpoint: Optional["PathLike"] = None,
+        restore_state: bool = True
+    ) -> "ImportResult":
+        """
+        從 export_tasks 產生的檔案建立任務
+        
+        檔案逐塊讀取與驗證，建立請求以有上限的並發數送出。指定 checkpoint 時，
+        每個成功建立的任務都會記錄在檢查點檔案中，中斷後重新執行不會重複建立。
+        
+        Args:
+            path: 任務檔案路徑
+            format: "ndjson" 或 "parquet"，None 時依副檔名判斷
+            concurrency: 同時進行中的建立請求上限
+            checkpoint: 可選的檢查點檔案路徑
+            restore_state: 是否還原檔案中非 ENABLED 的任務狀態
+            
+        Returns:
+            匯入結果（建立、略過與失敗的任務數）
+            
+        Raises:
+            AuthenticationError: 當認證失敗時
+        """
+        from .transfer import import_tasks
+        
+        return await import_tasks(
+            self,
+            path,
+            format=format,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            restore_state=restore_state
+        )
+    
+    async def get_task(
+        self,
+        task_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> ScheduledTaskResponse:
         """
         獲取單個排程任務
         
         Args:
             task_id: 任務 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             任務信息
@@ -85,13 +268,17 @@ class SchedulerAPI:
         Raises:
             NotFoundError: 當任務不存在時
         """
-        response_data = await self.client.get(f"{self.base_endpoint}/{task_id}")
+        response_data = await self.client.get(
+            f"{self.base_endpoint}/{task_id}",
+            priority=priority
+        )
         return ScheduledTaskResponse(**response_data)
     
     async def update_task(
         self, 
         task_id: int, 
-        task_data: ScheduledTaskUpdate
+        task_data: ScheduledTaskUpdate,
+        priority: Optional[PriorityLike] = None
     ) -> ScheduledTaskResponse:
         """
         更新排程任務
@@ -99,6 +286,7 @@ class SchedulerAPI:
         Args:
             task_id: 任務 ID
             task_data: 任務更新數據
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             更新後的任務信息
@@ -109,16 +297,22 @@ class SchedulerAPI:
         """
         response_data = await self.client.put(
             f"{self.base_endpoint}/{task_id}",
-            json_data=task_data.model_dump(exclude_none=True)
+            json_data=task_data.model_dump(exclude_none=True),
+            priority=priority
         )
         return ScheduledTaskResponse(**response_data)
     
-    async def delete_task(self, task_id: int) -> MessageResponse:
+    async def delete_task(
+        self,
+        task_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> MessageResponse:
         """
         刪除排程任務
         
         Args:
             task_id: 任務 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             刪除結果消息
@@ -126,13 +320,17 @@ class SchedulerAPI:
         Raises:
             NotFoundError: 當任務不存在時
         """
-        response_data = await self.client.delete(f"{self.base_endpoint}/{task_id}")
+        response_data = await self.client.delete(
+            f"{self.base_endpoint}/{task_id}",
+            priority=priority
+        )
         return MessageResponse(**response_data)
     
     async def update_task_state(
         self, 
         task_id: int, 
-        state_data: TaskStateUpdateRequest
+        state_data: TaskStateUpdateRequest,
+        priority: Optional[PriorityLike] = None
     ) -> ScheduledTaskResponse:
         """
         更新任務狀態
@@ -140,6 +338,7 @@ class SchedulerAPI:
         Args:
             task_id: 任務 ID
             state_data: 狀態更新數據
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             更新後的任務信息
@@ -150,16 +349,22 @@ class SchedulerAPI:
         """
         response_data = await self.client.patch(
             f"{self.base_endpoint}/{task_id}/state",
-            json_data=state_data.model_dump()
+            json_data=state_data.model_dump(),
+            priority=priority
         )
         return ScheduledTaskResponse(**response_data)
     
-    async def trigger_task(self, task_id: int) -> MessageResponse:
+    async def trigger_task(
+        self,
+        task_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> MessageResponse:
         """
         手動觸發任務執行
         
         Args:
             task_id: 任務 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             觸發結果消息
@@ -167,25 +372,166 @@ class SchedulerAPI:
         Raises:
             NotFoundError: 當任務不存在時
         """
-        response_data = await self.client.post(f"{self.base_endpoint}/{task_id}/trigger")
+        response_data = await self.client.post(
+            f"{self.base_endpoint}/{task_id}/trigger",
+            priority=priority
+        )
         return MessageResponse(**response_data)
     
-    async def get_scheduler_stats(self) -> SchedulerStatsResponse:
+    async def trigger_and_wait(
+        self,
+        task_id: int,
+        timeout: Optional[float] = None,
+        priority: Optional[PriorityLike] = None
+    ) -> TaskExecutionResponse:
+        """
+        手動觸發任務並等待該次執行到達最終狀態
+
+        所有呼叫共用同一個 ExecutionWatcher 輪詢迴圈，每一輪對每個任務
+        只查詢一次執行記錄，不會為每個等待者各自輪詢。
+
+        Args:
+            task_id: 任務 ID
+            timeout: 整次呼叫（查詢基準、觸發與等待）的最長時間（秒），None 表示不限制
+            priority: 查詢基準與觸發請求的優先級，None 時使用 request_priority() 設定的值；
+                等待期間的輪詢由所有呼叫共用，使用輪詢器建立時的優先級
+
+        Returns:
+            到達 SUCCEEDED/FAILED/TIMEOUT/CANCELLED 狀態的執行記錄
+
+        Raises:
+            NotFoundError: 當任務不存在時
+            TimeoutError: 超過等待時間時（查詢基準或觸發逾時為其子類 DeadlineExceededError）
+        """
+        if self._execution_watcher is None:
+            self._execution_watcher = ExecutionWatcher(self)
+        watcher = self._execution_watcher
+
+        with request_deadline(timeout) as deadline:
+            after_id = await watcher.latest_execution_id(task_id, priority=priority)
+            await self.trigger_task(task_id, priority=priority)
+        return await watcher.wait(task_id, after_id, timeout=remaining_time(deadline))
+    
+    async def get_task_executions(
+        self,
+        task_id: int,
+        limit: Optional[int] = None,
+        summary: bool = False,
+        body_preview: int = DEFAULT_BODY_PREVIEW,
+        priority: Optional[PriorityLike] = None
+    ) -> List[TaskExecutionResponse]:
+        """
+        獲取任務執行記錄
+        
+        摘要模式下 response_body 只保留前 body_preview 個字元（0 表示省略），
+        並記錄完整內容的位元組數；需要完整內容時以
+        await execution.load_response_body() 取得單筆執行記錄。伺服器支援
+        summary/body_preview 參數時也會減少傳輸量。
+        
+        Args:
+            task_id: 任務 ID
+            limit: 可選的最大筆數（由新到舊）
+            summary: 是否只取得回應內容的摘要
+            body_preview: 摘要模式下保留的回應內容字元數
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+            
+        Returns:
+            執行記錄列表
+            
+        Raises:
+            NotFoundError: 當任務不存在時
+        """
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if summary:
+            params["summary"] = "true"
+            params["body_preview"] = body_preview
+        
+        response_data = await self.client.get(
+            f"{self.base_endpoint}/{task_id}/executions",
+            params=params,
+            priority=priority
+        )
+        if not summary:
+            return await build_list(TaskExecutionResponse.model_validate, response_data)
+
+        def convert(data: Dict[str, Any]) -> TaskExecutionResponse:
+            body = data.get("response_body")
+            if body is not None and not data.get("response_body_truncated"):
+                data["response_body_size"] = len(body) if body.isascii() else len(body.encode("utf-8"))
+                if len(body) > body_preview:
+                    data["response_body"] = body[:body_preview] or None
+                    data["response_body_truncated"] = True
+            execution = TaskExecutionResponse.model_validate(data)
+            if execution.response_body_truncated:
+                execution._body_loader = functools.partial(
+                    self._load_execution_body, execution.task_id, execution.id
+                )
+            return execution
+
+        return await build_list(convert, response_data)
+    
+    async def get_task_execution(
+        self,
+        task_id: int,
+        execution_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> TaskExecutionResponse:
+        """
+        獲取單筆執行記錄（包含完整回應內容）
+        
+        Args:
+            task_id: 任務 ID
+            execution_id: 執行記錄 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+            
+        Returns:
+            執行記錄
+            
+        Raises:
+            NotFoundError: 當任務或執行記錄不存在時
+        """
+        response_data = await self.client.get(
+            f"{self.base_endpoint}/{task_id}/executions/{execution_id}",
+            priority=priority
+        )
+        return TaskExecutionResponse(**response_data)
+    
+    async def _load_execution_body(self, task_id: int, execution_id: int) -> Optional[str]:
+        """摘要模式執行記錄的完整內容來源"""
+        return (await self.get_task_execution(task_id, execution_id)).response_body
+    
+    async def get_scheduler_stats(
+        self,
+        priority: Optional[PriorityLike] = None
+    ) -> SchedulerStatsResponse:
         """
         獲取排程器統計信息
         
+        Args:
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+        
         Returns:
             排程器統計數據
         """
-        response_data = await self.client.get(f"{self.base_endpoint}/stats")
+        response_data = await self.client.get(
+            f"{self.base_endpoint}/stats",
+            priority=priority
+        )
         return SchedulerStatsResponse(**response_data)
     
-    async def search_tasks(self, keyword: str) -> List[ScheduledTaskResponse]:
+    async def search_tasks(
+        self,
+        keyword: str,
+        priority: Optional[PriorityLike] = None
+    ) -> List[ScheduledTaskResponse]:
         """
         搜索排程任務
         
         Args:
             keyword: 搜索關鍵字
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             匹配的任務列表
@@ -193,46 +539,110 @@ class SchedulerAPI:
         params = {"keyword": keyword}
         response_data = await self.client.get(
             f"{self.base_endpoint}/search",
-            params=params
+            params=params,
+            priority=priority
         )
-        return [ScheduledTaskResponse(**task) for task in response_data]
+        return await build_list(ScheduledTaskResponse.model_validate, response_data)
+    
+    async def watch(
+        self,
+        interval: float = 5.0,
+        state: Optional[TaskState] = None,
+        emit_initial: bool = True,
+        priority: Optional[PriorityLike] = None
+    ) -> AsyncIterator[TaskChangeEvent]:
+        """
+        持續輪詢任務列表，只產出有變更的任務事件
+
+        每個任務在記憶體中只保存一個指紋整數，只有指紋變更的任務
+        才會被解析成模型，因此大量任務的輪詢成本主要在於 JSON 解碼。
+
+        Args:
+            interval: 輪詢間隔（秒），從每輪開始時計算
+            state: 可選的任務狀態過濾
+            emit_initial: 第一輪是否將既有任務作為 CREATED 事件產出
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+
+        Yields:
+            任務變更事件（created/updated/deleted）
+
+        Raises:
+            ESchedulerError: 輪詢請求失敗時
+        """
+        params = {}
+        if state:
+            params["state"] = state.value
+
+        index = TaskIndex()
+        first = True
+        while True:
+            started = time.monotonic()
+            response_data = await self.client.get(
+                self.base_endpoint, params=params,
+                priority=priority
+            )
+
+            if first and not emit_initial:
+                index.load(response_data)
+            else:
+                for event in index.diff(response_data):
+                    yield event
+            first = False
+
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, interval - elapsed))
     
     # 便利方法
-    async def enable_task(self, task_id: int) -> ScheduledTaskResponse:
+    async def enable_task(
+        self,
+        task_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> ScheduledTaskResponse:
         """
         啟用任務
         
         Args:
             task_id: 任務 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             更新後的任務信息
         """
         state_data = TaskStateUpdateRequest(state=TaskState.ENABLED)
-        return await self.update_task_state(task_id, state_data)
+        return await self.update_task_state(task_id, state_data, priority=priority)
     
-    async def disable_task(self, task_id: int) -> ScheduledTaskResponse:
+    async def disable_task(
+        self,
+        task_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> ScheduledTaskResponse:
         """
         禁用任務
         
         Args:
             task_id: 任務 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             更新後的任務信息
         """
         state_data = TaskStateUpdateRequest(state=TaskState.DISABLED)
-        return await self.update_task_state(task_id, state_data)
+        return await self.update_task_state(task_id, state_data, priority=priority)
     
-    async def pause_task(self, task_id: int) -> ScheduledTaskResponse:
+    async def pause_task(
+        self,
+        task_id: int,
+        priority: Optional[PriorityLike] = None
+    ) -> ScheduledTaskResponse:
         """
         暫停任務
         
         Args:
             task_id: 任務 ID
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             更新後的任務信息
         """
         state_data = TaskStateUpdateRequest(state=TaskState.PAUSED)
-        return await self.update_task_state(task_id, state_data)
\ No newline at end of file
+        return await self.update_task_state(task_id, state_data, priority=priority)
\ No newline at end of file
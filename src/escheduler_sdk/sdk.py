@@ -1,8 +1,12 @@
 """EScheduler SDK 主要類"""
 
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 from .client import ESchedulerClient
+from .compression import DEFAULT_COMPRESSION_THRESHOLD
+from .decoding import LARGE_RESPONSE_BYTES
+from .limiter import AdaptiveLimiter
+from .middleware import Middleware
 from .scheduler import SchedulerAPI
 from .team import TeamAPI
 
@@ -15,22 +19,35 @@ class ESchedulerSDK:
     
     def __init__(
         self,
-        base_url: str,
+        base_url: Union[str, Sequence[str]],
         token: Optional[str] = None,
         jwt_token: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        load_balancing: str = "ewma",
+        limiter: Union[str, AdaptiveLimiter, None] = None,
+        middlewares: Sequence[Middleware] = (),
+        large_response_bytes: Optional[int] = LARGE_RESPONSE_BYTES,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
         **kwargs
     ):
         """
         初始化 EScheduler SDK
         
         Args:
-            base_url: EScheduler API 基礎 URL
+            base_url: EScheduler API 基礎 URL，或多個副本的 URL 列表
             token: 團隊認證 token (4位字符)
             jwt_token: JWT 認證 token
             timeout: 請求超時時間（秒）
             max_retries: 最大重試次數
+            load_balancing: 多個 URL 時的端點選擇策略，"ewma" 或 "least_outstanding"
+            limiter: 自適應並發限制，"aimd"、"gradient" 或 AdaptiveLimiter 實例；預設 None 不限制，
+                超過上限的請求會排隊等待
+            middlewares: 自訂中介層，第一個位於最外層，見 escheduler_sdk.middleware
+            large_response_bytes: 超過此大小的回應分段解碼，不長時間阻塞事件迴圈；None 表示停用
+            compression: 請求內容壓縮格式，"auto"、"zstd"、"br" 或 "gzip"；None 表示停用（需要伺服器支援）
+            compression_threshold: 小於此大小（位元組）的請求內容不壓縮
             **kwargs: 其他 httpx.AsyncClient 參數
         """
         # 創建客戶端
@@ -40,6 +57,12 @@ class ESchedulerSDK:
             jwt_token=jwt_token,
             timeout=timeout,
             max_retries=max_retries,
+            load_balancing=load_balancing,
+            limiter=limiter,
+            middlewares=middlewares,
+            large_response_bytes=large_response_bytes,
+            compression=compression,
+            compression_threshold=compression_threshold,
             **kwargs
         )
         
@@ -59,6 +82,28 @@ class ESchedulerSDK:
         """關閉 SDK 連接"""
         await self.client.close()
     
+    async def warmup(self, connections: int = 10) -> int:
+        """
+        預先建立連線，讓第一批請求不需要等待 DNS、TCP 與 TLS 建立
+        
+        Args:
+            connections: 每個端點要建立的連線數，通常為預期的並發請求數
+            
+        Returns:
+            成功建立的連線數
+        """
+        return await self.client.warmup(connections)
+    
+    def start_keepalive(self, min_connections: int = 4, interval: float = 4.0) -> None:
+        """
+        在背景維持最少的暖連線，見 ESchedulerClient.start_keepalive
+        
+        Args:
+            min_connections: 每個端點維持的連線數
+            interval: 檢查間隔（秒）
+        """
+        self.client.start_keepalive(min_connections, interval)
+    
     async def authenticate(self, token: str) -> bool:
         """
         使用團隊 token 進行認證
@@ -0,0 +1,387 @@
+"""EScheduler SDK 本地任務搜尋索引
+
+TaskSearchIndex 以倒排索引保存 name、description 與 target_arn 的詞元，
+查詢在本地完成，適合輸入即搜尋的介面：
+
+- 英數詞元以非英數字元切分，查詢詞元以前綴比對，因此輸入到一半的字也能命中
+- 中日韓文字沒有分詞，連續的文字以每個後綴作為詞元，前綴比對即等同子字串比對
+- 查詢詞元沒有任何前綴命中時，以編輯距離 1 的變體（刪除、替換、插入、相鄰交換）
+  進行模糊比對
+- 多個查詢詞元之間為 AND，結果依任務 ID 排序，與 search_tasks 相同
+
+索引可隨任務變更增量更新，也可以直接套用 watch() 產生的 TaskChangeEvent。
+"""
+
+import functools
+import operator
+import re
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .enums import TaskChangeType
+from .models import ScheduledTaskResponse, TaskChangeEvent
+from .records import TaskRecord
+
+TaskLike = Union[Dict[str, Any], TaskRecord, ScheduledTaskResponse]
+# 索引中保存的任務：任務字典加入時轉換為 TaskRecord
+IndexedTask = Union[TaskRecord, ScheduledTaskResponse]
+
+SEARCH_FIELDS: Tuple[str, ...] = ("name", "description", "target_arn")
+
+_WORD = re.compile(r"[0-9a-z]+|[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff]+")
+_CJK_START = "\u3040"
+_FUZZY_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def tokenize(text: Optional[str], suffixes: bool = True) -> List[str]:
+    """
+    將文字切分為詞元
+
+    Args:
+        text: 要切分的文字
+        suffixes: 是否將中日韓文字的連續段落展開為所有後綴（建立索引時使用）
+
+    Returns:
+        小寫詞元列表
+    """
+    if not text:
+        return []
+    tokens: List[str] = []
+    for word in _WORD.findall(text.lower()):
+        if suffixes and word[0] >= _CJK_START:
+            tokens.extend(word[i:] for i in range(len(word)))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _edits(term: str) -> Set[str]:
+    """編輯距離為 1 的所有變體"""
+    alphabet = _FUZZY_ALPHABET if term[0] < _CJK_START else ""
+    splits = [(term[:i], term[i:]) for i in range(len(term) + 1)]
+    variants = {left + right[1:] for left, right in splits if right}
+    variants.update(left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1)
+    for left, right in splits:
+        for char in alphabet:
+            variants.add(left + char + right)
+            if right:
+                variants.add(left + char + right[1:])
+    variants.discard(term)
+    variants.discard("")
+    return variants
+
+
+class TaskSearchIndex:
+    """本地任務搜尋索引
+
+    每個任務佔用一個位置編號，倒排列表以位置集合儲存；命中任務數達到
+    dense_threshold 的詞元另外維護一個以整數表示的位元遮罩，寬鬆的查詢
+    （例如只輸入一兩個字元）以位元運算求交集，不需要逐一比對集合元素。
+
+    範例:
+        index = TaskSearchIndex.from_tasks(await sdk.scheduler.get_all_task_records())
+        tasks = await index.search_tasks("daily rep")   # 與 sdk.scheduler.search_tasks 相同的返回型別
+
+        async for event in sdk.scheduler.watch():
+            index.apply(event)
+    """
+
+    def __init__(
+        self,
+        fuzzy: bool = True,
+        min_fuzzy_length: int = 3,
+        dense_threshold: int = 512
+    ):
+        """
+        初始化空索引
+
+        Args:
+            fuzzy: 沒有前綴命中時是否進行模糊比對
+            min_fuzzy_length: 進行模糊比對的最短查詢詞元長度
+            dense_threshold: 倒排列表達到此長度時改以位元遮罩求交集
+        """
+        self.fuzzy = fuzzy
+        self.min_fuzzy_length = min_fuzzy_length
+        self.dense_threshold = dense_threshold
+        self._tasks: Dict[int, IndexedTask] = {}
+        self._task_tokens: Dict[int, Tuple[str, ...]] = {}
+        # 任務 ID <-> 位置編號；移除的位置為 None，累積過多時重建
+        self._slots: Dict[int, int] = {}
+        self._slot_ids: List[Optional[int]] = []
+        self._postings: Dict[str, Set[int]] = {}
+        self._masks: Dict[str, int] = {}
+        # 一兩個字元的前綴常命中大量詞元，快取其位元遮罩
+        self._prefix_masks: Dict[str, int] = {}
+        # 排序的詞彙表，供前綴比對使用二分搜尋
+        self._vocabulary: List[str] = []
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[TaskLike], **kwargs: Any) -> "TaskSearchIndex":
+        """
+        從任務清單建立索引
+
+        Args:
+            tasks: 任務字典、TaskRecord 或 ScheduledTaskResponse
+            **kwargs: 傳給建構函數的參數
+
+        Returns:
+            搜尋索引
+        """
+        index = cls(**kwargs)
+        index._build(tasks)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._tasks
+
+    def add(self, task: TaskLike) -> None:
+        """
+        新增或更新一個任務
+
+        Args:
+            task: 任務字典、TaskRecord 或 ScheduledTaskResponse
+        """
+        if isinstance(task, dict):
+            task = TaskRecord.from_dict(task)
+        task_id = task.id
+        tokens = self._tokens_of(task)
+        previous = self._task_tokens.get(task_id, ())
+
+        slot = self._slots.get(task_id)
+        if slot is None:
+            slot = self._slots[task_id] = len(self._slot_ids)
+            self._slot_ids.append(task_id)
+
+        for token in set(previous).difference(tokens):
+            self._unlink(token, slot)
+        for token in set(tokens).difference(previous):
+            self._link(token, slot)
+
+        self._tasks[task_id] = task
+        self._task_tokens[task_id] = tokens
+
+    def remove(self, task_id: int) -> None:
+        """
+        移除一個任務，不存在時不做任何事
+
+        Args:
+            task_id: 任務 ID
+        """
+        slot = self._slots.pop(task_id, None)
+        if slot is None:
+            return
+        del self._tasks[task_id]
+        self._slot_ids[slot] = None
+        for token in self._task_tokens.pop(task_id):
+            self._unlink(token, slot)
+
+        # 空位超過一半時重建，避免位元遮罩隨刪除無限增長
+        if len(self._slot_ids) > 1024 and len(self._slots) * 2 < len(self._slot_ids):
+            self._build([self._tasks[i] for i in self._slot_ids if i is not None])
+
+    def apply(self, event: TaskChangeEvent) -> None:
+        """
+        套用 watch() 產生的任務變更事件
+
+        Args:
+            event: 任務變更事件
+        """
+        if event.type == TaskChangeType.DELETED:
+            self.remove(event.task_id)
+        elif event.task is not None:
+            self.add(event.task)
+
+    def search(self, keyword: str, limit: Optional[int] = None) -> List[IndexedTask]:
+        """
+        搜尋任務
+
+        Args:
+            keyword: 搜尋關鍵字，多個詞元之間為 AND
+            limit: 可選的最大筆數
+
+        Returns:
+            依加入索引順序排列的任務（從任務列表建立時即為任務 ID 順序），
+            保持加入索引時的型別
+        """
+        terms = set(tokenize(keyword, suffixes=False))
+        if not terms:
+            return []
+
+        sets: List[Set[int]] = []
+        masks: List[int] = []
+        for term in terms:
+            matched = self._match(term)
+            if not matched:
+                return []
+            if isinstance(matched, int):
+                masks.append(matched)
+            else:
+                sets.append(matched)
+
+        if sets:
+            sets.sort(key=len)
+            matches = sets[0]
+            for other in sets[1:]:
+                matches = matches & other
+            if masks:
+                mask = functools.reduce(operator.and_, masks)
+                bits = mask.to_bytes((len(self._slot_ids) >> 3) + 1, "little")
+                matches = {slot for slot in matches if bits[slot >> 3] >> (slot & 7) & 1}
+            slots: Iterable[int] = sorted(matches)[:limit]
+        else:
+            slots = _mask_slots(functools.reduce(operator.and_, masks), len(self._slot_ids), limit)
+
+        slot_ids = self._slot_ids
+        task_ids = (slot_ids[slot] for slot in slots)
+        # 已移除的位置不在倒排索引中，實際上不會過濾掉任何任務
+        return [self._tasks[task_id] for task_id in task_ids if task_id is not None]
+
+    async def search_tasks(self, keyword: str, limit: Optional[int] = None) -> List[ScheduledTaskResponse]:
+        """
+        與 SchedulerAPI.search_tasks 相同形式的本地搜尋
+
+        Args:
+            keyword: 搜尋關鍵字
+            limit: 可選的最大筆數
+
+        Returns:
+            匹配的任務列表
+        """
+        return [
+            task if isinstance(task, ScheduledTaskResponse) else task.to_response()
+            for task in self.search(keyword, limit=limit)
+        ]
+
+    def _build(self, tasks: Iterable[TaskLike]) -> None:
+        """清空並以任務 ID 順序重新建立索引"""
+        records = [TaskRecord.from_dict(task) if isinstance(task, dict) else task for task in tasks]
+        records.sort(key=lambda task: task.id)
+
+        self._tasks = {task.id: task for task in records}
+        self._slot_ids = list(self._tasks)
+        self._slots = {task_id: slot for slot, task_id in enumerate(self._tasks)}
+        self._task_tokens = {}
+        postings: Dict[str, Set[int]] = {}
+        for slot, task in enumerate(self._tasks.values()):
+            tokens = self._task_tokens[task.id] = self._tokens_of(task)
+            for token in tokens:
+                slots = postings.get(token)
+                if slots is None:
+                    postings[token] = {slot}
+                else:
+                    slots.add(slot)
+
+        size = len(self._slot_ids)
+        self._postings = postings
+        self._masks = {
+            token: _to_mask(slots, size)
+            for token, slots in postings.items()
+            if len(slots) >= self.dense_threshold
+        }
+        self._prefix_masks = {}
+        self._vocabulary = sorted(postings)
+
+    def _tokens_of(self, task: Union[TaskRecord, ScheduledTaskResponse]) -> Tuple[str, ...]:
+        tokens: Dict[str, None] = {}
+        for field in SEARCH_FIELDS:
+            tokens.update(dict.fromkeys(tokenize(getattr(task, field))))
+        return tuple(tokens)
+
+    def _link(self, token: str, slot: int) -> None:
+        for prefix in {token[:1], token[:2]}:
+            if prefix in self._prefix_masks:
+                self._prefix_masks[prefix] |= 1 << slot
+        slots = self._postings.get(token)
+        if slots is None:
+            self._postings[token] = {slot}
+            insort(self._vocabulary, token)
+            return
+        slots.add(slot)
+        if token in self._masks:
+            self._masks[token] |= 1 << slot
+        elif len(slots) >= self.dense_threshold:
+            self._masks[token] = _to_mask(slots, len(self._slot_ids))
+
+    def _unlink(self, token: str, slot: int) -> None:
+        # 同一任務可能仍有其他詞元以相同前綴開頭，因此直接捨棄快取
+        self._prefix_masks.pop(token[:1], None)
+        self._prefix_masks.pop(token[:2], None)
+        slots = self._postings[token]
+        slots.discard(slot)
+        if token in self._masks:
+            if len(slots) * 2 < self.dense_threshold:
+                del self._masks[token]
+            else:
+                self._masks[token] &= ~(1 << slot)
+        if not slots:
+            del self._postings[token]
+            vocabulary = self._vocabulary
+            del vocabulary[bisect_left(vocabulary, token)]
+
+    def _match(self, term: str) -> Union[Set[int], int]:
+        """
+        單一查詢詞元命中的位置：前綴命中優先，沒有時才模糊比對
+
+        命中數少時返回位置集合，否則返回位元遮罩。
+        """
+        cached = self._prefix_masks.get(term)
+        if cached is not None:
+            return cached
+
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, term)
+        end = bisect_left(vocabulary, term + "\U0010ffff", start)
+        tokens: Iterable[str] = vocabulary[start:end]
+        if start == end:
+            if not self.fuzzy or len(term) < self.min_fuzzy_length:
+                return set()
+            tokens = [variant for variant in _edits(term) if variant in self._postings]
+
+        postings = self._postings
+        masks = self._masks
+        total = 0
+        dense = False
+        for token in tokens:
+            total += len(postings[token])
+            dense = dense or token in masks
+        if not dense and total < self.dense_threshold:
+            return set().union(*(postings[token] for token in tokens))
+
+        mask = _to_mask(
+            (slot for token in tokens if token not in masks for slot in postings[token]),
+            len(self._slot_ids)
+        )
+        for token in tokens:
+            if token in masks:
+                mask |= masks[token]
+        if len(term) <= 2 and start != end:
+            self._prefix_masks[term] = mask
+        return mask
+
+
+def _to_mask(slots: Iterable[int], size: int) -> int:
+    """將位置集合轉換為位元遮罩"""
+    buffer = bytearray((size >> 3) + 1)
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
+
+
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+
+def _mask_slots(mask: int, size: int, limit: Optional[int]) -> List[int]:
+    """依序取出位元遮罩中的位置，最多 limit 個"""
+    slots: List[int] = []
+    for match in _NONZERO_BYTE.finditer(mask.to_bytes((size >> 3) + 1, "little")):
+        base = match.start() << 3
+        byte = match.group()[0]
+        for bit in range(8):
+            if byte >> bit & 1:
+                slots.append(base + bit)
+                if limit is not None and len(slots) >= limit:
+                    return slots
+    return slots
@@ -0,0 +1,368 @@
+"""EScheduler SDK 欄式任務表
+
+以 NumPy 陣列按欄位儲存任務清單：時間欄位為 datetime64[us]（UTC），
+狀態、目標類型等列舉類欄位以類別編碼儲存，過濾、分組計數與排序
+都以向量化運算完成。
+
+需要安裝 numpy：pip install "escheduler-sdk[table]"
+"""
+
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - 取決於安裝環境
+    raise ImportError(
+        'TaskTable 需要 numpy，請執行 pip install "escheduler-sdk[table]"'
+    ) from e
+
+from .enums import TaskState
+from .models import ScheduledTaskResponse
+from .records import TaskRecord, parse_datetime
+
+
+CATEGORICAL_COLUMNS: Tuple[str, ...] = ("schedule_expression", "timezone", "target_type", "state")
+DATETIME_COLUMNS: Tuple[str, ...] = (
+    "last_execution_time", "next_execution_time", "created_at", "updated_at",
+)
+INTEGER_COLUMNS: Tuple[str, ...] = ("id", "execution_count", "max_retry_attempts")
+OBJECT_COLUMNS: Tuple[str, ...] = (
+    "name", "description", "target_arn", "target_input", "retry_policy", "dead_letter_config",
+)
+# sort_by 可用的欄位；字典欄位沒有順序
+SORTABLE_COLUMNS: Tuple[str, ...] = (
+    INTEGER_COLUMNS + ("name", "description", "target_arn")
+    + CATEGORICAL_COLUMNS + DATETIME_COLUMNS
+)
+
+TaskLike = Union[Dict[str, Any], TaskRecord, ScheduledTaskResponse]
+
+
+def _to_utc_naive(value: Any) -> Optional[datetime]:
+    """轉換為 UTC 的 naive datetime，沒有時區資訊的值視為 UTC"""
+    parsed: Optional[datetime] = parse_datetime(value)
+    if parsed is not None and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NAT = np.iinfo(np.int64).min
+
+
+def _to_epoch_micros(value: Any) -> int:
+    """轉換為 UTC epoch 微秒數，None 轉換為 NaT"""
+    parsed = _to_utc_naive(value)
+    if parsed is None:
+        return _NAT
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+def _as_datetime64(value: Union[datetime, np.datetime64]) -> np.datetime64:
+    """將 datetime 轉換為 UTC 的 datetime64[us]"""
+    if isinstance(value, datetime):
+        converted: np.datetime64 = np.datetime64(_to_utc_naive(value), "us")
+    else:
+        converted = value.astype("datetime64[us]")
+    return converted
+
+
+def _task_values(task: TaskLike) -> Dict[str, Any]:
+    """取得任務的欄位字典"""
+    if isinstance(task, dict):
+        return task
+    if isinstance(task, TaskRecord):
+        return task._asdict()
+    return task.__dict__
+
+
+class TaskTable:
+    """欄式任務表
+
+    範例:
+        table = await sdk.scheduler.get_task_table()
+        table.count_by("state")                    # {"ENABLED": 120, ...}
+        overdue = table.where(state=TaskState.ENABLED).overdue()
+        latest = table.sort_by("updated_at", descending=True)[:10]
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        categories: Dict[str, List[str]]
+    ):
+        """
+        以既有的欄位陣列建立任務表，一般請使用 TaskTable.from_tasks
+
+        Args:
+            columns: 欄位名稱對應等長的 NumPy 陣列（類別欄位為編碼陣列）
+            categories: 類別欄位的類別值列表，編碼即為列表索引
+        """
+        self._columns = columns
+        self._categories = categories
+        self._category_codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in categories.items()
+        }
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[TaskLike]) -> "TaskTable":
+        """
+        從任務字典、TaskRecord 或 ScheduledTaskResponse 建立任務表
+
+        Args:
+            tasks: 任務的可迭代物件（可以是串流的迭代器）
+
+        Returns:
+            任務表
+        """
+        rows = [_task_values(task) for task in tasks]
+        columns: Dict[str, np.ndarray] = {}
+        categories: Dict[str, List[str]] = {}
+
+        for name in INTEGER_COLUMNS:
+            columns[name] = np.array([row[name] for row in rows], dtype=np.int64)
+        for name in OBJECT_COLUMNS:
+            column = np.empty(len(rows), dtype=object)
+            column[:] = [row.get(name) for row in rows]
+            columns[name] = column
+        for name in CATEGORICAL_COLUMNS:
+            mapping: Dict[Any, int] = {}
+            codes = [mapping.setdefault(row.get(name), len(mapping)) for row in rows]
+            columns[name] = np.array(codes, dtype=np.int32)
+            categories[name] = [
+                value.value if isinstance(value, Enum) else value for value in mapping
+            ]
+        for name in DATETIME_COLUMNS:
+            raw_values = [row.get(name) for row in rows]
+            # 相同的時間值只解析一次，並直接轉為微秒整數以避免逐一轉換 datetime 物件
+            parsed = {raw: _to_epoch_micros(raw) for raw in set(raw_values)}
+            micros = np.array([parsed[raw] for raw in raw_values], dtype=np.int64)
+            columns[name] = micros.view("datetime64[us]")
+
+        return cls(columns, categories)
+
+    def __len__(self) -> int:
+        return len(self._columns["id"])
+
+    def __iter__(self) -> Iterator[TaskRecord]:
+        return (self.row(i) for i in range(len(self)))
+
+    @overload
+    def __getitem__(self, key: Union[int, np.integer]) -> TaskRecord: ...
+
+    @overload
+    def __getitem__(self, key: Union[slice, np.ndarray]) -> "TaskTable": ...
+
+    def __getitem__(
+        self, key: Union[int, np.integer, slice, np.ndarray]
+    ) -> Union[TaskRecord, "TaskTable"]:
+        """整數索引返回 TaskRecord，切片、布林遮罩或索引陣列返回新的任務表"""
+        if isinstance(key, (int, np.integer)):
+            return self.row(int(key))
+        return TaskTable(
+            {name: column[key] for name, column in self._columns.items()},
+            self._categories
+        )
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        """所有欄位名稱"""
+        return INTEGER_COLUMNS + OBJECT_COLUMNS + CATEGORICAL_COLUMNS + DATETIME_COLUMNS
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        取得欄位陣列
+
+        Args:
+            name: 欄位名稱
+
+        Returns:
+            欄位陣列；類別欄位會解碼為字串物件陣列
+        """
+        column = self._columns[name]
+        if name in self._categories:
+            decoded: np.ndarray = np.array(self._categories[name], dtype=object)[column]
+            return decoded
+        return column
+
+    def codes(self, name: str) -> Tuple[np.ndarray, List[str]]:
+        """
+        取得類別欄位的編碼陣列與類別值列表
+
+        Args:
+            name: 類別欄位名稱
+
+        Returns:
+            (編碼陣列, 類別值列表)
+        """
+        return self._columns[name], self._categories[name]
+
+    def row(self, index: int) -> TaskRecord:
+        """
+        取得單列任務記錄
+
+        Args:
+            index: 列索引
+
+        Returns:
+            任務記錄，時間欄位為 UTC datetime
+        """
+        values: Dict[str, Any] = {}
+        for name in INTEGER_COLUMNS:
+            values[name] = int(self._columns[name][index])
+        for name in OBJECT_COLUMNS:
+            values[name] = self._columns[name][index]
+        for name in CATEGORICAL_COLUMNS:
+            values[name] = self._categories[name][self._columns[name][index]]
+        for name in DATETIME_COLUMNS:
+            value = self._columns[name][index]
+            values[name] = (
+                None if np.isnat(value)
+                else value.astype(datetime).replace(tzinfo=timezone.utc)
+            )
+        return TaskRecord(**values)
+
+    def to_records(self) -> List[TaskRecord]:
+        """轉換為 TaskRecord 列表"""
+        return list(self)
+
+    # 向量化查詢
+
+    def mask(self, **conditions: Any) -> np.ndarray:
+        """
+        建立符合所有條件的布林遮罩
+
+        Args:
+            **conditions: 欄位名稱對應值；類別欄位可傳入單一值或多個值的列表
+
+        Returns:
+            布林遮罩陣列
+        """
+        result = np.ones(len(self), dtype=bool)
+        for name, expected in conditions.items():
+            if expected is None:
+                continue
+            column = self._columns[name]
+            if name in self._categories:
+                wanted = expected if isinstance(expected, (list, tuple, set, frozenset)) else [expected]
+                mapping = self._category_codes[name]
+                codes = [mapping[value] for value in wanted if value in mapping]
+                if len(codes) == 1:
+                    result &= column == codes[0]
+                else:
+                    result &= np.isin(column, codes)
+            else:
+                result &= column == expected
+        return result
+
+    def where(self, **conditions: Any) -> "TaskTable":
+        """
+        過濾符合所有條件的任務
+
+        Args:
+            **conditions: 與 mask() 相同
+
+        Returns:
+            過濾後的任務表
+        """
+        return self[self.mask(**conditions)]
+
+    def overdue(
+        self,
+        now: Optional[datetime] = None,
+        grace: timedelta = timedelta(0)
+    ) -> "TaskTable":
+        """
+        找出 next_execution_time 早於 now - grace 的任務
+
+        Args:
+            now: 比較基準時間，預設為目前的 UTC 時間
+            grace: 容許的延遲
+
+        Returns:
+            過期任務的任務表
+        """
+        now = now or datetime.now(timezone.utc)
+        threshold = _as_datetime64(now) - np.timedelta64(int(grace.total_seconds() * 1e6), "us")
+        return self[self._columns["next_execution_time"] < threshold]
+
+    def count_by(self, name: str) -> Dict[str, int]:
+        """
+        以類別欄位分組計數
+
+        Args:
+            name: 類別欄位名稱（state、target_type、timezone、schedule_expression）
+
+        Returns:
+            類別值對應任務數（不含計數為 0 的類別）
+        """
+        categories = self._categories[name]
+        counts = np.bincount(self._columns[name], minlength=len(categories))
+        return {categories[code]: int(count) for code, count in enumerate(counts) if count}
+
+    def sort_by(self, name: str, descending: bool = False) -> "TaskTable":
+        """
+        依欄位排序（穩定排序）
+
+        遞增與遞減排序都保持相同值的原有順序；None 與 NaT 無論方向都排在最後。
+
+        Args:
+            name: 欄位名稱；類別欄位依類別值字串排序。target_input 等字典欄位不能排序
+            descending: 是否遞減排序
+
+        Returns:
+            排序後的任務表
+
+        Raises:
+            ValueError: 欄位不存在或不能排序時
+        """
+        if name not in SORTABLE_COLUMNS:
+            raise ValueError(
+                f"不能依欄位 {name!r} 排序，可排序的欄位: {', '.join(SORTABLE_COLUMNS)}"
+            )
+
+        column = self._columns[name]
+        missing: Optional[np.ndarray] = None
+        if name in self._categories:
+            ranks = np.argsort(np.argsort(np.array(self._categories[name], dtype=object)))
+            key = ranks[column]
+        elif name in DATETIME_COLUMNS:
+            missing = np.isnat(column)
+            key = column.view(np.int64)
+        elif name in OBJECT_COLUMNS:
+            missing = np.array([value is None for value in column], dtype=bool)
+            key = np.zeros(len(column), dtype=np.int64)
+            key[~missing] = np.unique(column[~missing], return_inverse=True)[1]
+        else:
+            key = column
+
+        if missing is not None and not missing.any():
+            missing = None
+        if descending:
+            # 反轉排序鍵而非排序結果，相同值保持原有順序
+            key = -key if missing is None else np.where(missing, 0, -key)
+        if missing is None:
+            order = np.argsort(key, kind="stable")
+        else:
+            # lexsort 以最後一個鍵為主鍵，且為穩定排序
+            order = np.lexsort((key, missing))
+        return self[order]
+
+    def task_stats(self) -> Dict[str, int]:
+        """
+        在本地計算 SchedulerStatsResponse 中的任務數欄位
+
+        Returns:
+            total_tasks、enabled_tasks、disabled_tasks 與 paused_tasks
+        """
+        counts = self.count_by("state")
+        return {
+            "total_tasks": len(self),
+            "enabled_tasks": counts.get(TaskState.ENABLED.value, 0),
+            "disabled_tasks": counts.get(TaskState.DISABLED.value, 0),
+            "paused_tasks": counts.get(TaskState.PAUSED.value, 0),
+        }
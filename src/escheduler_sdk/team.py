@@ -3,6 +3,7 @@
 from typing import List, Optional
 
 from .client import ESchedulerClient
+from .limiter import PriorityLike
 from .models import (
     Team,
     TeamAuthRequest,
@@ -23,10 +24,16 @@ class TeamAPI:
         self.client = client
         self.base_endpoint = "/api/team"
     
-    async def get_all_teams(self) -> List[Team]:
+    async def get_all_teams(
+        self,
+        priority: Optional[PriorityLike] = None
+    ) -> List[Team]:
         """
         取得所有團隊
         
+        Args:
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
+            
         Returns:
             團隊列表
             
@@ -34,15 +41,20 @@ class TeamAPI:
             AuthenticationError: 當認證失敗時
             ESchedulerError: 其他 API 錯誤
         """
-        response_data = await self.client.get(self.base_endpoint)
+        response_data = await self.client.get(self.base_endpoint, priority=priority)
         return [Team(**team) for team in response_data]
     
-    async def get_team_by_token(self, token: str) -> Optional[Team]:
+    async def get_team_by_token(
+        self,
+        token: str,
+        priority: Optional[PriorityLike] = None
+    ) -> Optional[Team]:
         """
         透過 Token 認證團隊
         
         Args:
             token: 團隊認證 token (4位字符)
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             團隊信息，如果 token 無效則返回 None
@@ -51,17 +63,25 @@ class TeamAPI:
             ValidationError: 當 token 格式不正確時
             ESchedulerError: 其他 API 錯誤
         """
-        response_data = await self.client.get(f"{self.base_endpoint}/{token}/")
+        response_data = await self.client.get(
+            f"{self.base_endpoint}/{token}/",
+            priority=priority
+        )
         if response_data:
             return Team(**response_data)
         return None
     
-    async def auth_team(self, token: str) -> TeamAuthResponse:
+    async def auth_team(
+        self,
+        token: str,
+        priority: Optional[PriorityLike] = None
+    ) -> TeamAuthResponse:
         """
         團隊認證並取得 JWT Token
         
         Args:
             token: 團隊認證 token (4位字符)
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             認證結果，包含團隊信息和 JWT token
@@ -74,11 +94,16 @@ class TeamAPI:
         auth_request = TeamAuthRequest(token=token)
         response_data = await self.client.post(
             f"{self.base_endpoint}/auth/token/",
-            json_data=auth_request.model_dump()
+            json_data=auth_request.model_dump(),
+            priority=priority
         )
         return TeamAuthResponse(**response_data)
     
-    async def auth_and_set_token(self, token: str) -> TeamAuthResponse:
+    async def auth_and_set_token(
+        self,
+        token: str,
+        priority: Optional[PriorityLike] = None
+    ) -> TeamAuthResponse:
         """
         團隊認證並自動設置 JWT Token 到客戶端
         
@@ -87,6 +112,7 @@ class TeamAPI:
         
         Args:
             token: 團隊認證 token (4位字符)
+            priority: 請求優先級，None 時使用 request_priority() 設定的值
             
         Returns:
             認證結果，包含團隊信息和 JWT token
@@ -96,7 +122,7 @@ class TeamAPI:
             ValidationError: 當 token 格式不正確時
             ESchedulerError: 其他 API 錯誤
         """
-        auth_response = await self.auth_team(token)
+        auth_response = await self.auth_team(token, priority=priority)
         
         # 如果認證成功且有 JWT token，自動設置到客戶端
         if auth_response.status and auth_response.access_token:
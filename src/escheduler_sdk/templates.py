@@ -0,0 +1,162 @@
+"""EScheduler SDK 任務範本
+
+大量建立幾乎相同的任務時，每個任務重新建立 ScheduledTaskCreate、執行驗證器
+並 model_dump 是主要的 CPU 成本。TaskTemplate 只驗證與序列化共用部分一次，
+得到以變數位置切開的 JSON 片段；每個任務只驗證並編碼變數的值，再與片段串接
+成請求內容。
+"""
+
+import json
+import re
+from enum import Enum
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .models import ScheduledTaskCreate
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode
+_encode_string = json.encoder.encode_basestring
+
+
+def _encode_value(value: Any) -> bytes:
+    """將單一值編碼為 JSON 片段"""
+    # 最常見的變數（名稱、ID）略過 JSONEncoder.encode 每次建立編碼器的成本
+    value_type = type(value)
+    if value_type is str:
+        return _encode_string(value).encode("utf-8")
+    if value_type is int:
+        return str(value).encode("ascii")
+    if value is None:
+        return b"null"
+    if isinstance(value, Enum):
+        value = value.value
+    return _encode(value).encode("utf-8")
+
+
+class TaskTemplate:
+    """預先序列化的任務創建範本
+
+    範例:
+        template = TaskTemplate(
+            ScheduledTaskCreate(
+                name="sync",
+                schedule_expression="rate(5 minutes)",
+                target_type=TargetType.HTTP,
+                target_arn="https://example.com/sync",
+                target_input={"region": "ap-northeast-1", "shard": 0}
+            ),
+            fields=("name",),
+            input_keys=("shard",)
+        )
+        body = template.render(name="sync-42", shard=42)
+        await sdk.scheduler.create_task_from_template(template, name="sync-42", shard=42)
+    """
+
+    def __init__(
+        self,
+        base: ScheduledTaskCreate,
+        fields: Sequence[str] = ("name",),
+        input_keys: Sequence[str] = ()
+    ):
+        """
+        初始化任務範本
+
+        Args:
+            base: 共用的任務創建數據，同時提供每個變數的預設值
+            fields: 每個任務可以不同的頂層欄位，例如 name、description；
+                base 中為 None 的欄位預設編碼為 null
+            input_keys: 每個任務可以不同的 target_input 鍵，必須存在於 base.target_input
+
+        Raises:
+            ValueError: 當變數名稱不存在、重複或缺少預設值時
+        """
+        unknown = [name for name in fields if name not in ScheduledTaskCreate.model_fields]
+        if unknown:
+            raise ValueError(f"ScheduledTaskCreate 沒有欄位: {', '.join(unknown)}")
+        if "target_input" in fields and input_keys:
+            raise ValueError("target_input 整體作為變數時不能再指定 input_keys")
+        names = list(fields) + list(input_keys)
+        if len(set(names)) != len(names):
+            raise ValueError(f"變數名稱重複: {', '.join(names)}")
+        missing = [key for key in input_keys if key not in (base.target_input or {})]
+        if missing:
+            raise ValueError(f"target_input 沒有鍵: {', '.join(missing)}，範本需要預設值")
+
+        self.base = base
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.input_keys: Tuple[str, ...] = tuple(input_keys)
+        # 驗證頂層欄位時借用的實例，validate_assignment 會執行欄位限制與驗證器
+        self._scratch = base.model_copy()
+        self._validate_assignment = ScheduledTaskCreate.__pydantic_validator__.validate_assignment
+
+        data = base.model_dump(mode="json", exclude_none=True)
+        defaults: Dict[str, bytes] = {}
+        markers: List[str] = []
+        for i, name in enumerate(names):
+            marker = f"\x00{i}\x00"
+            markers.append(marker)
+            if name in self.fields:
+                defaults[name] = _encode_value(data.get(name))
+                data[name] = marker
+            else:
+                defaults[name] = _encode_value(data["target_input"][name])
+                data["target_input"][name] = marker
+
+        # 以變數位置切開編碼結果：片段數 = 變數數 + 1，變數依出現順序排列
+        encoded = _encode(data)
+        pattern = "|".join(re.escape(_encode(marker)) for marker in markers)
+        parts = re.split(f"({pattern})", encoded) if markers else [encoded]
+        self._segments: Tuple[bytes, ...] = tuple(part.encode("utf-8") for part in parts[::2])
+        order = {_encode(marker): name for marker, name in zip(markers, names)}
+        self._slots: Tuple[str, ...] = tuple(order[part] for part in parts[1::2])
+        self._defaults = defaults
+
+    @property
+    def variables(self) -> Tuple[str, ...]:
+        """所有變數名稱"""
+        return self.fields + self.input_keys
+
+    def render(self, **values: Any) -> bytes:
+        """
+        產生單一任務的請求內容
+
+        頂層欄位的值經過與 ScheduledTaskCreate 相同的驗證；target_input 的值只需要
+        能以 JSON 編碼。未提供的變數使用範本的預設值。
+
+        Args:
+            **values: 變數名稱對應的值
+
+        Returns:
+            JSON 編碼的請求內容
+
+        Raises:
+            ValueError: 當變數名稱不存在或欄位值驗證失敗時
+        """
+        encoded = self._defaults.copy()
+        for name, value in values.items():
+            if name in self.input_keys:
+                encoded[name] = _encode_value(value)
+            elif name in self.fields:
+                self._validate_assignment(self._scratch, name, value)
+                encoded[name] = _encode_value(getattr(self._scratch, name))
+            else:
+                raise ValueError(f"範本沒有變數: {name}")
+
+        segments = self._segments
+        parts = [segments[0]]
+        for i, name in enumerate(self._slots, start=1):
+            parts.append(encoded[name])
+            parts.append(segments[i])
+        return b"".join(parts)
+
+    def to_create(self, **values: Any) -> ScheduledTaskCreate:
+        """
+        以變數值建立完整的 ScheduledTaskCreate（用於除錯或與一般建立方式比對）
+
+        Args:
+            **values: 變數名稱對應的值
+        """
+        return ScheduledTaskCreate.model_validate_json(self.render(**values))
+
+    def __repr__(self) -> str:
+        return f"TaskTemplate(name={self.base.name!r}, variables={self.variables})"
+
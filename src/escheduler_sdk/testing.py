@@ -0,0 +1,640 @@
+"""EScheduler SDK 本地模擬伺服器
+
+在行程內實作 SDK 使用到的 /api/scheduler 與 /api/team 端點，
+可作為 httpx.MockTransport 或 ASGI 應用程式使用，用於離線測試與基準測試。
+
+範例:
+    fake = FakeEScheduler(latency=0.005, error_rate=0.01)
+    fake.seed_tasks(100_000)
+    async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+        tasks = await sdk.scheduler.get_all_tasks()
+"""
+
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qs
+
+import httpx
+
+from .compression import available_encodings, compress, decompress, encode_json
+
+
+# 任務以 tuple 儲存以降低大量任務時的記憶體用量，欄位順序如下
+TASK_FIELDS: Tuple[str, ...] = (
+    "id",
+    "name",
+    "description",
+    "schedule_expression",
+    "timezone",
+    "target_type",
+    "target_arn",
+    "target_input",
+    "state",
+    "last_execution_time",
+    "next_execution_time",
+    "execution_count",
+    "max_retry_attempts",
+    "retry_policy",
+    "dead_letter_config",
+    "created_at",
+    "updated_at",
+)
+_FIELD_INDEX = {name: i for i, name in enumerate(TASK_FIELDS)}
+
+_WRITABLE_FIELDS = frozenset({
+    "name", "description", "schedule_expression", "timezone", "target_type",
+    "target_arn", "target_input", "state", "max_retry_attempts",
+    "retry_policy", "dead_letter_config",
+})
+_REQUIRED_FIELDS = ("name", "schedule_expression", "target_type", "target_arn")
+_TASK_STATES = ("ENABLED", "DISABLED", "PAUSED")
+
+_TASK_PATH = re.compile(r"^/api/scheduler/(\d+)$")
+_TASK_ACTION_PATH = re.compile(r"^/api/scheduler/(\d+)/(state|trigger|executions)$")
+_EXECUTION_PATH = re.compile(r"^/api/scheduler/(\d+)/executions/(\d+)$")
+_TEAM_TOKEN_PATH = re.compile(r"^/api/team/([^/]+)/?$")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _reason_phrase(status_code: int) -> str:
+    """HTTP 狀態碼的原因短語"""
+    try:
+        return HTTPStatus(status_code).phrase
+    except ValueError:
+        return ""
+
+
+def _negotiate_encoding(accept: str) -> Optional[str]:
+    """從 Accept-Encoding 選出 q 值最高且可用的壓縮格式"""
+    available = available_encodings()
+    best, best_q = None, 0.0
+    for item in accept.split(","):
+        encoding, _, params = item.strip().partition(";")
+        q = float(params.strip()[2:]) if params.strip().startswith("q=") else 1.0
+        if encoding in available and q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _summarize_execution(execution: Dict[str, Any], preview: int) -> Dict[str, Any]:
+    """截斷執行記錄的回應內容，並記錄完整內容的位元組數"""
+    body = execution["response_body"]
+    if body is not None:
+        execution["response_body_size"] = len(body.encode("utf-8"))
+        if len(body) > preview:
+            execution["response_body"] = body[:preview] or None
+            execution["response_body_truncated"] = True
+    return execution
+
+
+class FakeEScheduler:
+    """行程內的 EScheduler 模擬伺服器
+
+    提供可設定的延遲、錯誤注入（429/5xx/逾時/連線錯誤）以及
+    能容納百萬級任務的記憶體儲存。
+    """
+
+    def __init__(
+        self,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        error_rate: float = 0.0,
+        error_status_codes: Sequence[int] = (429, 500, 502, 503),
+        timeout_rate: float = 0.0,
+        network_error_rate: float = 0.0,
+        execution_duration: float = 0.0,
+        execution_response_body: str = "{}",
+        compress_responses: bool = False,
+        teams: Optional[Dict[str, str]] = None,
+        require_auth: bool = False,
+        seed: Optional[int] = None
+    ):
+        """
+        初始化模擬伺服器
+
+        Args:
+            latency: 每個請求的延遲（秒），或返回延遲的函數
+            error_rate: 隨機返回 error_status_codes 之一的機率
+            error_status_codes: 注入錯誤時使用的 HTTP 狀態碼
+            timeout_rate: 隨機拋出 httpx.ReadTimeout 的機率
+            network_error_rate: 隨機拋出 httpx.ConnectError 的機率
+            execution_duration: 觸發後執行記錄從 RUNNING 到 SUCCEEDED 所需時間（秒）
+            execution_response_body: 執行成功時記錄的回應內容
+            compress_responses: 是否依 Accept-Encoding 壓縮 1 KiB 以上的回應
+            teams: 團隊 token 對應團隊名稱，預設為 {"ABCD": "第1小隊"}
+            require_auth: 排程端點是否要求 Bearer token
+            seed: 錯誤注入使用的亂數種子
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status_codes = tuple(error_status_codes)
+        self.timeout_rate = timeout_rate
+        self.network_error_rate = network_error_rate
+        self.execution_duration = execution_duration
+        self.execution_response_body = execution_response_body
+        self.compress_responses = compress_responses
+        self.require_auth = require_auth
+        self._random = random.Random(seed)
+
+        self._tasks: Dict[int, tuple] = {}
+        self._executions: Dict[int, List[Dict[str, Any]]] = {}
+        self._next_task_id = 1
+        self._next_execution_id = 1
+        self._forced_failures: List[Union[int, type]] = []
+
+        team_names = teams if teams is not None else {"ABCD": "第1小隊"}
+        self._teams: Dict[str, Dict[str, Any]] = {
+            token: {"id": i, "name": name}
+            for i, (token, name) in enumerate(team_names.items(), start=1)
+        }
+        self._jwt_tokens: Dict[str, int] = {}
+
+        # 統計信息
+        self.request_count = 0
+        self.endpoint_counts: Counter = Counter()
+        # 傳輸的位元組數（壓縮後）
+        self.request_bytes = 0
+        self.response_bytes = 0
+        # serve() 接受的 TCP 連線數
+        self.connections_opened = 0
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        """可傳給 ESchedulerClient(transport=...) 的 httpx 傳輸層"""
+        return httpx.MockTransport(self.handle)
+
+    @property
+    def task_count(self) -> int:
+        """目前儲存的任務數"""
+        return len(self._tasks)
+
+    # 資料操作
+
+    def seed_tasks(
+        self,
+        count: int,
+        state: Optional[str] = None,
+        target_type: str = "http",
+        name_prefix: str = "task"
+    ) -> None:
+        """
+        批量建立任務
+
+        同一批任務共用時間戳與常數欄位的字串物件，以便儲存百萬級任務。
+
+        Args:
+            count: 任務數量
+            state: 任務狀態，None 時依序輪流使用 ENABLED/DISABLED/PAUSED
+            target_type: 目標類型
+            name_prefix: 任務名稱前綴
+        """
+        now = _now()
+        tasks = self._tasks
+        start = self._next_task_id
+        for task_id in range(start, start + count):
+            tasks[task_id] = (
+                task_id,
+                f"{name_prefix}-{task_id}",
+                None,
+                "rate(5 minutes)",
+                "Asia/Taipei",
+                target_type,
+                "https://httpbin.org/post",
+                None,
+                state or _TASK_STATES[task_id % 3],
+                None,
+                None,
+                0,
+                3,
+                None,
+                None,
+                now,
+                now,
+            )
+        self._next_task_id = start + count
+
+    def add_task(self, **fields: Any) -> Dict[str, Any]:
+        """
+        直接新增一個任務（略過 HTTP 層）
+
+        Args:
+            **fields: 任務欄位
+
+        Returns:
+            任務字典
+        """
+        now = _now()
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        values = {
+            "id": task_id,
+            "description": None,
+            "timezone": "Asia/Taipei",
+            "target_input": None,
+            "state": "ENABLED",
+            "last_execution_time": None,
+            "next_execution_time": None,
+            "execution_count": 0,
+            "max_retry_attempts": 3,
+            "retry_policy": None,
+            "dead_letter_config": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        values.update(fields)
+        row = self._tasks[task_id] = tuple(values.get(name) for name in TASK_FIELDS)
+        return dict(zip(TASK_FIELDS, row))
+
+    def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """
+        取得任務字典
+
+        Args:
+            task_id: 任務 ID
+
+        Returns:
+            任務字典，不存在時為 None
+        """
+        row = self._tasks.get(task_id)
+        return dict(zip(TASK_FIELDS, row)) if row is not None else None
+
+    def fail_next(self, *failures: Union[int, type]) -> None:
+        """
+        指定接下來的請求依序失敗
+
+        Args:
+            *failures: HTTP 狀態碼，或 httpx 例外類別（如 httpx.ReadTimeout）
+        """
+        self._forced_failures.extend(failures)
+
+    # 請求處理
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """處理單一 httpx 請求"""
+        status_code, content, headers = await self._respond(request)
+        return httpx.Response(status_code, content=content, headers=headers)
+
+    async def _respond(self, request: httpx.Request) -> Tuple[int, bytes, Dict[str, str]]:
+        """處理請求，返回狀態碼、傳輸的內容（可能已壓縮）與回應標頭"""
+        self.request_count += 1
+
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            await asyncio.sleep(latency)
+
+        headers = {"Content-Type": "application/json"}
+        failure = self._pick_failure()
+        if isinstance(failure, type):
+            raise failure("模擬錯誤", request=request)
+        if failure is not None:
+            return failure, encode_json({"detail": f"模擬錯誤 {failure}"}), headers
+
+        self.request_bytes += len(request.content)
+        try:
+            status_code, payload = self._route(request)
+        except _HTTPError as e:
+            status_code, payload = e.status_code, {"detail": e.detail}
+
+        content = encode_json(payload)
+        if self.compress_responses and len(content) >= 1024:
+            encoding = _negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+            if encoding is not None:
+                content = compress(content, encoding)
+                headers["Content-Encoding"] = encoding
+        self.response_bytes += len(content)
+        return status_code, content, headers
+
+    async def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        connect_delay: float = 0.0
+    ) -> asyncio.AbstractServer:
+        """
+        以本機 TCP 上的最小 HTTP/1.1 伺服器提供服務
+
+        支援 keep-alive 與 Content-Length 請求內容，用於量測連線建立成本等
+        MockTransport 無法呈現的行為。
+
+        範例:
+            server = await fake.serve()
+            port = server.sockets[0].getsockname()[1]
+            async with ESchedulerSDK(base_url=f"http://127.0.0.1:{port}") as sdk:
+                ...
+            server.close()
+
+        Args:
+            host: 監聽位址
+            port: 監聽埠，0 表示由系統分配
+            connect_delay: 每條新連線回應第一個請求前的延遲（秒），模擬 TLS 握手等成本
+
+        Returns:
+            asyncio 伺服器
+        """
+        async def serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            self.connections_opened += 1
+            try:
+                if connect_delay:
+                    await asyncio.sleep(connect_delay)
+                while True:
+                    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+                    request_line, *header_lines = head.split("\r\n")
+                    method, target, _ = request_line.split(" ", 2)
+                    request_headers = [
+                        (name.strip(), value.strip())
+                        for name, _, value in (line.partition(":") for line in header_lines if line)
+                    ]
+                    length = int(dict((k.lower(), v) for k, v in request_headers).get("content-length", 0))
+                    body = await reader.readexactly(length) if length else b""
+                    request = httpx.Request(
+                        method, f"http://escheduler.test{target}", headers=request_headers, content=body
+                    )
+
+                    try:
+                        status_code, content, headers = await self._respond(request)
+                    except httpx.TransportError:
+                        status_code, content, headers = 504, encode_json({"detail": "模擬逾時"}), {}
+                    head_lines = [f"HTTP/1.1 {status_code} {_reason_phrase(status_code)}"]
+                    head_lines += [f"{name}: {value}" for name, value in headers.items()]
+                    head_lines.append(f"Content-Length: {len(content)}")
+                    writer.write(("\r\n".join(head_lines) + "\r\n\r\n").encode("latin-1"))
+                    if method != "HEAD":
+                        writer.write(content)
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        return await asyncio.start_server(serve_connection, host, port)
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        """ASGI 入口，可搭配 httpx.ASGITransport 或任何 ASGI 伺服器使用"""
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        url = httpx.URL(
+            scheme=scope.get("scheme", "http"),
+            host="escheduler.test",
+            path=scope["path"],
+            query=scope.get("query_string", b""),
+        )
+        headers = [(k.decode("latin-1"), v.decode("latin-1")) for k, v in scope["headers"]]
+        request = httpx.Request(scope["method"], url, headers=headers, content=body)
+
+        try:
+            response = await self.handle(request)
+        except httpx.TransportError:
+            response = httpx.Response(504, json={"detail": "模擬逾時"})
+        content = response.content
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(content)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    def _pick_failure(self) -> Optional[Union[int, type]]:
+        """決定本次請求是否注入錯誤"""
+        if self._forced_failures:
+            return self._forced_failures.pop(0)
+        if self.timeout_rate and self._random.random() < self.timeout_rate:
+            return httpx.ReadTimeout
+        if self.network_error_rate and self._random.random() < self.network_error_rate:
+            return httpx.ConnectError
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._random.choice(self.error_status_codes)
+        return None
+
+    def _route(self, request: httpx.Request) -> Tuple[int, Any]:
+        """將請求分派到對應的端點"""
+        method = request.method
+        path = request.url.path
+        query = {k: v[0] for k, v in parse_qs(request.url.query.decode()).items()}
+        self.endpoint_counts[(method, re.sub(r"/\d+", "/{id}", path))] += 1
+
+        if path.startswith("/api/team"):
+            return self._route_team(method, path, request)
+
+        if path.startswith("/api/scheduler"):
+            if self.require_auth:
+                self._check_auth(request)
+
+            if path == "/api/scheduler":
+                if method == "GET":
+                    return 200, self._list_tasks(query.get("state"))
+                if method == "POST":
+                    return 200, self._create_task(_json_body(request))
+            elif path == "/api/scheduler/stats" and method == "GET":
+                return 200, self._stats()
+            elif path == "/api/scheduler/search" and method == "GET":
+                return 200, self._search(query.get("keyword", ""))
+            else:
+                match = _TASK_PATH.match(path)
+                if match:
+                    task_id = int(match.group(1))
+                    if method == "GET":
+                        return 200, self._require_task(task_id)
+                    if method == "PUT":
+                        return 200, self._update_task(task_id, _json_body(request))
+                    if method == "DELETE":
+                        self._require_task(task_id)
+                        del self._tasks[task_id]
+                        self._executions.pop(task_id, None)
+                        return 200, {"message": f"任務 {task_id} 已刪除"}
+
+                match = _TASK_ACTION_PATH.match(path)
+                if match:
+                    task_id, action = int(match.group(1)), match.group(2)
+                    if action == "state" and method == "PATCH":
+                        state = _json_body(request).get("state")
+                        if state not in _TASK_STATES:
+                            raise _HTTPError(400, f"無效的任務狀態: {state}")
+                        return 200, self._update_task(task_id, {"state": state})
+                    if action == "trigger" and method == "POST":
+                        return 200, self._trigger(task_id)
+                    if action == "executions" and method == "GET":
+                        limit = int(query["limit"]) if "limit" in query else None
+                        executions = self._list_executions(task_id, limit)
+                        if query.get("summary") == "true":
+                            preview = int(query.get("body_preview", 0))
+                            executions = [_summarize_execution(e, preview) for e in executions]
+                        return 200, executions
+
+                match = _EXECUTION_PATH.match(path)
+                if match and method == "GET":
+                    task_id, execution_id = int(match.group(1)), int(match.group(2))
+                    for execution in self._list_executions(task_id, None):
+                        if execution["id"] == execution_id:
+                            return 200, execution
+                    raise _HTTPError(404, f"找不到執行記錄: {execution_id}")
+
+        raise _HTTPError(404, f"找不到端點: {method} {path}")
+
+    def _route_team(self, method: str, path: str, request: httpx.Request) -> Tuple[int, Any]:
+        """團隊端點"""
+        if path == "/api/team" and method == "GET":
+            return 200, list(self._teams.values())
+
+        if path.rstrip("/") == "/api/team/auth/token" and method == "POST":
+            token = _json_body(request).get("token")
+            team = self._teams.get(token) if isinstance(token, str) else None
+            if team is None:
+                return 200, {"status": False, "team": None, "access_token": None}
+            access_token = f"fake-jwt-{team['id']}-{len(self._jwt_tokens) + 1}"
+            self._jwt_tokens[access_token] = team["id"]
+            return 200, {"status": True, "team": team, "access_token": access_token}
+
+        match = _TEAM_TOKEN_PATH.match(path)
+        if match and method == "GET":
+            return 200, self._teams.get(match.group(1))
+
+        raise _HTTPError(404, f"找不到端點: {method} {path}")
+
+    def _check_auth(self, request: httpx.Request) -> None:
+        """檢查 Bearer token"""
+        authorization = request.headers.get("Authorization", "")
+        if authorization[len("Bearer "):] not in self._jwt_tokens:
+            raise _HTTPError(401, "Invalid authentication credentials")
+
+    # 端點實作
+
+    def _require_task(self, task_id: int) -> Dict[str, Any]:
+        task = self.get_task(task_id)
+        if task is None:
+            raise _HTTPError(404, f"任務 {task_id} 不存在")
+        return task
+
+    def _list_tasks(self, state: Optional[str]) -> List[Dict[str, Any]]:
+        state_index = _FIELD_INDEX["state"]
+        return [
+            dict(zip(TASK_FIELDS, row))
+            for row in self._tasks.values()
+            if state is None or row[state_index] == state
+        ]
+
+    def _search(self, keyword: str) -> List[Dict[str, Any]]:
+        keyword = keyword.lower()
+        name_index = _FIELD_INDEX["name"]
+        description_index = _FIELD_INDEX["description"]
+        return [
+            dict(zip(TASK_FIELDS, row))
+            for row in self._tasks.values()
+            if keyword in row[name_index].lower()
+            or keyword in (row[description_index] or "").lower()
+        ]
+
+    def _create_task(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        missing = [field for field in _REQUIRED_FIELDS if not data.get(field)]
+        if missing:
+            raise _HTTPError(400, f"缺少必要欄位: {', '.join(missing)}")
+        fields = {k: v for k, v in data.items() if k in _WRITABLE_FIELDS}
+        return self.add_task(**fields)
+
+    def _update_task(self, task_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        task = self._require_task(task_id)
+        task.update({k: v for k, v in data.items() if k in _WRITABLE_FIELDS and v is not None})
+        task["updated_at"] = _now()
+        self._tasks[task_id] = tuple(task[name] for name in TASK_FIELDS)
+        return task
+
+    def _trigger(self, task_id: int) -> Dict[str, Any]:
+        task = self._require_task(task_id)
+        now = _now()
+        execution = {
+            "id": self._next_execution_id,
+            "task_id": task_id,
+            "status": "RUNNING",
+            "started_at": now,
+            "completed_at": None,
+            "response_code": None,
+            "response_body": None,
+            "error_message": None,
+            "attempt_number": 1,
+            "_started": datetime.now(timezone.utc),
+        }
+        self._next_execution_id += 1
+        self._executions.setdefault(task_id, []).append(execution)
+
+        task["last_execution_time"] = now
+        task["execution_count"] += 1
+        self._tasks[task_id] = tuple(task[name] for name in TASK_FIELDS)
+        return {"message": f"任務 {task_id} 已觸發"}
+
+    def _list_executions(self, task_id: int, limit: Optional[int]) -> List[Dict[str, Any]]:
+        self._require_task(task_id)
+        executions = self._executions.get(task_id, [])
+        newest_first = executions[::-1][:limit] if limit is not None else executions[::-1]
+
+        now = datetime.now(timezone.utc)
+        duration = timedelta(seconds=self.execution_duration)
+        result = []
+        for execution in newest_first:
+            if execution["status"] == "RUNNING" and now - execution["_started"] >= duration:
+                execution["status"] = "SUCCEEDED"
+                execution["completed_at"] = (execution["_started"] + duration).isoformat()
+                execution["response_code"] = 200
+                execution["response_body"] = self.execution_response_body
+            result.append({k: v for k, v in execution.items() if not k.startswith("_")})
+        return result
+
+    def _stats(self) -> Dict[str, int]:
+        state_counts = Counter(row[_FIELD_INDEX["state"]] for row in self._tasks.values())
+        statuses = Counter(
+            execution["status"]
+            for executions in self._executions.values()
+            for execution in executions
+        )
+        return {
+            "total_tasks": len(self._tasks),
+            "enabled_tasks": state_counts["ENABLED"],
+            "disabled_tasks": state_counts["DISABLED"],
+            "total_executions_today": sum(statuses.values()),
+            "successful_executions_today": statuses["SUCCEEDED"],
+            "failed_executions_today": statuses["FAILED"] + statuses["TIMEOUT"],
+        }
+
+
+class _HTTPError(Exception):
+    """模擬伺服器內部使用的 HTTP 錯誤"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _json_body(request: httpx.Request) -> Dict[str, Any]:
+    """解析請求的 JSON 內容"""
+    if not request.content:
+        return {}
+    try:
+        data = json.loads(decompress(request.content, request.headers.get("Content-Encoding", "")))
+    except ValueError:
+        raise _HTTPError(400, "請求內容不是有效的 JSON")
+    if not isinstance(data, dict):
+        raise _HTTPError(400, "請求內容必須是 JSON 物件")
+    return data
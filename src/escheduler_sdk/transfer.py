@@ -0,0 +1,390 @@
+"""EScheduler SDK 任務清單匯出與匯入
+
+匯出以分塊方式將任務寫入 NDJSON 或 Parquet 檔案，不會建立任何模型實例；
+匯入逐塊讀取檔案（Parquet 以記憶體映射開啟），每塊驗證為 ScheduledTaskCreate
+後以有上限的並發數建立任務。每個成功建立的任務會立即記錄到檢查點
+（BulkJournal），中斷後以相同的檢查點重新執行即可跳過已建立的任務。
+
+Parquet 需要安裝 pyarrow：pip install "escheduler-sdk[parquet]"
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
+
+from pydantic import ValidationError as PydanticValidationError
+
+from .bulk import BulkJournal, PathLike
+from .enums import RequestPriority, TaskState
+from .exceptions import AuthenticationError, ESchedulerError
+from .limiter import request_priority
+from .models import ScheduledTaskCreate, TaskStateUpdateRequest
+from .records import TaskRecord, parse_datetime
+
+if TYPE_CHECKING:
+    from .scheduler import SchedulerAPI
+
+
+EXPORT_FORMATS = ("ndjson", "parquet")
+TASK_FIELDS: Tuple[str, ...] = TaskRecord._fields
+JSON_FIELDS: Tuple[str, ...] = ("target_input", "retry_policy", "dead_letter_config")
+DATETIME_FIELDS: Tuple[str, ...] = (
+    "last_execution_time", "next_execution_time", "created_at", "updated_at",
+)
+INTEGER_FIELDS: Tuple[str, ...] = ("id", "execution_count", "max_retry_attempts")
+CREATE_FIELDS: Tuple[str, ...] = tuple(ScheduledTaskCreate.model_fields)
+# 檢查點中匯入操作的名稱，項目鍵為任務在檔案中的位置
+IMPORT_OPERATION = "import"
+
+
+def _import_pyarrow() -> Any:
+    """延遲載入 pyarrow，未安裝時提示安裝方式"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            'Parquet 格式需要 pyarrow，請執行 pip install "escheduler-sdk[parquet]"'
+        ) from e
+    return pyarrow
+
+
+def _resolve_format(path: PathLike, format: Optional[str]) -> str:
+    """決定檔案格式，未指定時依副檔名判斷"""
+    if format is None:
+        format = "parquet" if Path(path).suffix.lower() in (".parquet", ".pq") else "ndjson"
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"不支援的格式: {format}，可用格式: {', '.join(EXPORT_FORMATS)}")
+    return format
+
+
+def _parquet_schema() -> Any:
+    pa = _import_pyarrow()
+    types = {name: pa.string() for name in TASK_FIELDS}
+    types.update({name: pa.int64() for name in INTEGER_FIELDS})
+    types.update({name: pa.timestamp("us", tz="UTC") for name in DATETIME_FIELDS})
+    return pa.schema([(name, types[name]) for name in TASK_FIELDS])
+
+
+def write_tasks(
+    tasks: List[Dict[str, Any]],
+    path: PathLike,
+    format: Optional[str] = None,
+    chunk_size: int = 10_000
+) -> int:
+    """
+    將 API 回傳格式的任務字典寫入檔案
+
+    NDJSON 每行一個任務；Parquet 每 chunk_size 個任務寫入一個 row group，
+    target_input 等字典欄位以 JSON 字串儲存，時間欄位為 UTC 時間戳。
+
+    Args:
+        tasks: 任務字典列表
+        path: 輸出檔案路徑
+        format: "ndjson" 或 "parquet"，None 時依副檔名判斷
+        chunk_size: 每次序列化與寫入的任務數
+
+    Returns:
+        寫入的任務數
+    """
+    format = _resolve_format(path, format)
+    if format == "ndjson":
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        with open(path, "w", encoding="utf-8") as f:
+            for start in range(0, len(tasks), chunk_size):
+                f.write("".join(dumps(task) + "\n" for task in tasks[start:start + chunk_size]))
+        return len(tasks)
+
+    pa = _import_pyarrow()
+    schema = _parquet_schema()
+    with pa.parquet.ParquetWriter(str(path), schema) as writer:
+        for start in range(0, len(tasks), chunk_size):
+            chunk = tasks[start:start + chunk_size]
+            columns = []
+            for field in schema:
+                values = [task.get(field.name) for task in chunk]
+                if field.name in JSON_FIELDS:
+                    values = [
+                        json.dumps(value, ensure_ascii=False) if value is not None else None
+                        for value in values
+                    ]
+                elif field.name in DATETIME_FIELDS:
+                    values = [parse_datetime(value) for value in values]
+                columns.append(pa.array(values, type=field.type))
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+    return len(tasks)
+
+
+def _read_ndjson_lines(
+    path: PathLike,
+    chunk_size: int,
+    columns: Optional[Tuple[str, ...]]
+) -> Iterator[List[Tuple[int, Union[Dict[str, Any], str]]]]:
+    """逐塊讀取 NDJSON，每個項目為 (行號, 任務字典或解析錯誤訊息)"""
+    with open(path, "r", encoding="utf-8") as f:
+        chunk: List[Tuple[int, Union[Dict[str, Any], str]]] = []
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                task = json.loads(line)
+            except json.JSONDecodeError as e:
+                chunk.append((line_number, f"JSON 解析失敗: {e}"))
+            else:
+                if not isinstance(task, dict):
+                    chunk.append((line_number, "不是 JSON 物件"))
+                else:
+                    if columns is not None:
+                        task = {name: task[name] for name in columns if name in task}
+                    chunk.append((line_number, task))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def read_tasks(
+    path: PathLike,
+    format: Optional[str] = None,
+    chunk_size: int = 1000,
+    columns: Optional[Tuple[str, ...]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    逐塊讀取任務檔案
+
+    NDJSON 逐行讀取；Parquet 以記憶體映射開啟並逐批解碼，只讀取需要的欄位。
+
+    Args:
+        path: 任務檔案路徑
+        format: "ndjson" 或 "parquet"，None 時依副檔名判斷
+        chunk_size: 每塊的任務數
+        columns: 只讀取的欄位，None 表示全部
+
+    Yields:
+        任務字典列表
+
+    Raises:
+        ValueError: NDJSON 中有無法解析的行時
+    """
+    format = _resolve_format(path, format)
+    if format == "ndjson":
+        for lines in _read_ndjson_lines(path, chunk_size, columns):
+            chunk: List[Dict[str, Any]] = []
+            for line_number, task in lines:
+                if isinstance(task, str):
+                    raise ValueError(f"{path} 第 {line_number} 行: {task}")
+                chunk.append(task)
+            yield chunk
+        return
+
+    pa = _import_pyarrow()
+    with pa.memory_map(str(path), "r") as source:
+        parquet_file = pa.parquet.ParquetFile(source)
+        available = parquet_file.schema_arrow.names
+        selected = [name for name in (columns or available) if name in available]
+        json_fields = [name for name in JSON_FIELDS if name in selected]
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=selected):
+            chunk = batch.to_pylist()
+            for task in chunk:
+                for name in json_fields:
+                    if task[name] is not None:
+                        task[name] = json.loads(task[name])
+            yield chunk
+
+
+def _read_import_items(
+    path: PathLike,
+    format: str,
+    chunk_size: int,
+    columns: Tuple[str, ...]
+) -> Iterator[Sequence[Tuple[Optional[int], Union[Dict[str, Any], str]]]]:
+    """逐塊讀取匯入項目：(NDJSON 行號或 None, 任務字典或解析錯誤訊息)"""
+    if format == "ndjson":
+        yield from _read_ndjson_lines(path, chunk_size, columns)
+        return
+    for chunk in read_tasks(path, format, chunk_size, columns):
+        yield [(None, task) for task in chunk]
+
+
+class ImportResult:
+    """任務匯入結果"""
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.skipped = 0
+        # (檔案中的位置, 錯誤訊息)
+        self.errors: List[Tuple[int, str]] = []
+
+    @property
+    def failed(self) -> int:
+        """驗證或建立失敗的任務數"""
+        return len(self.errors)
+
+    def __repr__(self) -> str:
+        return f"ImportResult(created={self.created}, skipped={self.skipped}, failed={self.failed})"
+
+
+async def export_tasks(
+    scheduler: "SchedulerAPI",
+    path: PathLike,
+    format: Optional[str] = None,
+    state: Optional[TaskState] = None,
+    chunk_size: int = 10_000
+) -> int:
+    """
+    匯出任務清單到檔案
+
+    直接寫出 API 回傳的任務字典，不建立模型；檔案寫入在執行緒中進行。
+
+    Args:
+        scheduler: 排程任務 API 實例
+        path: 輸出檔案路徑
+        format: "ndjson" 或 "parquet"，None 時依副檔名判斷
+        state: 可選的任務狀態過濾
+        chunk_size: 每次序列化與寫入的任務數
+
+    Returns:
+        匯出的任務數
+    """
+    format = _resolve_format(path, format)
+    params = {}
+    if state:
+        params["state"] = state.value
+
+    response_data = await scheduler.client.get(scheduler.base_endpoint, params=params)
+    return await asyncio.to_thread(write_tasks, response_data, path, format, chunk_size)
+
+
+async def import_tasks(
+    scheduler: "SchedulerAPI",
+    path: PathLike,
+    format: Optional[str] = None,
+    concurrency: int = 10,
+    chunk_size: int = 1000,
+    checkpoint: Optional[PathLike] = None,
+    restore_state: bool = True
+) -> ImportResult:
+    """
+    從檔案匯入任務
+
+    建立請求以 bulk 優先級送出，不會擠佔同一客戶端互動請求的並發名額。
+
+    Args:
+        scheduler: 排程任務 API 實例
+        path: 任務檔案路徑
+        format: "ndjson" 或 "parquet"，None 時依副檔名判斷
+        concurrency: 同時進行中的建立請求上限
+        chunk_size: 每次讀取與驗證的任務數
+        checkpoint: 檢查點（BulkJournal）檔案路徑，已記錄的任務不會重複建立
+        restore_state: 是否將非 ENABLED 的任務還原為檔案中的狀態；無效的狀態記錄為失敗，不建立該任務
+
+    Returns:
+        匯入結果
+
+    Raises:
+        AuthenticationError: 認證失敗時中止匯入
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency 必須大於 0")
+
+    format = _resolve_format(path, format)
+    journal = BulkJournal(checkpoint) if checkpoint is not None else None
+    completed = journal.completed(IMPORT_OPERATION) if journal is not None else set()
+    result = ImportResult()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=chunk_size)
+
+    def fail(position: int, error: str) -> None:
+        result.errors.append((position, error))
+        if journal is not None:
+            journal.record(IMPORT_OPERATION, str(position), False, error=error)
+
+    async def produce() -> None:
+        chunks = _read_import_items(path, format, chunk_size, CREATE_FIELDS + ("state",))
+        index = 0
+        while True:
+            # 檔案讀取與解碼在執行緒中進行，不阻塞事件迴圈
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            for line_number, task in chunk:
+                # 無法解析的行也佔用一個位置，修正後重新執行時其他任務的位置不變
+                position, index = index, index + 1
+                if str(position) in completed:
+                    result.skipped += 1
+                    continue
+                where = f"第 {line_number} 行: " if line_number is not None else ""
+                if isinstance(task, str):
+                    fail(position, where + task)
+                    continue
+                raw_state = task.pop("state", None)
+                try:
+                    task_data = ScheduledTaskCreate.model_validate(task)
+                except PydanticValidationError as e:
+                    fail(position, where + str(e))
+                    continue
+                # 狀態只在還原時使用；無效的狀態在建立任務前記錄為失敗
+                state = None
+                if restore_state and raw_state:
+                    try:
+                        state = TaskState(raw_state)
+                    except ValueError:
+                        fail(position, where + f"無效的任務狀態: {raw_state!r}")
+                        continue
+                await queue.put((position, task_data, state))
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def consume() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            position, task_data, state = item
+            try:
+                task = await scheduler.create_task(task_data)
+            except AuthenticationError:
+                raise
+            except ESchedulerError as e:
+                fail(position, str(e))
+                continue
+
+            # 建立成功後立即記錄，狀態還原失敗時也不會在重新執行時重複建立
+            result.created += 1
+            if journal is not None:
+                journal.record(IMPORT_OPERATION, str(position), True, result=str(task.id))
+
+            if state is not None and state is not TaskState.ENABLED:
+                try:
+                    await scheduler.update_task_state(
+                        task.id, TaskStateUpdateRequest(state=state)
+                    )
+                except AuthenticationError:
+                    raise
+                except ESchedulerError as e:
+                    result.errors.append((position, f"任務 {task.id} 已建立，但狀態還原失敗: {e}"))
+
+    producer = asyncio.ensure_future(produce())
+    with request_priority(RequestPriority.BULK):
+        consumers = [asyncio.ensure_future(consume()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(producer, *consumers)
+    finally:
+        for future in (producer, *consumers):
+            future.cancel()
+        if journal is not None:
+            journal.close()
+
+    result.errors.sort()
+    return result
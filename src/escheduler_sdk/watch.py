@@ -0,0 +1,90 @@
+"""EScheduler SDK 任務變更比對"""
+
+from typing import Any, Dict, Iterable, List
+
+from .models import ScheduledTaskResponse, TaskChangeEvent, TaskChangeType
+
+
+def task_fingerprint(task: Dict[str, Any]) -> int:
+    """
+    計算任務的變更指紋
+
+    只取決定「是否變更」的欄位計算雜湊值，索引中只保存一個整數，
+    不保留原始字串或模型實例。
+
+    Args:
+        task: API 回傳的原始任務字典
+
+    Returns:
+        任務指紋
+    """
+    return hash((
+        task.get("updated_at"),
+        task.get("state"),
+        task.get("next_execution_time"),
+    ))
+
+
+class TaskIndex:
+    """以任務 ID 為鍵的精簡任務索引
+
+    每個任務只保存一個指紋整數。比對新一輪的任務列表時，
+    只有指紋變更的任務才會被解析成 ScheduledTaskResponse。
+    """
+
+    def __init__(self) -> None:
+        """初始化空索引"""
+        self._fingerprints: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._fingerprints
+
+    def load(self, tasks: Iterable[Dict[str, Any]]) -> None:
+        """
+        以任務快照重建索引，不產生事件
+
+        Args:
+            tasks: API 回傳的原始任務字典列表（完整快照）
+        """
+        self._fingerprints = {task["id"]: task_fingerprint(task) for task in tasks}
+
+    def diff(self, tasks: Iterable[Dict[str, Any]]) -> List[TaskChangeEvent]:
+        """
+        以新的任務快照更新索引，並返回變更事件
+
+        Args:
+            tasks: API 回傳的原始任務字典列表（完整快照）
+
+        Returns:
+            依序為新增/更新事件，最後為刪除事件
+        """
+        previous = self._fingerprints
+        current: Dict[int, int] = {}
+        events: List[TaskChangeEvent] = []
+
+        for task in tasks:
+            task_id = task["id"]
+            fingerprint = task_fingerprint(task)
+            current[task_id] = fingerprint
+
+            old = previous.get(task_id)
+            if old == fingerprint:
+                continue
+            change_type = TaskChangeType.CREATED if old is None else TaskChangeType.UPDATED
+            events.append(TaskChangeEvent(
+                type=change_type,
+                task_id=task_id,
+                task=ScheduledTaskResponse(**task)
+            ))
+
+        if len(current) != len(previous) or events:
+            for task_id in previous.keys() - current.keys():
+                events.append(TaskChangeEvent(
+                    type=TaskChangeType.DELETED, task_id=task_id, task=None
+                ))
+
+        self._fingerprints = current
+        return events
@@ -0,0 +1,187 @@
+"""EScheduler SDK 執行記錄分析測試"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.analytics import ExecutionAnalyzer, ExecutionStats, QuantileSketch
+from escheduler_sdk.exceptions import NotFoundError
+from escheduler_sdk.models import ExecutionStatus, TaskExecutionResponse
+from escheduler_sdk.testing import FakeEScheduler
+
+
+START = datetime(2024, 1, 15, 9, 0, 0)
+
+
+def make_execution(execution_id, task_id, status, duration_ms=None, attempt_number=1):
+    """建立執行記錄"""
+    completed_at = START + timedelta(milliseconds=duration_ms) if duration_ms is not None else None
+    return TaskExecutionResponse(
+        id=execution_id,
+        task_id=task_id,
+        status=status,
+        started_at=START,
+        completed_at=completed_at,
+        response_code=None,
+        response_body=None,
+        error_message=None,
+        attempt_number=attempt_number
+    )
+
+
+class TestQuantileSketch:
+    """分位數草圖測試類"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """測試分位數估計在相對誤差內"""
+        rng = random.Random(0)
+        values = [rng.lognormvariate(5, 1.5) for _ in range(20_000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - exact) / exact <= 0.011
+
+        assert sketch.count == 20_000
+        assert sketch.min == values[0]
+        assert sketch.max == values[-1]
+
+    def test_memory_is_bounded(self):
+        """測試桶數不超過上限"""
+        sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+        for exponent in range(-20, 20):
+            for _ in range(10):
+                sketch.add(10.0 ** exponent)
+        assert len(sketch._buckets) <= 64
+        assert sketch.quantile(1.0) == pytest.approx(1e19, rel=0.02)
+
+    def test_zero_and_empty(self):
+        """測試零值與空草圖"""
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        assert sketch.mean is None
+        sketch.add(0)
+        sketch.add(0)
+        sketch.add(100)
+        assert sketch.quantile(0.5) == 0
+        assert sketch.quantile(1.0) == pytest.approx(100, rel=0.01)
+
+    def test_merge(self):
+        """測試合併草圖"""
+        first, second = QuantileSketch(), QuantileSketch()
+        for value in range(1, 501):
+            first.add(value)
+        for value in range(501, 1001):
+            second.add(value)
+        first.merge(second)
+        assert first.count == 1000
+        assert first.quantile(0.5) == pytest.approx(500, rel=0.01)
+
+        with pytest.raises(ValueError):
+            first.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+class TestExecutionAnalyzer:
+    """執行記錄分析器測試類"""
+
+    def test_per_task_and_fleet_stats(self):
+        """測試各任務與整體統計"""
+        analyzer = ExecutionAnalyzer()
+        analyzer.add_all([
+            make_execution(1, 1, ExecutionStatus.SUCCEEDED, 100),
+            make_execution(2, 1, ExecutionStatus.FAILED, 300, attempt_number=2),
+            make_execution(3, 1, ExecutionStatus.RUNNING),
+            make_execution(4, 2, ExecutionStatus.SUCCEEDED, 1000),
+            make_execution(5, 2, ExecutionStatus.TIMEOUT, 5000, attempt_number=3),
+        ])
+
+        task1 = analyzer.per_task[1]
+        assert task1.total == 3
+        assert task1.completed == 2
+        assert task1.success_rate == 0.5
+        assert task1.attempt_counts == {1: 2, 2: 1}
+        assert task1.durations_ms.count == 2
+
+        fleet = analyzer.fleet
+        assert fleet.total == 5
+        assert fleet.success_rate == 0.5
+        assert fleet.retry_rate == 0.4
+        assert fleet.durations_ms.max == 5000
+        assert analyzer.slowest_tasks(count=1) == [2]
+
+        report = analyzer.report()
+        assert report["fleet"]["status_counts"]["TIMEOUT"] == 1
+        assert report["tasks"][1]["duration_ms"]["p50"] == pytest.approx(100, rel=0.01)
+
+    def test_empty_stats(self):
+        """測試沒有資料時的統計"""
+        stats = ExecutionStats()
+        assert stats.success_rate is None
+        assert stats.retry_rate is None
+        assert stats.to_dict()["duration_ms"]["p99"] is None
+
+    @pytest.mark.asyncio
+    async def test_add_stream(self):
+        """測試從異步串流加入"""
+        async def stream():
+            for i in range(10):
+                yield make_execution(i, 1, ExecutionStatus.SUCCEEDED, i * 10)
+
+        analyzer = ExecutionAnalyzer()
+        await analyzer.add_stream(stream())
+        assert analyzer.fleet.success_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_collect(self):
+        """測試並發取得多個任務的執行記錄"""
+        fake = FakeEScheduler()
+        first = fake.add_task(name="a", schedule_expression="rate(1 minute)", target_type="http", target_arn="x")
+        second = fake.add_task(name="b", schedule_expression="rate(1 minute)", target_type="http", target_arn="x")
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            for task_id in (first["id"], first["id"], second["id"]):
+                await sdk.scheduler.trigger_task(task_id)
+
+            analyzer = ExecutionAnalyzer()
+            await analyzer.collect(sdk.scheduler, [first["id"], second["id"]], limit=10)
+
+        assert analyzer.fleet.total == 3
+        assert analyzer.per_task[first["id"]].succeeded == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_reports_failures_per_task(self):
+        """測試單一任務取得失敗時記錄錯誤，其他任務照常分析"""
+        fake = FakeEScheduler()
+        task = fake.add_task(name="a", schedule_expression="rate(1 minute)", target_type="http", target_arn="x")
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            await sdk.scheduler.trigger_task(task["id"])
+
+            analyzer = ExecutionAnalyzer()
+            errors = await analyzer.collect(sdk.scheduler, [task["id"], 999], limit=10)
+
+        assert isinstance(errors[999], NotFoundError)
+        assert set(analyzer.errors) == {999}
+        assert analyzer.fleet.total == 1
+        assert set(analyzer.report()["errors"]) == {999}
+
+    @pytest.mark.asyncio
+    async def test_collect_reraises_unexpected_errors(self):
+        """測試 ESchedulerError 以外的錯誤在所有請求結束後拋出"""
+        fetched = []
+
+        class BrokenScheduler:
+            async def get_task_executions(self, task_id, **kwargs):
+                if task_id == 1:
+                    raise KeyError("x")
+                fetched.append(task_id)
+                return [make_execution(task_id, task_id, ExecutionStatus.SUCCEEDED, 10)]
+
+        analyzer = ExecutionAnalyzer()
+        with pytest.raises(KeyError):
+            await analyzer.collect(BrokenScheduler(), [1, 2, 3])
+        assert fetched == [2, 3]
+        assert analyzer.fleet.total == 2
@@ -0,0 +1,150 @@
+"""EScheduler SDK 多端點負載平衡測試"""
+
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from escheduler_sdk import ESchedulerClient, ESchedulerSDK
+from escheduler_sdk.balancer import EndpointPool
+from escheduler_sdk.testing import FakeEScheduler
+
+
+URLS = ["http://replica-a.test", "http://replica-b.test"]
+
+
+class Replicas:
+    """共用同一個 FakeEScheduler 的多個副本，可個別設定延遲與故障"""
+
+    def __init__(self, latency=None, down=(), timeout_methods=()):
+        self.fake = FakeEScheduler()
+        self.fake.seed_tasks(5)
+        self.latency = latency or {}
+        self.down = set(down)
+        self.timeout_methods = timeout_methods
+        self.counts = Counter()
+        self.transport = httpx.MockTransport(self.handle)
+
+    async def handle(self, request):
+        host = request.url.host
+        self.counts[host] += 1
+        if host in self.down:
+            if request.method in self.timeout_methods:
+                raise httpx.ReadTimeout("模擬逾時", request=request)
+            raise httpx.ConnectError("模擬連線錯誤", request=request)
+        if host in self.latency:
+            await asyncio.sleep(self.latency[host])
+        return await self.fake.handle(request)
+
+
+class TestEndpointPool:
+    """端點池測試類"""
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            EndpointPool([])
+        with pytest.raises(ValueError):
+            EndpointPool(URLS, strategy="random")
+
+    def test_ejection_and_probe(self, monkeypatch):
+        """測試剔除、半開探測與剔除時間加倍"""
+        now = [100.0]
+        monkeypatch.setattr("escheduler_sdk.balancer.time.monotonic", lambda: now[0])
+        pool = EndpointPool(URLS, failure_threshold=2, ejection_time=10)
+        a, b = pool.endpoints
+
+        pool.record_failure(a)
+        assert pool.choose(exclude=[b]) is a
+        pool.record_failure(a)
+        assert all(pool.choose() is b for _ in range(5))
+        assert pool.stats()[0]["healthy"] is False
+
+        # 剔除時間結束：非冪等請求不會用來探測，冪等請求只會送出一個探測
+        now[0] += 10
+        assert pool.choose(idempotent=False) is b
+        assert pool.choose() is a
+        assert pool.choose() is b
+
+        # 探測失敗：剔除時間加倍
+        pool.record_failure(a)
+        now[0] += 10
+        assert pool.choose() is b
+        now[0] += 10
+        assert pool.choose() is a
+        pool.record_success(a, 0.01)
+        assert pool.stats()[0]["healthy"] is True
+
+    def test_all_ejected_uses_earliest_release(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr("escheduler_sdk.balancer.time.monotonic", lambda: now[0])
+        pool = EndpointPool(URLS, failure_threshold=1, ejection_time=10)
+        a, b = pool.endpoints
+        pool.record_failure(b)
+        now[0] += 1
+        pool.record_failure(a)
+        assert pool.choose() is b
+
+
+class TestMultiEndpointClient:
+    """多端點客戶端測試類"""
+
+    def test_single_url_has_no_pool(self):
+        assert ESchedulerClient(base_url="http://localhost:8000").endpoint_pool is None
+        client = ESchedulerClient(base_url=["http://localhost:8000/"])
+        assert client.endpoint_pool is None
+        assert client.base_url == "http://localhost:8000"
+
+    @pytest.mark.asyncio
+    async def test_ewma_prefers_faster_replica(self):
+        replicas = Replicas(latency={"replica-a.test": 0.02, "replica-b.test": 0.001})
+        async with ESchedulerSDK(base_url=URLS, transport=replicas.transport) as sdk:
+            for _ in range(30):
+                await sdk.scheduler.get_task(1)
+            stats = sdk.client.endpoint_pool.stats()
+
+        assert replicas.counts["replica-b.test"] > 3 * replicas.counts["replica-a.test"]
+        assert stats[0]["ewma_latency_ms"] > stats[1]["ewma_latency_ms"]
+        assert all(endpoint["outstanding"] == 0 for endpoint in stats)
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_spreads_concurrent_requests(self):
+        replicas = Replicas(latency={"replica-a.test": 0.01, "replica-b.test": 0.01})
+        async with ESchedulerSDK(
+            base_url=URLS, load_balancing="least_outstanding", transport=replicas.transport
+        ) as sdk:
+            await asyncio.gather(*(sdk.scheduler.get_task(1) for _ in range(20)))
+
+        assert replicas.counts == {"replica-a.test": 10, "replica-b.test": 10}
+
+    @pytest.mark.asyncio
+    async def test_connect_error_fails_over_without_backoff(self):
+        """測試連線錯誤時立即改送到其他副本，包含非冪等請求"""
+        replicas = Replicas(down={"replica-a.test"})
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            async with ESchedulerSDK(base_url=URLS, transport=replicas.transport) as sdk:
+                for _ in range(10):
+                    await sdk.scheduler.get_task(1)
+                await sdk.client.post("/api/scheduler", json_data={
+                    "name": "new", "schedule_expression": "rate(1 minute)",
+                    "target_type": "http", "target_arn": "x",
+                })
+                stats = sdk.client.endpoint_pool.stats()
+
+        mock_sleep.assert_not_called()
+        assert replicas.fake.task_count == 6
+        # 連續失敗 3 次後被剔除，不再收到請求
+        assert replicas.counts["replica-a.test"] == 3
+        assert stats[0]["healthy"] is False
+
+    @pytest.mark.asyncio
+    async def test_read_timeout_on_post_uses_backoff(self):
+        """測試非冪等請求讀取逾時時不立即改送"""
+        replicas = Replicas(down={"replica-a.test"}, timeout_methods={"POST"})
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            async with ESchedulerSDK(base_url=URLS, transport=replicas.transport) as sdk:
+                await sdk.client.post("/api/scheduler/1/trigger")
+
+        mock_sleep.assert_called_once_with(1)
+        assert replicas.counts == {"replica-a.test": 1, "replica-b.test": 1}
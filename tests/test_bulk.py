@@ -0,0 +1,112 @@
+"""EScheduler SDK 可續傳批量操作測試"""
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.bulk import BulkJournal, BulkRunner
+from escheduler_sdk.exceptions import AuthenticationError
+from escheduler_sdk.models import ScheduledTaskCreate, TargetType, TaskState
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+def make_create(index):
+    """建立任務創建數據"""
+    return ScheduledTaskCreate(
+        name=f"bulk-{index}",
+        schedule_expression="rate(5 minutes)",
+        target_type=TargetType.HTTP,
+        target_arn="https://httpbin.org/post"
+    )
+
+
+class TestBulkJournal:
+    """批量操作日誌測試類"""
+
+    def test_record_and_reopen(self, tmp_path):
+        """測試結果持久化且重試成功會覆蓋失敗"""
+        path = tmp_path / "bulk.journal"
+        with BulkJournal(path) as journal:
+            journal.record("op", "1", True, result="101")
+            journal.record("op", "2", False, error="伺服器錯誤")
+            journal.record("other", "1", False, error="x")
+
+        with BulkJournal(path) as journal:
+            assert journal.completed("op") == {"1"}
+            assert journal.failures("op") == {"2": "伺服器錯誤"}
+            journal.record("op", "2", True, result="102")
+            assert journal.results("op") == {"1": "101", "2": "102"}
+            assert journal.summary("op") == {"succeeded": 2, "failed": 0}
+            assert journal.summary("other") == {"succeeded": 0, "failed": 1}
+
+
+class TestBulkRunner:
+    """批量操作執行器測試類"""
+
+    @pytest.mark.asyncio
+    async def test_create_resume_without_duplicates(self, tmp_path):
+        """測試中斷後續傳不會重複建立"""
+        fake = FakeEScheduler()
+        tasks = [make_create(i) for i in range(30)]
+
+        with BulkJournal(tmp_path / "bulk.journal") as journal:
+            async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=1)
+                fake.fail_next(*([None] * 12), 500, 401)
+                with pytest.raises(AuthenticationError):
+                    await runner.create_tasks(tasks)
+
+        assert fake.task_count == 12
+
+        with BulkJournal(tmp_path / "bulk.journal") as journal:
+            assert len(journal.failures("create")) == 1
+            async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=5)
+                result = await runner.create_tasks(tasks)
+
+            assert (result.succeeded, result.skipped, result.failed) == (18, 12, 0)
+            assert journal.summary("create") == {"succeeded": 30, "failed": 0}
+            created_ids = {int(task_id) for task_id in journal.results("create").values()}
+
+        assert fake.task_count == 30
+        assert created_ids == set(fake._tasks)
+
+    @pytest.mark.asyncio
+    async def test_delete_and_state_change(self):
+        """測試批量刪除與狀態變更"""
+        fake = FakeEScheduler()
+        fake.seed_tasks(10, state="ENABLED")
+
+        with BulkJournal(":memory:") as journal:
+            async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=4)
+                paused = await runner.set_task_state(range(1, 6), TaskState.PAUSED)
+                # 不存在的任務視為已刪除
+                deleted = await runner.delete_tasks([6, 7, 999])
+
+            assert paused.succeeded == 5
+            assert deleted.succeeded == 3
+            assert journal.completed("state:PAUSED") == {"1", "2", "3", "4", "5"}
+
+        assert sorted(fake._tasks) == [1, 2, 3, 4, 5, 8, 9, 10]
+        assert {fake.get_task(i)["state"] for i in range(1, 6)} == {"PAUSED"}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded_and_retried(self):
+        """測試失敗的項目會記錄並在下次執行時重試"""
+        fake = FakeEScheduler()
+        fake.seed_tasks(3, state="ENABLED")
+
+        with BulkJournal(":memory:") as journal:
+            async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=1)
+                fake.fail_next(None, 400)
+                first = await runner.set_task_state([1, 2, 3], TaskState.DISABLED, operation="disable")
+                assert first.succeeded == 2
+                assert list(first.errors) == ["2"]
+
+                second = await runner.set_task_state([1, 2, 3], TaskState.DISABLED, operation="disable")
+                assert (second.succeeded, second.skipped) == (1, 2)
+                assert journal.failures("disable") == {}
@@ -0,0 +1,93 @@
+"""EScheduler SDK 觸發合併器測試"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from escheduler_sdk.coalescer import TriggerCoalescer
+from escheduler_sdk.exceptions import NotFoundError
+from escheduler_sdk.models import MessageResponse
+
+
+class TestTriggerCoalescer:
+    """觸發合併器測試類"""
+
+    @pytest.fixture
+    def scheduler(self):
+        """模擬的排程任務 API"""
+        scheduler = Mock()
+
+        async def trigger_task(task_id):
+            await asyncio.sleep(0)
+            return MessageResponse(message=f"triggered {task_id}")
+
+        scheduler.trigger_task = AsyncMock(side_effect=trigger_task)
+        return scheduler
+
+    @pytest.mark.asyncio
+    async def test_duplicate_triggers_are_coalesced(self, scheduler):
+        """測試同一窗口內的重複觸發只發送一次"""
+        async with TriggerCoalescer(scheduler, window=0.01) as coalescer:
+            results = await asyncio.gather(
+                *(coalescer.trigger(task_id) for task_id in [1, 2, 1, 1, 2, 3])
+            )
+
+        assert [r.message for r in results] == [
+            "triggered 1", "triggered 2", "triggered 1",
+            "triggered 1", "triggered 2", "triggered 3"
+        ]
+        assert scheduler.trigger_task.await_count == 3
+        assert coalescer.requested == 6
+        assert coalescer.dispatched == 3
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, scheduler):
+        """測試派送時遵守並發上限"""
+        active = 0
+        peak = 0
+
+        async def trigger_task(task_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return MessageResponse(message="ok")
+
+        scheduler.trigger_task = AsyncMock(side_effect=trigger_task)
+        coalescer = TriggerCoalescer(scheduler, window=0, max_concurrency=3)
+        await asyncio.gather(*(coalescer.trigger(i) for i in range(20)))
+
+        assert scheduler.trigger_task.await_count == 20
+        assert peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_flushes_early(self, scheduler):
+        """測試達到批次上限時立即派送"""
+        coalescer = TriggerCoalescer(scheduler, window=60, max_batch_size=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(coalescer.trigger(1), coalescer.trigger(2)), timeout=1
+        )
+        assert len(results) == 2
+        assert coalescer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self, scheduler):
+        """測試錯誤會傳遞給所有等待同一任務的呼叫者"""
+        scheduler.trigger_task = AsyncMock(side_effect=NotFoundError("任務不存在"))
+        coalescer = TriggerCoalescer(scheduler, window=0.001)
+
+        results = await asyncio.gather(
+            coalescer.trigger(9), coalescer.trigger(9), return_exceptions=True
+        )
+        assert all(isinstance(r, NotFoundError) for r in results)
+        assert scheduler.trigger_task.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_coalescer_rejects_triggers(self, scheduler):
+        """測試關閉後拒絕新的觸發"""
+        coalescer = TriggerCoalescer(scheduler)
+        await coalescer.close()
+        with pytest.raises(RuntimeError):
+            await coalescer.trigger(1)
@@ -0,0 +1,125 @@
+"""EScheduler SDK 請求與回應壓縮測試"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+
+from escheduler_sdk import ESchedulerSDK, ScheduledTaskCreate, TargetType, compression
+from escheduler_sdk.compression import (
+    accept_encoding,
+    available_encodings,
+    compress,
+    decompress,
+    resolve_encoding
+)
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+def large_task(index=0):
+    """target_input 約 20 KB 的任務"""
+    return ScheduledTaskCreate(
+        name=f"任務-{index}",
+        schedule_expression="rate(5 minutes)",
+        target_type=TargetType.HTTP,
+        target_arn="https://example.com/hook",
+        target_input={"rows": [{"id": i, "region": "ap-northeast-1"} for i in range(500)]}
+    )
+
+
+class RecordingTransport:
+    """記錄送出的請求標頭與內容後轉交給模擬伺服器"""
+
+    def __init__(self, fake):
+        self.fake = fake
+        self.requests = []
+        self.transport = httpx.MockTransport(self.handle)
+
+    async def handle(self, request):
+        self.requests.append((request.headers.get("Content-Encoding"), len(request.content)))
+        return await self.fake.handle(request)
+
+
+class TestCodecs:
+    """壓縮格式測試類"""
+
+    def test_accept_encoding(self):
+        header = accept_encoding()
+        assert "gzip" in header
+        assert header.split(",")[0] == available_encodings()[0]
+
+    def test_accept_encoding_follows_installed_codecs(self, monkeypatch):
+        monkeypatch.setattr(compression, "zstandard", None)
+        assert accept_encoding().split(", ")[0] == ("br" if compression.brotli else "gzip")
+        monkeypatch.setattr(compression, "brotli", None)
+        assert accept_encoding() == "gzip, deflate;q=0.9"
+
+    def test_resolve_encoding(self):
+        assert resolve_encoding("auto") == available_encodings()[0]
+        assert resolve_encoding("gzip") == "gzip"
+        with pytest.raises(ValueError):
+            resolve_encoding("lzma")
+
+    @pytest.mark.parametrize("encoding", available_encodings())
+    def test_round_trip(self, encoding):
+        data = b'{"rows": [' + b'{"id": 1},' * 1000 + b"]}"
+        compressed = compress(data, encoding)
+        assert len(compressed) < len(data) / 10
+        assert decompress(compressed, encoding) == data
+
+
+class TestClientCompression:
+    """客戶端壓縮測試類"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", available_encodings())
+    async def test_request_compression_above_threshold(self, encoding):
+        fake = FakeEScheduler()
+        recorder = RecordingTransport(fake)
+        async with ESchedulerSDK(
+            base_url=BASE_URL,
+            compression=encoding,
+            compression_threshold=1024,
+            transport=recorder.transport
+        ) as sdk:
+            created = await sdk.scheduler.create_task(large_task())
+            await sdk.scheduler.pause_task(created.id)
+
+        assert created.target_input == large_task().target_input
+        (big_encoding, big_size), (small_encoding, _) = recorder.requests
+        assert big_encoding == encoding
+        assert big_size < len(large_task().model_dump_json()) / 5
+        assert small_encoding is None
+
+    @pytest.mark.asyncio
+    async def test_retry_reuses_compressed_body(self, monkeypatch):
+        monkeypatch.setattr("escheduler_sdk.middleware.asyncio.sleep", AsyncMock())
+        fake = FakeEScheduler()
+        fake.fail_next(httpx.ReadTimeout)
+        recorder = RecordingTransport(fake)
+        async with ESchedulerSDK(
+            base_url=BASE_URL, compression="gzip", transport=recorder.transport
+        ) as sdk:
+            await sdk.scheduler.create_task(large_task())
+
+        assert [encoding for encoding, _ in recorder.requests] == ["gzip", "gzip"]
+        assert recorder.requests[0][1] == recorder.requests[1][1]
+        assert fake.get_task(1)["target_input"] == large_task().target_input
+
+    @pytest.mark.asyncio
+    async def test_negotiated_response_compression(self):
+        plain = FakeEScheduler()
+        compressed = FakeEScheduler(compress_responses=True)
+        results = []
+        for fake in (plain, compressed):
+            fake.seed_tasks(500)
+            async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+                results.append([
+                    task.model_dump(exclude={"created_at", "updated_at"})
+                    for task in await sdk.scheduler.get_all_tasks()
+                ])
+
+        assert results[0] == results[1]
+        assert compressed.response_bytes < plain.response_bytes / 5
@@ -0,0 +1,104 @@
+"""EScheduler SDK 端對端請求期限測試"""
+
+import time
+
+import httpx
+import pytest
+
+from escheduler_sdk import ESchedulerSDK, request_deadline
+from escheduler_sdk.bulk import BulkJournal, BulkRunner
+from escheduler_sdk.deadline import current_deadline
+from escheduler_sdk.exceptions import DeadlineExceededError, TimeoutError
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+class TestRequestDeadline:
+    """期限 context 測試類"""
+
+    def test_nested_deadlines_never_extend(self):
+        assert current_deadline() is None
+        with request_deadline(10) as outer:
+            with request_deadline(60) as inner:
+                assert inner == outer
+            with request_deadline(1) as inner:
+                assert inner < outer
+                assert current_deadline() == inner
+            with request_deadline(None) as unchanged:
+                assert unchanged == outer
+        assert current_deadline() is None
+
+
+class TestClientDeadline:
+    """客戶端期限測試類"""
+
+    @pytest.mark.asyncio
+    async def test_skips_retry_that_cannot_finish(self):
+        fake = FakeEScheduler()
+        fake.seed_tasks(1)
+        fake.fail_next(httpx.ReadTimeout, httpx.ReadTimeout)
+        async with ESchedulerSDK(base_url=BASE_URL, max_retries=3, transport=fake.transport) as sdk:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError) as exc_info:
+                await sdk.client.get("/api/scheduler/1", total_timeout=0.5)
+            # 第一次退避需要 1 秒，超過剩餘時間，不等待也不重試
+            assert time.monotonic() - started < 0.2
+            assert fake.request_count == 1
+            assert isinstance(exc_info.value, TimeoutError)
+
+            # 期限足夠時照常退避重試
+            with request_deadline(5):
+                assert (await sdk.client.get("/api/scheduler/1"))["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_bounded_by_remaining_budget(self):
+        fake = FakeEScheduler(latency=5.0)
+        fake.seed_tasks(1)
+        timeouts = []
+
+        async def handle(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            return await fake.handle(request)
+
+        async with ESchedulerSDK(
+            base_url=BASE_URL, timeout=30, limiter="aimd", transport=httpx.MockTransport(handle)
+        ) as sdk:
+            started = time.monotonic()
+            with request_deadline(0.2):
+                with pytest.raises(DeadlineExceededError):
+                    await sdk.scheduler.get_task(1)
+            assert time.monotonic() - started < 0.5
+            assert 0 < timeouts[0] <= 0.2
+            # 期限結束後沒有殘留的並發名額
+            assert sdk.client.limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_runner_total_timeout(self):
+        fake = FakeEScheduler(latency=0.02)
+        fake.seed_tasks(100)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            with BulkJournal(":memory:") as journal:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=5, total_timeout=0.1)
+                first = await runner.delete_tasks(range(1, 101))
+                assert first.deadline_exceeded
+                assert 0 < first.succeeded + first.failed < 100
+
+                runner.total_timeout = None
+                second = await runner.delete_tasks(range(1, 101))
+                assert not second.deadline_exceeded
+                assert second.skipped == first.succeeded
+                assert journal.summary("delete")["succeeded"] + len(second.errors) == 100
+
+    @pytest.mark.asyncio
+    async def test_bulk_runner_item_timeout(self):
+        fake = FakeEScheduler(latency=lambda: 0.2 if fake.request_count == 2 else 0.0)
+        fake.seed_tasks(3)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            with BulkJournal(":memory:") as journal:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=1, item_timeout=0.05)
+                result = await runner.delete_tasks([1, 2, 3])
+
+        assert result.succeeded == 2
+        assert list(result.errors) == ["2"]
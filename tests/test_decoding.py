@@ -0,0 +1,99 @@
+"""EScheduler SDK 大型回應協作式解碼測試"""
+
+import asyncio
+import json
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.decoding import build_list, decode_json, iter_array_chunks
+from escheduler_sdk.models import ScheduledTaskResponse
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+def decode_chunks(text, chunk_chars):
+    return [item for chunk in iter_array_chunks(text, chunk_chars) for item in chunk]
+
+
+class TestIterArrayChunks:
+    """分塊解析測試類"""
+
+    @pytest.mark.parametrize("text", [
+        "[]",
+        " [ ] ",
+        "[1, 2, 3]",
+        '[{"a": 1}, {"a": 2}]',
+        # 元素邊界的樣式出現在字串內
+        '[{"s": "x},{y"}, {"s": "},{"}, {"t": [1, {"u": "},{"}]}]',
+        '\n[\n  {"a": "}, {"},\n  {"b": 2}\n]\n',
+    ])
+    def test_matches_json_loads(self, text):
+        for chunk_chars in (1, 4, 1 << 20):
+            assert decode_chunks(text, chunk_chars) == json.loads(text)
+
+    @pytest.mark.parametrize("text", [
+        '[{"a": 1},{"a": 2}',
+        '[{"a": 1} {"a": 2}]',
+        '[{"a": 1},{"a": "},{"} x]',
+        '[{"a": 1}] tail',
+    ])
+    def test_malformed_input(self, text):
+        with pytest.raises(ValueError):
+            decode_chunks(text, 1)
+
+
+class TestDecodeJson:
+    """協作式解碼測試類"""
+
+    @pytest.mark.asyncio
+    async def test_non_array_documents(self):
+        assert await decode_json('{"items": [1, 2]}') == {"items": [1, 2]}
+        assert await decode_json("42") == 42
+
+    @pytest.mark.asyncio
+    async def test_yields_to_event_loop(self):
+        text = json.dumps([{"id": i, "name": f"task-{i}", "tags": ["},{"] * 3} for i in range(50_000)])
+        ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        tick = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        items = await decode_json(text, time_slice=0.001)
+        done = True
+        await tick
+
+        assert items == json.loads(text)
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    async def test_build_list(self):
+        items = [{"value": i} for i in range(1000)]
+        assert await build_list(lambda item: item["value"], items, time_slice=0) == list(range(1000))
+        assert await build_list(str, [1, 2]) == ["1", "2"]
+
+
+class TestClientLargeResponses:
+    """客戶端大型回應測試類"""
+
+    @pytest.mark.asyncio
+    async def test_same_results_above_threshold(self):
+        fake = FakeEScheduler()
+        fake.seed_tasks(600)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport, large_response_bytes=None) as sdk:
+            expected = await sdk.scheduler.get_all_tasks()
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport, large_response_bytes=1) as sdk:
+            tasks = await sdk.scheduler.get_all_tasks()
+            stats = await sdk.scheduler.get_scheduler_stats()
+
+        assert all(isinstance(task, ScheduledTaskResponse) for task in tasks)
+        assert [task.model_dump() for task in tasks] == [task.model_dump() for task in expected]
+        assert stats.total_tasks == 600
@@ -0,0 +1,243 @@
+"""EScheduler SDK 執行結果監看測試"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.exceptions import NotFoundError, ServerError, TimeoutError
+from escheduler_sdk.executions import ExecutionWatcher
+from escheduler_sdk.models import ExecutionStatus, MessageResponse, TaskExecutionResponse
+from escheduler_sdk.scheduler import SchedulerAPI
+from escheduler_sdk.testing import FakeEScheduler
+
+
+def make_execution(execution_id, task_id, status):
+    """建立執行記錄"""
+    return TaskExecutionResponse(
+        id=execution_id,
+        task_id=task_id,
+        status=status,
+        started_at="2024-01-15T09:00:00",
+        completed_at=None,
+        response_code=None,
+        response_body=None,
+        error_message=None,
+        attempt_number=1
+    )
+
+
+class FakeExecutions:
+    """以記憶體模擬任務執行記錄：每次觸發新增一筆 RUNNING，數輪查詢後完成"""
+
+    def __init__(self, polls_until_done=2, final_status=ExecutionStatus.SUCCEEDED):
+        self.polls_until_done = polls_until_done
+        self.final_status = final_status
+        self.executions = {}
+        self.next_id = 100
+        self.queries = 0
+
+    async def trigger_task(self, task_id, priority=None):
+        self.next_id += 1
+        self.executions.setdefault(task_id, []).append([self.next_id, 0])
+        return MessageResponse(message="triggered")
+
+    async def get_task_executions(self, task_id, limit=None, priority=None):
+        self.queries += 1
+        result = []
+        for record in self.executions.get(task_id, []):
+            record[1] += 1
+            status = self.final_status if record[1] > self.polls_until_done else ExecutionStatus.RUNNING
+            result.append(make_execution(record[0], task_id, status))
+        return list(reversed(result))[:limit]
+
+    async def get_task_execution(self, task_id, execution_id):
+        for record in self.executions.get(task_id, []):
+            if record[0] == execution_id:
+                record[1] += 1
+                status = self.final_status if record[1] > self.polls_until_done else ExecutionStatus.RUNNING
+                return make_execution(record[0], task_id, status)
+        raise NotFoundError(f"找不到執行記錄: {execution_id}")
+
+
+class TestExecutionWatcher:
+    """執行結果監看測試類"""
+
+    @pytest.fixture
+    def fake(self):
+        return FakeExecutions()
+
+    @pytest.fixture
+    def scheduler(self, fake):
+        """將 SchedulerAPI 的觸發與查詢導向模擬資料"""
+        scheduler = SchedulerAPI(Mock())
+        scheduler.trigger_task = fake.trigger_task
+        scheduler.get_task_executions = fake.get_task_executions
+        scheduler.get_task_execution = fake.get_task_execution
+        return scheduler
+
+    @pytest.mark.asyncio
+    async def test_trigger_and_wait_returns_final_execution(self, scheduler):
+        """測試觸發後等待到最終狀態"""
+        scheduler._execution_watcher = ExecutionWatcher(scheduler, min_interval=0.001)
+        execution = await scheduler.trigger_and_wait(1, timeout=1)
+
+        assert execution.status == ExecutionStatus.SUCCEEDED
+        assert execution.id == 101
+        assert scheduler._execution_watcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_one_poll_per_task(self, scheduler, fake):
+        """測試同一任務的多個等待者共用查詢並各自綁定不同執行"""
+        scheduler._execution_watcher = ExecutionWatcher(scheduler, min_interval=0.001)
+        results = await asyncio.gather(*(scheduler.trigger_and_wait(1, timeout=1) for _ in range(5)))
+
+        assert sorted(r.id for r in results) == [101, 102, 103, 104, 105]
+        # 5 次基準查詢之外，輪詢的查詢次數遠少於每個等待者各自輪詢
+        assert fake.queries - 5 <= 4
+
+    @pytest.mark.asyncio
+    async def test_ignores_executions_before_trigger(self, scheduler, fake):
+        """測試不會把觸發前的執行當作結果"""
+        fake.executions[1] = [[50, 10]]
+        scheduler._execution_watcher = ExecutionWatcher(scheduler, min_interval=0.001)
+        execution = await scheduler.trigger_and_wait(1, timeout=1)
+        assert execution.id == 101
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, scheduler, fake):
+        """測試等待逾時"""
+        fake.polls_until_done = 10 ** 6
+        scheduler._execution_watcher = ExecutionWatcher(scheduler, min_interval=0.001, max_interval=0.01)
+        with pytest.raises(TimeoutError):
+            await scheduler.trigger_and_wait(1, timeout=0.05)
+        assert scheduler._execution_watcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_query_error_propagates(self, scheduler):
+        """測試查詢失敗時錯誤傳遞給等待者"""
+        watcher = ExecutionWatcher(scheduler, min_interval=0.001)
+        scheduler.get_task_executions = AsyncMock(side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError):
+            await watcher.wait(1, after_id=0, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(self, scheduler, fake):
+        """測試暫時性錯誤在下一輪重試，不讓等待者失敗"""
+        scheduler._execution_watcher = ExecutionWatcher(scheduler, min_interval=0.001)
+        query = fake.get_task_executions
+        calls = []
+
+        async def flaky(task_id, limit=None, priority=None):
+            calls.append(task_id)
+            # 第 1 次為觸發前的基準查詢，第 2 次為第一輪輪詢
+            if len(calls) == 2:
+                raise ServerError("暫時錯誤")
+            return await query(task_id, limit)
+
+        scheduler.get_task_executions = flaky
+        execution = await scheduler.trigger_and_wait(1, timeout=1)
+        assert execution.id == 101
+        assert len(calls) > 2
+
+    @pytest.mark.asyncio
+    async def test_terminal_error_fails_waiters(self, scheduler):
+        """測試任務不存在時等待者立即失敗"""
+        watcher = ExecutionWatcher(scheduler, min_interval=0.001)
+        scheduler.get_task_executions = AsyncMock(side_effect=NotFoundError("任務不存在"))
+        with pytest.raises(NotFoundError):
+            await watcher.wait(1, after_id=0, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_execution_outside_poll_window(self, scheduler, fake):
+        """測試已綁定的執行移出最近記錄範圍後改以 ID 查詢"""
+        fake.polls_until_done = 4
+        watcher = ExecutionWatcher(scheduler, min_interval=0.001, poll_limit=1)
+        await fake.trigger_task(1)
+        waiting = asyncio.ensure_future(watcher.wait(1, after_id=100, timeout=1))
+        while watcher._waiters.get(1, [None])[0] is None or watcher._waiters[1][0].execution_id is None:
+            await asyncio.sleep(0.001)
+        # 之後的觸發讓 101 不再出現在最近 1 筆執行記錄中
+        await fake.trigger_task(1)
+
+        execution = await waiting
+        assert execution.id == 101
+        assert execution.status == ExecutionStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_trigger_and_wait_timeout_covers_whole_call(self):
+        """測試 timeout 也涵蓋查詢基準與觸發"""
+        fake = FakeEScheduler(latency=0.5)
+        fake.seed_tasks(1)
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            with pytest.raises(TimeoutError):
+                await sdk.scheduler.trigger_and_wait(1, timeout=0.05)
+            assert loop.time() - started < 0.4
+
+
+class TestGetTaskExecutions:
+    """get_task_executions 測試類"""
+
+    @pytest.mark.asyncio
+    async def test_get_task_executions(self):
+        """測試查詢執行記錄的端點與參數"""
+        client = Mock()
+        client.get = AsyncMock(return_value=[
+            make_execution(2, 7, ExecutionStatus.FAILED).model_dump(mode="json")
+        ])
+        scheduler = SchedulerAPI(client)
+
+        executions = await scheduler.get_task_executions(7, limit=5)
+        assert executions[0].status == ExecutionStatus.FAILED
+        client.get.assert_awaited_once_with(
+            "/api/scheduler/7/executions", params={"limit": 5}, priority=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_summary_mode_truncates_and_loads_lazily(self):
+        """測試摘要模式截斷回應內容，需要時才取得完整內容"""
+        body = "回應" + "x" * 1000
+        execution = make_execution(3, 7, ExecutionStatus.SUCCEEDED).model_dump(mode="json")
+        client = Mock()
+        client.get = AsyncMock(side_effect=[
+            [dict(execution, response_body=body)],
+            dict(execution, response_body=body),
+        ])
+        scheduler = SchedulerAPI(client)
+
+        summary, = await scheduler.get_task_executions(7, summary=True, body_preview=10)
+        client.get.assert_awaited_once_with(
+            "/api/scheduler/7/executions",
+            params={"summary": "true", "body_preview": 10},
+            priority=None
+        )
+        assert summary.response_body == body[:10]
+        assert summary.response_body_truncated
+        assert summary.response_body_size == len(body.encode("utf-8"))
+
+        assert await summary.load_response_body() == body
+        assert await summary.load_response_body() == body
+        assert client.get.await_count == 2
+        client.get.assert_awaited_with("/api/scheduler/7/executions/3", priority=None)
+
+    @pytest.mark.asyncio
+    async def test_summary_mode_against_fake_server(self):
+        """測試模擬伺服器的摘要模式與單筆執行記錄端點"""
+        from escheduler_sdk import ESchedulerSDK
+        from escheduler_sdk.testing import FakeEScheduler
+
+        body = '{"items": [' + ",".join(["1"] * 10_000) + "]}"
+        fake = FakeEScheduler(execution_response_body=body)
+        fake.seed_tasks(1)
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            await sdk.scheduler.trigger_task(1)
+            full, = await sdk.scheduler.get_task_executions(1)
+            summary, = await sdk.scheduler.get_task_executions(1, summary=True, body_preview=0)
+
+            assert full.response_body == body and not full.response_body_truncated
+            assert summary.response_body is None
+            assert summary.response_body_size == len(body)
+            assert await summary.load_response_body() == body
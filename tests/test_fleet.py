@@ -0,0 +1,114 @@
+"""EScheduler SDK 跨團隊彙總測試"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from escheduler_sdk import ESchedulerSDK, FleetAggregator, request_credentials
+from escheduler_sdk.exceptions import AuthenticationError, DeadlineExceededError, ServerError
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+TEAMS = {"AAAA": "第1小隊", "BBBB": "第2小隊", "CCCC": "第3小隊", "DDDD": "第4小隊"}
+
+
+class TeamTransport:
+    """依 Authorization 標頭記錄請求，並可讓指定團隊的排程請求變慢或失敗"""
+
+    def __init__(self, fake):
+        self.fake = fake
+        self.requests = []
+        self.slow_teams = {}
+        self.failing_teams = set()
+        self.transport = httpx.MockTransport(self.handle)
+
+    async def handle(self, request):
+        authorization = request.headers.get("Authorization", "")
+        # 模擬伺服器的 JWT 格式為 fake-jwt-{團隊 ID}-{序號}
+        team_id = int(authorization.split("-")[2]) if authorization else None
+        self.requests.append((request.url.path, team_id))
+        if request.url.path.startswith("/api/scheduler"):
+            if team_id in self.slow_teams:
+                await asyncio.sleep(self.slow_teams[team_id])
+            if team_id in self.failing_teams:
+                return httpx.Response(503, json={"detail": "維護中"})
+        return await self.fake.handle(request)
+
+
+@pytest.fixture
+def fake():
+    fake = FakeEScheduler(latency=0.02, teams=TEAMS, require_auth=True)
+    fake.seed_tasks(5)
+    return fake
+
+
+class TestFleetAggregator:
+    """跨團隊彙總測試類"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_collection_with_isolated_credentials(self, fake):
+        recorder = TeamTransport(fake)
+        tokens = {1: "AAAA", 2: "BBBB", "第3小隊": "CCCC", 4: "DDDD"}
+        async with ESchedulerSDK(base_url=BASE_URL, transport=recorder.transport) as sdk:
+            report = await FleetAggregator(sdk, tokens).collect()
+            # 共用客戶端的認證不受影響
+            assert not sdk.is_authenticated()
+            assert "Authorization" not in sdk.client._client.headers
+
+        assert report.failed == []
+        assert report.stats.total_tasks == 4 * 5
+        assert report.task_count == 4 * 5
+        assert [team.id for team, _ in report.inventory()][::5] == [1, 2, 3, 4]
+        assert set(report.latencies) == {1, 2, 3, 4}
+        # 4 個團隊各 3 個請求（每個 20ms）同時進行，遠少於依序執行的 240ms
+        assert report.elapsed < 0.2
+
+        # 每個團隊的排程請求只帶自己的 token
+        scheduler_requests = [r for r in recorder.requests if r[0].startswith("/api/scheduler")]
+        assert sorted(team_id for _, team_id in scheduler_requests) == [1, 1, 2, 2, 3, 3, 4, 4]
+
+    @pytest.mark.asyncio
+    async def test_partial_failures(self, fake):
+        recorder = TeamTransport(fake)
+        recorder.failing_teams.add(2)
+        recorder.slow_teams[4] = 1.0
+        tokens = {1: "AAAA", 2: "BBBB", 3: "XXXX", 4: "DDDD"}
+        async with ESchedulerSDK(
+            base_url=BASE_URL, max_retries=0, transport=recorder.transport
+        ) as sdk:
+            aggregator = FleetAggregator(sdk, tokens, include_tasks=False, team_timeout=0.3)
+            report = await aggregator.collect()
+
+        assert [snapshot.team.id for snapshot in report.succeeded] == [1]
+        errors = {snapshot.team.id: snapshot.error for snapshot in report.failed}
+        assert isinstance(errors[2], ServerError)
+        assert isinstance(errors[3], AuthenticationError)
+        assert isinstance(errors[4], DeadlineExceededError)
+        assert report.latencies[4] < 0.5
+        assert report.stats.total_tasks == 5
+        assert report.succeeded[0].tasks is None
+
+    @pytest.mark.asyncio
+    async def test_missing_or_mismatched_tokens(self, fake):
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            report = await FleetAggregator(sdk, {1: "AAAA", 2: "AAAA"}).collect()
+
+        assert [snapshot.team.id for snapshot in report.succeeded] == [1]
+        assert set(report.errors) == {2, 3, 4}
+        assert all(isinstance(s.error, AuthenticationError) for s in report.failed)
+
+
+class TestRequestCredentials:
+    """請求憑證測試類"""
+
+    @pytest.mark.asyncio
+    async def test_credentials_scoped_to_context(self, fake):
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            auth = await sdk.team.auth_team("AAAA")
+            with request_credentials(auth.access_token):
+                assert (await sdk.scheduler.get_scheduler_stats()).total_tasks == 5
+            with pytest.raises(AuthenticationError):
+                await sdk.scheduler.get_scheduler_stats()
@@ -0,0 +1,187 @@
+"""EScheduler SDK 任務健康檢查測試"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.health import (
+    HealthChecker,
+    failure_rate_rule,
+    overdue_rule,
+    schedule_interval,
+    state_rule
+)
+from escheduler_sdk.models import ExecutionStatus, ScheduledTaskResponse, TaskExecutionResponse
+from escheduler_sdk.testing import FakeEScheduler
+
+
+NOW = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def make_task(**overrides):
+    """建立任務模型"""
+    data = {
+        "id": 1,
+        "name": "健康檢查",
+        "description": None,
+        "schedule_expression": "rate(5 minutes)",
+        "timezone": "Asia/Taipei",
+        "target_type": "http",
+        "target_arn": "https://httpbin.org/post",
+        "target_input": None,
+        "state": "ENABLED",
+        "last_execution_time": None,
+        "next_execution_time": None,
+        "execution_count": 0,
+        "max_retry_attempts": 3,
+        "retry_policy": None,
+        "dead_letter_config": None,
+        "created_at": "2024-01-15T09:00:00Z",
+        "updated_at": "2024-01-15T09:00:00Z",
+    }
+    data.update(overrides)
+    return ScheduledTaskResponse(**data)
+
+
+def make_executions(*statuses):
+    """建立執行記錄列表"""
+    return [
+        TaskExecutionResponse(
+            id=i, task_id=1, status=status, started_at=NOW, completed_at=NOW,
+            response_code=None, response_body=None, error_message=None, attempt_number=1
+        )
+        for i, status in enumerate(statuses, start=1)
+    ]
+
+
+class TestScheduleInterval:
+    """排程間隔估計測試類"""
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("rate(5 minutes)", timedelta(minutes=5)),
+        ("rate(1 hour)", timedelta(hours=1)),
+        ("rate(2 days)", timedelta(days=2)),
+        ("cron(*/15 * * * *)", timedelta(minutes=15)),
+        ("cron(0 */2 * * ? *)", timedelta(hours=2)),
+        ("cron(0 2 * * *)", timedelta(days=1)),
+        ("cron(0 9 ? * MON-FRI *)", timedelta(days=7)),
+        ("cron(0 0 1 * ?)", timedelta(days=31)),
+        ("invalid", None),
+    ])
+    def test_schedule_interval(self, expression, expected):
+        assert schedule_interval(expression) == expected
+
+
+class TestHealthRules:
+    """健康檢查規則測試類"""
+
+    def test_state_rule(self):
+        assert state_rule(make_task(), [], NOW) is None
+        assert "PAUSED" in state_rule(make_task(state="PAUSED"), [], NOW)
+
+    def test_failure_rate_rule(self):
+        rule = failure_rate_rule(threshold=0.6)
+        S, F = ExecutionStatus.SUCCEEDED, ExecutionStatus.FAILED
+        assert rule(make_task(), make_executions(S, S, F), NOW) is None
+        assert "66.7%" in rule(make_task(), make_executions(S, F, F), NOW)
+        assert rule(make_task(), make_executions(F, F, ExecutionStatus.TIMEOUT, S), NOW) is not None
+        assert rule(make_task(), make_executions(ExecutionStatus.RUNNING), NOW) is None
+
+    def test_overdue_rule(self):
+        rule = overdue_rule(intervals=2)
+        on_time = make_task(next_execution_time=NOW - timedelta(minutes=9))
+        late = make_task(next_execution_time=NOW - timedelta(minutes=11))
+        assert rule(on_time, [], NOW) is None
+        assert "逾期" in rule(late, [], NOW)
+        assert rule(make_task(state="PAUSED", next_execution_time="2000-01-01T00:00:00Z"), [], NOW) is None
+
+
+class TestHealthChecker:
+    """健康檢查器測試類"""
+
+    @pytest.fixture
+    def fake(self):
+        fake = FakeEScheduler()
+        for i in range(6):
+            fake.add_task(
+                name=f"task-{i}",
+                schedule_expression="rate(5 minutes)",
+                target_type="http",
+                target_arn="https://httpbin.org/post",
+                state="PAUSED" if i % 3 == 0 else "ENABLED",
+            )
+        return fake
+
+    @pytest.mark.asyncio
+    async def test_check_all(self, fake):
+        """測試檢查所有任務"""
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            reports = [r async for r in HealthChecker(sdk.scheduler).check_all()]
+
+        assert sorted(r.task_id for r in reports) == [1, 2, 3, 4, 5, 6]
+        unhealthy = sorted(r.task_id for r in reports if not r.is_healthy)
+        assert unhealthy == [1, 4]
+
+    @pytest.mark.asyncio
+    async def test_check_ids_with_missing_task(self, fake):
+        """測試以 ID 檢查時包含不存在的任務"""
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            reports = {r.task_id: r async for r in HealthChecker(sdk.scheduler).check([2, 999])}
+
+        assert reports[2].is_healthy
+        assert reports[2].task_name == "task-1"
+        assert not reports[999].is_healthy
+        assert "無法獲取任務詳情" in reports[999].issues[0]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, fake):
+        """測試同時進行中的請求不超過上限"""
+        active = 0
+        peak = 0
+
+        def latency():
+            return 0.001
+
+        fake.latency = latency
+        original = fake.handle
+
+        async def tracking_handle(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                return await original(request)
+            finally:
+                active -= 1
+
+        fake.handle = tracking_handle
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            checker = HealthChecker(sdk.scheduler, concurrency=3)
+            reports = [r async for r in checker.check(range(1, 7))]
+
+        assert len(reports) == 6
+        assert peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_results_stream_incrementally(self, fake):
+        """測試結果逐一產出且可提前結束"""
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            checker = HealthChecker(sdk.scheduler, concurrency=2)
+            async for report in checker.check(range(1, 7)):
+                assert report.task_id in range(1, 7)
+                break
+            await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_custom_rules(self, fake):
+        """測試自訂規則"""
+        def name_rule(task, executions, now):
+            return "名稱不符規範" if not task.name.startswith("prod-") else None
+
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            checker = HealthChecker(sdk.scheduler, rules=[name_rule])
+            reports = [r async for r in checker.check([1])]
+
+        assert reports[0].issues == ["名稱不符規範"]
@@ -0,0 +1,78 @@
+"""EScheduler SDK 匯入時間回歸測試"""
+
+import subprocess
+import sys
+
+import escheduler_sdk
+
+
+# `import escheduler_sdk` 的累計匯入時間上限，以同一個直譯器中 `import httpx` 的
+# 累計匯入時間為基準，不受執行測試的機器快慢影響
+IMPORT_BUDGET_RATIO = 0.25
+
+
+def run_python(code):
+    """在新的直譯器中執行程式碼，返回 (stdout, stderr)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout, result.stderr
+
+
+def cumulative_import_time(stderr, module):
+    """從 -X importtime 輸出取得模組的累計匯入時間（微秒）"""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"找不到模組 {module} 的匯入時間")
+
+
+class TestLazyImports:
+    """延遲匯入測試類"""
+
+    def test_top_level_import_is_lightweight(self):
+        """測試匯入套件與枚舉/異常類時不載入 httpx 與 pydantic"""
+        stdout, stderr = run_python(
+            "import sys, escheduler_sdk\n"
+            "from escheduler_sdk import TaskState, ESchedulerError\n"
+            "print(TaskState.ENABLED.value)\n"
+            "print('httpx' in sys.modules, 'pydantic' in sys.modules)\n"
+            "import httpx\n"
+        )
+        assert stdout.split() == ["ENABLED", "False", "False"]
+        budget = cumulative_import_time(stderr, "httpx") * IMPORT_BUDGET_RATIO
+        assert cumulative_import_time(stderr, "escheduler_sdk") < budget
+
+    def test_lazy_attributes_resolve(self):
+        """測試延遲名稱可以正確解析"""
+        from escheduler_sdk.client import ESchedulerClient
+        from escheduler_sdk.models import TaskState as ModelsTaskState
+
+        assert escheduler_sdk.ESchedulerClient is ESchedulerClient
+        assert escheduler_sdk.TaskState is ModelsTaskState
+        for name in escheduler_sdk.__all__:
+            assert getattr(escheduler_sdk, name) is not None
+        assert set(escheduler_sdk.__all__) <= set(dir(escheduler_sdk))
+
+    def test_unknown_attribute(self):
+        """測試未知名稱拋出 AttributeError"""
+        try:
+            escheduler_sdk.DoesNotExist
+        except AttributeError as e:
+            assert "DoesNotExist" in str(e)
+        else:
+            raise AssertionError("應該拋出 AttributeError")
+
+    def test_star_import(self):
+        """測試 from escheduler_sdk import *"""
+        stdout, _ = run_python(
+            "from escheduler_sdk import *\n"
+            "print(ESchedulerSDK.__name__, ScheduledTaskResponse.__name__)\n"
+        )
+        assert stdout.split() == ["ESchedulerSDK", "ScheduledTaskResponse"]
@@ -0,0 +1,245 @@
+"""EScheduler SDK 自適應並發限制測試"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.bulk import BulkJournal, BulkRunner
+from escheduler_sdk.enums import RequestPriority
+from escheduler_sdk.limiter import AdaptiveLimiter, current_priority, request_priority
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+class ConcurrencyProbe:
+    """記錄模擬伺服器同時處理的最大請求數"""
+
+    def __init__(self, fake):
+        self.fake = fake
+        self.current = 0
+        self.peak = 0
+        self.transport = httpx.MockTransport(self.handle)
+
+    async def handle(self, request):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            return await self.fake.handle(request)
+        finally:
+            self.current -= 1
+
+
+class TestAdaptiveLimiter:
+    """自適應並發限制器測試類"""
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            AdaptiveLimiter("vegas")
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=200, max_limit=100)
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_and_fifo_handoff(self):
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        order = []
+        release = asyncio.Event()
+
+        async def worker(i):
+            async with limiter.slot():
+                order.append(i)
+                await release.wait()
+
+        workers = [asyncio.create_task(worker(i)) for i in range(6)]
+        await asyncio.sleep(0)
+        assert limiter.stats()["in_flight"] == 2
+        assert limiter.queue_depth == 4
+
+        release.set()
+        await asyncio.gather(*workers)
+        assert order == list(range(6))
+        assert (limiter.in_flight, limiter.queue_depth) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_slot(self):
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        # 名額轉交後才取消，名額必須歸還
+        limiter.release(0.01)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert limiter.in_flight == 0
+
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_overload_signal(self):
+        limiter = AdaptiveLimiter(initial_limit=10)
+        with pytest.raises(httpx.ReadTimeout):
+            async with limiter.slot():
+                raise httpx.ReadTimeout("逾時")
+        with pytest.raises(KeyError):
+            async with limiter.slot():
+                raise KeyError("x")
+        assert limiter.limit == 9
+        assert limiter.drops == 1
+
+    @pytest.mark.asyncio
+    async def test_gradient_backs_off_when_latency_rises(self):
+        limiter = AdaptiveLimiter("gradient", initial_limit=10, max_limit=50)
+
+        async def saturated(rtt, samples):
+            for _ in range(samples):
+                while limiter.in_flight < limiter.limit:
+                    await limiter.acquire()
+                limiter.release(rtt)
+
+        await saturated(0.001, 300)
+        assert limiter.limit == 50
+
+        # 長期平均延遲會逐漸跟上新的延遲，上限之後會回升
+        await saturated(0.02, 60)
+        assert limiter.limit < 10
+        await saturated(0.02, 3000)
+        assert limiter.limit == 50
+
+
+class TestPriorityQueuing:
+    """優先級加權公平佇列測試類"""
+
+    def test_request_priority_context(self):
+        assert current_priority() is RequestPriority.NORMAL
+        with request_priority("bulk") as priority:
+            assert priority is RequestPriority.BULK
+            assert current_priority() is RequestPriority.BULK
+        assert current_priority() is RequestPriority.NORMAL
+        with pytest.raises(ValueError):
+            with request_priority("urgent"):
+                pass
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(weights={"bulk": 0})
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_order(self):
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+        order = []
+
+        async def waiter(priority):
+            await limiter.acquire(priority)
+            order.append(priority.value[0])
+
+        waiters = [asyncio.create_task(waiter(RequestPriority.BULK)) for _ in range(6)]
+        await asyncio.sleep(0)
+        with request_priority(RequestPriority.INTERACTIVE):
+            waiters += [asyncio.create_task(waiter(current_priority())) for _ in range(3)]
+        waiters += [asyncio.create_task(waiter(RequestPriority.NORMAL)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depths() == {"interactive": 3, "normal": 2, "bulk": 6}
+
+        for _ in range(len(waiters)):
+            limiter.release(None)
+            await asyncio.sleep(0)
+        await asyncio.gather(*waiters)
+        # 先排隊的 bulk 請求不會讓後到的 interactive 請求等到最後
+        assert "".join(order) == "inbiinbbbbb"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire("bulk"))
+        waiting = asyncio.create_task(limiter.acquire("bulk"))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        limiter.release(None)
+        await waiting
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert (limiter.in_flight, limiter.queue_depth) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_interactive_latency_under_bulk_load(self):
+        """測試批量刪除占滿並發名額時，互動請求仍能在數個往返內完成"""
+        fake = FakeEScheduler(latency=0.005)
+        fake.seed_tasks(301)
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=4)
+        async with ESchedulerSDK(base_url=BASE_URL, limiter=limiter, transport=fake.transport) as sdk:
+            with BulkJournal(":memory:") as journal:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=50)
+                bulk = asyncio.ensure_future(runner.delete_tasks(range(2, 302)))
+                await asyncio.sleep(0.02)
+
+                latencies = []
+                with request_priority(RequestPriority.INTERACTIVE):
+                    for _ in range(10):
+                        started = asyncio.get_running_loop().time()
+                        await sdk.scheduler.get_task(1)
+                        latencies.append(asyncio.get_running_loop().time() - started)
+                # 互動請求完成時批量刪除仍在排隊
+                assert limiter.queue_depths()["bulk"] > 0
+                assert (await bulk).succeeded == 300
+
+        # 先進先出時每個互動請求需要等待約 50 / 4 * 5ms
+        assert max(latencies) < 0.04
+
+
+class TestClientLimiter:
+    """客戶端並發限制測試類"""
+
+    @pytest.mark.asyncio
+    async def test_public_methods_accept_priority(self):
+        fake = FakeEScheduler()
+        fake.seed_tasks(1)
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        async with ESchedulerSDK(base_url=BASE_URL, limiter=limiter, transport=fake.transport) as sdk:
+            await limiter.acquire()
+            calls = [
+                asyncio.create_task(sdk.scheduler.get_task(1, priority="bulk")),
+                asyncio.create_task(sdk.scheduler.get_scheduler_stats(priority="interactive")),
+                asyncio.create_task(sdk.team.get_all_teams(priority=RequestPriority.INTERACTIVE)),
+                asyncio.create_task(sdk.scheduler.get_all_tasks()),
+            ]
+            await asyncio.sleep(0.01)
+            assert limiter.queue_depths() == {"interactive": 2, "normal": 1, "bulk": 1}
+            limiter.release(None)
+            await asyncio.gather(*calls)
+
+    @pytest.mark.asyncio
+    async def test_aimd_grows_under_load_and_backs_off(self):
+        fake = FakeEScheduler(latency=0.002)
+        fake.seed_tasks(1)
+        probe = ConcurrencyProbe(fake)
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=16)
+        async with ESchedulerSDK(base_url=BASE_URL, limiter=limiter, transport=probe.transport) as sdk:
+            assert sdk.client.limiter is limiter
+            await asyncio.gather(*(sdk.scheduler.get_task(1) for _ in range(100)))
+            assert limiter.limit == 16
+            assert probe.peak <= 16
+
+            fake.fail_next(429, 503, 503)
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    await sdk.scheduler.get_task(1)
+            assert limiter.limit == 11
+            assert limiter.drops == 3
+
+    @pytest.mark.asyncio
+    async def test_opt_in_and_disabled_by_default(self):
+        fake = FakeEScheduler()
+        fake.seed_tasks(1)
+        async with ESchedulerSDK(base_url=BASE_URL, limiter="aimd", transport=fake.transport) as sdk:
+            assert sdk.client.limiter.algorithm == "aimd"
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            assert sdk.client.limiter is None
+            assert (await sdk.scheduler.get_task(1)).id == 1
+            assert (await sdk.client.get("/api/scheduler/1", priority="interactive"))["id"] == 1
@@ -0,0 +1,132 @@
+"""EScheduler SDK 請求中介層測試"""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from escheduler_sdk import ESchedulerClient, ESchedulerSDK
+from escheduler_sdk.exceptions import TimeoutError, ValidationError
+from escheduler_sdk.middleware import Request
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+def recording(name, log):
+    """記錄進出順序的中介層"""
+    def middleware(call_next):
+        async def handler(request):
+            log.append(f"{name}>")
+            result = await call_next(request)
+            log.append(f"<{name}")
+            return result
+        return handler
+    return middleware
+
+
+class TestMiddleware:
+    """請求中介層測試類"""
+
+    @pytest.mark.asyncio
+    async def test_order_and_decoded_result(self):
+        fake = FakeEScheduler()
+        fake.seed_tasks(1)
+        log = []
+        results = []
+
+        def capture(call_next):
+            async def handler(request):
+                assert isinstance(request, Request)
+                result = await call_next(request)
+                results.append((request.method, request.endpoint, result))
+                return result
+            return handler
+
+        async with ESchedulerSDK(
+            base_url=BASE_URL,
+            middlewares=[recording("a", log), recording("b", log), capture],
+            transport=fake.transport
+        ) as sdk:
+            task = await sdk.scheduler.get_task(1)
+
+        assert task.id == 1
+        assert log == ["a>", "b>", "<b", "<a"]
+        # 自訂中介層收到解碼後的 JSON
+        assert results[0][:2] == ("GET", "/api/scheduler/1")
+        assert results[0][2]["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_short_circuit_cache(self):
+        fake = FakeEScheduler()
+        fake.seed_tasks(1)
+        cache = {}
+
+        def caching(call_next):
+            async def handler(request):
+                if request.method != "GET":
+                    return await call_next(request)
+                key = (request.url, str(request.params))
+                if key not in cache:
+                    cache[key] = await call_next(request)
+                return cache[key]
+            return handler
+
+        async with ESchedulerSDK(base_url=BASE_URL, middlewares=[caching], transport=fake.transport) as sdk:
+            for _ in range(5):
+                await sdk.scheduler.get_task(1)
+            await sdk.scheduler.get_task_executions(1)
+
+        assert fake.request_count == 2
+
+    @pytest.mark.asyncio
+    async def test_add_middleware_and_mutate_request(self):
+        seen = []
+
+        async def handle(request):
+            seen.append(request.headers.get("X-Trace"))
+            return httpx.Response(200, json={})
+
+        def tracing(call_next):
+            async def handler(request):
+                request.kwargs["headers"] = {"X-Trace": "abc"}
+                return await call_next(request)
+            return handler
+
+        async with ESchedulerClient(BASE_URL, transport=httpx.MockTransport(handle)) as client:
+            await client.get("/api/scheduler")
+            client.add_middleware(tracing)
+            assert len(client.middlewares) == 1
+            await client.get("/api/scheduler")
+
+        assert seen == [None, "abc"]
+
+    @pytest.mark.asyncio
+    async def test_max_retries_change_rebuilds_chain(self):
+        async def handle(request):
+            raise httpx.ReadTimeout("逾時", request=request)
+
+        async with ESchedulerClient(BASE_URL, transport=httpx.MockTransport(handle)) as client:
+            client.max_retries = 0
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                with pytest.raises(TimeoutError):
+                    await client.get("/api/scheduler")
+            mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_json_error_body(self):
+        """測試錯誤回應不是 JSON 時仍對應到正確的異常，且不重試"""
+        calls = []
+
+        async def handle(request):
+            calls.append(request)
+            return httpx.Response(400, text="bad request")
+
+        async with ESchedulerClient(BASE_URL, transport=httpx.MockTransport(handle)) as client:
+            with pytest.raises(ValidationError) as exc_info:
+                await client.get("/api/scheduler")
+
+        assert exc_info.value.message == "bad request"
+        assert exc_info.value.response_data == {}
+        assert len(calls) == 1
@@ -0,0 +1,122 @@
+"""EScheduler SDK 本地任務鏡像測試"""
+
+import asyncio
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.mirror import TaskMirror
+from escheduler_sdk.models import TaskState
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+@pytest.fixture
+def fake():
+    fake = FakeEScheduler()
+    fake.seed_tasks(30)
+    fake.add_task(
+        name="webhook-task",
+        schedule_expression="rate(1 hour)",
+        target_type="webhook",
+        target_arn="https://example.com/hook",
+        target_input={"key": "值"},
+    )
+    return fake
+
+
+class TestTaskMirror:
+    """本地任務鏡像測試類"""
+
+    @pytest.mark.asyncio
+    async def test_queries(self, fake):
+        """測試以索引欄位查詢"""
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            async with TaskMirror(sdk.scheduler) as mirror:
+                task = await mirror.get(31)
+                assert task.name == "webhook-task"
+                assert task.target_input == {"key": "值"}
+                assert await mirror.get(999) is None
+
+                assert [t.id for t in await mirror.find(name="task-5")] == [5]
+                assert [t.id for t in await mirror.find(target_arn="https://example.com/hook")] == [31]
+                paused = await mirror.find(state=TaskState.PAUSED)
+                assert paused and all(t.state == "PAUSED" for t in paused)
+                assert len(await mirror.find(state="ENABLED", limit=3)) == 3
+                assert await mirror.count_by("target_type") == {"http": 30, "webhook": 1}
+                assert len(mirror) == 31
+
+                with pytest.raises(ValueError):
+                    await mirror.find(description="x")
+
+        # 查詢期間只同步一次
+        assert fake.endpoint_counts[("GET", "/api/scheduler")] == 1
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync(self, fake):
+        """測試只寫入變更的任務並刪除已移除的任務"""
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            async with TaskMirror(sdk.scheduler, max_staleness=None) as mirror:
+                first = await mirror.sync()
+                assert (first.upserted, first.deleted, first.unchanged) == (31, 0, 0)
+
+                await sdk.scheduler.pause_task(1)
+                await sdk.scheduler.delete_task(2)
+                fake.add_task(
+                    name="new-task", schedule_expression="rate(1 minute)",
+                    target_type="http", target_arn="x", updated_at="2099-01-01T00:00:00Z"
+                )
+
+                # max_staleness=None 時查詢不會自動同步
+                assert (await mirror.get(1)).state != "PAUSED"
+
+                second = await mirror.sync()
+                assert (second.upserted, second.deleted, second.unchanged) == (2, 1, 29)
+                assert (await mirror.get(1)).state == "PAUSED"
+                assert await mirror.get(2) is None
+                assert [task.name for task in await mirror.find(name="new-task")] == ["new-task"]
+                # 每次同步都取得完整的任務清單
+                assert fake.endpoint_counts[("GET", "/api/scheduler")] == 2
+
+    @pytest.mark.asyncio
+    async def test_staleness_bound(self, fake, monkeypatch):
+        """測試超過 max_staleness 時查詢會先同步"""
+        now = [1_000_000.0]
+        monkeypatch.setattr("escheduler_sdk.mirror.time.time", lambda: now[0])
+
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            async with TaskMirror(sdk.scheduler, max_staleness=10) as mirror:
+                await mirror.get(1)
+                now[0] += 5
+                await mirror.get(1)
+                assert fake.endpoint_counts[("GET", "/api/scheduler")] == 1
+                now[0] += 6
+                await mirror.get(1)
+                assert fake.endpoint_counts[("GET", "/api/scheduler")] == 2
+                assert mirror.age == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_sync(self, fake):
+        """測試同時查詢只觸發一次同步"""
+        fake.latency = 0.01
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            async with TaskMirror(sdk.scheduler) as mirror:
+                await asyncio.gather(*(mirror.get(i) for i in range(1, 11)))
+        assert fake.endpoint_counts[("GET", "/api/scheduler")] == 1
+
+    @pytest.mark.asyncio
+    async def test_persistent_file(self, fake, tmp_path):
+        """測試重新開啟檔案後不需要重新下載未變更的任務"""
+        path = tmp_path / "tasks.db"
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            async with TaskMirror(sdk.scheduler, path) as mirror:
+                await mirror.sync()
+
+            async with TaskMirror(sdk.scheduler, path, max_staleness=60) as mirror:
+                assert len(mirror) == 31
+                assert (await mirror.get(31)).name == "webhook-task"
+                assert fake.endpoint_counts[("GET", "/api/scheduler")] == 1
+                result = await mirror.sync()
+                assert result.changed == 0
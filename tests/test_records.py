@@ -0,0 +1,95 @@
+"""EScheduler SDK 精簡任務記錄測試"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.models import ScheduledTaskResponse, TaskState
+from escheduler_sdk.records import TaskRecord, parse_datetime
+from escheduler_sdk.testing import FakeEScheduler
+
+
+TASK_DATA = {
+    "id": 7,
+    "name": "每日備份",
+    "description": None,
+    "schedule_expression": "cron(0 2 * * *)",
+    "timezone": "Asia/Taipei",
+    "target_type": "http",
+    "target_arn": "https://api.example.com/backup",
+    "target_input": {"backup_type": "full"},
+    "state": "ENABLED",
+    "last_execution_time": None,
+    "next_execution_time": "2024-01-16T02:00:00Z",
+    "execution_count": 3,
+    "max_retry_attempts": 3,
+    "retry_policy": None,
+    "dead_letter_config": None,
+    "created_at": "2024-01-15T09:00:00+08:00",
+    "updated_at": "2024-01-15T09:30:00",
+}
+
+
+class TestTaskRecord:
+    """精簡任務記錄測試類"""
+
+    def test_from_dict(self):
+        """測試從 API 字典建立記錄"""
+        record = TaskRecord.from_dict(TASK_DATA)
+
+        assert record.id == 7
+        assert record.state == "ENABLED"
+        assert record.target_input == {"backup_type": "full"}
+        assert record.next_execution_time == datetime(2024, 1, 16, 2, tzinfo=timezone.utc)
+        assert record.updated_at == datetime(2024, 1, 15, 9, 30)
+
+    def test_record_is_read_only_and_compact(self):
+        """測試記錄不可變且沒有 __dict__"""
+        record = TaskRecord.from_dict(TASK_DATA)
+        with pytest.raises(AttributeError):
+            record.name = "新名稱"
+        assert not hasattr(record, "__dict__")
+
+    def test_enum_like_strings_are_interned(self):
+        """測試狀態等欄位共用同一字串物件"""
+        first = TaskRecord.from_dict(dict(TASK_DATA, state="".join(["ENA", "BLED"])))
+        second = TaskRecord.from_dict(dict(TASK_DATA, state="".join(["ENAB", "LED"])))
+        assert first.state is second.state
+
+    def test_to_response_matches_model(self):
+        """測試轉換為 ScheduledTaskResponse 與直接解析一致"""
+        record = TaskRecord.from_dict(TASK_DATA)
+        assert record.to_response() == ScheduledTaskResponse(**TASK_DATA)
+
+    def test_parse_datetime(self):
+        """測試時間解析"""
+        assert parse_datetime(None) is None
+        now = datetime.now()
+        assert parse_datetime(now) is now
+        assert parse_datetime("2024-01-15T09:00:00Z").tzinfo == timezone.utc
+
+    @pytest.mark.parametrize("value", [
+        "2024-01-15T09:00:00.1Z",
+        "2024-01-15T09:00:00.12+08:00",
+        "2024-01-15T09:00:00.12345Z",
+        "2024-01-15T09:00:00.1234567+08:00",
+        "2024-01-15T09:00:00+08:00",
+    ])
+    def test_parse_datetime_matches_model(self, value):
+        """測試各種小數秒位數與時區與 ScheduledTaskResponse 的解析結果一致"""
+        data = dict(TASK_DATA, created_at=value, updated_at=value)
+        record = TaskRecord.from_dict(data)
+        assert record.created_at == ScheduledTaskResponse(**data).created_at
+        assert record.created_at.utcoffset() is not None
+
+    @pytest.mark.asyncio
+    async def test_get_all_task_records(self):
+        """測試從 API 取得精簡記錄"""
+        fake = FakeEScheduler()
+        fake.seed_tasks(30)
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            records = await sdk.scheduler.get_all_task_records(state=TaskState.PAUSED)
+
+        assert len(records) == 10
+        assert all(isinstance(r, TaskRecord) and r.state == "PAUSED" for r in records)
@@ -0,0 +1,160 @@
+"""EScheduler SDK 本地搜尋索引測試"""
+
+import random
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.models import ScheduledTaskResponse, TaskChangeEvent, TaskChangeType
+from escheduler_sdk.search import TaskSearchIndex, tokenize
+from escheduler_sdk.testing import FakeEScheduler
+
+
+def make_task(task_id, name, description=None, target_arn="https://httpbin.org/post"):
+    """建立 API 回傳格式的任務字典"""
+    return {
+        "id": task_id,
+        "name": name,
+        "description": description,
+        "schedule_expression": "rate(5 minutes)",
+        "timezone": "Asia/Taipei",
+        "target_type": "http",
+        "target_arn": target_arn,
+        "target_input": None,
+        "state": "ENABLED",
+        "last_execution_time": None,
+        "next_execution_time": None,
+        "execution_count": 0,
+        "max_retry_attempts": 3,
+        "retry_policy": None,
+        "dead_letter_config": None,
+        "created_at": "2024-01-15T09:00:00Z",
+        "updated_at": "2024-01-15T09:00:00Z",
+    }
+
+
+@pytest.fixture
+def index():
+    return TaskSearchIndex.from_tasks([
+        make_task(1, "Daily Report", "每日報表寄送"),
+        make_task(2, "Hourly backup", "資料庫備份"),
+        make_task(3, "report-cleanup", None, target_arn="https://example.com/cleanup"),
+        make_task(4, "Billing sync", "sync invoices to ERP"),
+    ])
+
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+
+class TestTokenize:
+    """詞元切分測試類"""
+
+    def test_tokenize(self):
+        assert tokenize("Daily-Report v2") == ["daily", "report", "v2"]
+        assert tokenize("每日報表") == ["每日報表", "日報表", "報表", "表"]
+        assert tokenize("每日報表", suffixes=False) == ["每日報表"]
+        assert tokenize(None) == []
+
+
+class TestTaskSearchIndex:
+    """本地搜尋索引測試類"""
+
+    def test_prefix_and_and_semantics(self, index):
+        """測試前綴比對與多詞元 AND"""
+        assert ids(index.search("rep")) == [1, 3]
+        assert ids(index.search("daily rep")) == [1]
+        assert ids(index.search("REPORT")) == [1, 3]
+        assert ids(index.search("example.com")) == [3]
+        assert index.search("") == []
+        assert index.search("nothing") == []
+
+    def test_cjk_substring(self, index):
+        """測試中文子字串比對"""
+        assert ids(index.search("報表")) == [1]
+        assert ids(index.search("備份")) == [2]
+        assert ids(index.search("日報")) == [1]
+
+    def test_fuzzy(self, index):
+        """測試編輯距離 1 的模糊比對"""
+        assert ids(index.search("reprot")) == [1, 3]
+        assert ids(index.search("bakup")) == [2]
+        assert ids(index.search("billling")) == [4]
+        # 太短的詞元不做模糊比對
+        assert index.search("xy") == []
+        assert TaskSearchIndex.from_tasks([make_task(1, "report")], fuzzy=False).search("reprot") == []
+
+    def test_incremental_updates(self, index):
+        """測試新增、更新與刪除"""
+        index.add(make_task(5, "weekly report"))
+        assert ids(index.search("report")) == [1, 3, 5]
+
+        index.add(make_task(1, "Daily summary"))
+        assert ids(index.search("report")) == [3, 5]
+        assert ids(index.search("summ")) == [1]
+
+        index.remove(3)
+        index.remove(999)
+        assert ids(index.search("report")) == [5]
+        assert ids(index.search("cleanup")) == []
+        assert len(index) == 4
+        assert 3 not in index
+
+    def test_apply_change_events(self, index):
+        """測試套用 watch() 的變更事件"""
+        task = ScheduledTaskResponse(**make_task(6, "new nightly export"))
+        index.apply(TaskChangeEvent(type=TaskChangeType.CREATED, task_id=6, task=task))
+        assert ids(index.search("nightly")) == [6]
+        index.apply(TaskChangeEvent(type=TaskChangeType.DELETED, task_id=6, task=None))
+        assert index.search("nightly") == []
+
+    def test_limit(self, index):
+        """測試筆數上限"""
+        assert ids(index.search("https", limit=2)) == [1, 2]
+
+    def test_matches_brute_force_with_dense_postings(self):
+        """測試位元遮罩路徑與逐一比對結果一致"""
+        rng = random.Random(0)
+        words = ["daily", "report", "backup", "sync", "報表", "同步"]
+        tasks = [
+            make_task(i, f"{rng.choice(words)}-{rng.choice(words)}-{i}", " ".join(rng.sample(words, 2)))
+            for i in range(1, 2001)
+        ]
+        index = TaskSearchIndex.from_tasks(tasks, dense_threshold=64)
+
+        def brute_force(keyword):
+            terms = set(tokenize(keyword, suffixes=False))
+            result = []
+            for task in tasks:
+                tokens = set()
+                for field in ("name", "description", "target_arn"):
+                    tokens.update(tokenize(task[field]))
+                if all(any(token.startswith(term) for token in tokens) for term in terms):
+                    result.append(task["id"])
+            return result
+
+        for keyword in ["d", "daily rep", "報表 sync", "1", "12 b", "https 19"]:
+            assert ids(index.search(keyword)) == brute_force(keyword)
+
+        # 更新後位元遮罩與前綴快取同步更新
+        for i in range(1, 2001, 3):
+            index.remove(i)
+        tasks = [task for task in tasks if task["id"] % 3 != 1]
+        index.add(make_task(5000, "daily 1 報表"))
+        tasks.append(make_task(5000, "daily 1 報表"))
+        for keyword in ["d", "daily rep", "報表", "1"]:
+            assert ids(index.search(keyword)) == brute_force(keyword)
+
+    @pytest.mark.asyncio
+    async def test_search_tasks_matches_api_shape(self):
+        """測試與 search_tasks 相同的返回型別"""
+        fake = FakeEScheduler()
+        fake.seed_tasks(20)
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            index = TaskSearchIndex.from_tasks(await sdk.scheduler.get_all_task_records())
+            remote = await sdk.scheduler.search_tasks("task-1")
+            local = await index.search_tasks("task-1")
+
+        assert all(isinstance(task, ScheduledTaskResponse) for task in local)
+        assert {task.id for task in local} <= {task.id for task in remote}
+        assert ids(local) == [1] + list(range(10, 20))
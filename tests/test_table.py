@@ -0,0 +1,143 @@
+"""EScheduler SDK 欄式任務表測試"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.models import ScheduledTaskResponse, TaskState
+from escheduler_sdk.records import TaskRecord
+from escheduler_sdk.table import TaskTable
+from escheduler_sdk.testing import FakeEScheduler
+
+
+def make_task(task_id, state="ENABLED", target_type="http", next_execution_time=None):
+    """建立 API 回傳格式的任務字典"""
+    return {
+        "id": task_id,
+        "name": f"任務 {task_id}",
+        "description": None,
+        "schedule_expression": "rate(5 minutes)",
+        "timezone": "Asia/Taipei",
+        "target_type": target_type,
+        "target_arn": "https://httpbin.org/post",
+        "target_input": {"index": task_id},
+        "state": state,
+        "last_execution_time": None,
+        "next_execution_time": next_execution_time,
+        "execution_count": task_id * 2,
+        "max_retry_attempts": 3,
+        "retry_policy": None,
+        "dead_letter_config": None,
+        "created_at": "2024-01-15T09:00:00Z",
+        "updated_at": f"2024-01-15T09:00:{task_id:02d}+08:00",
+    }
+
+
+@pytest.fixture
+def table():
+    return TaskTable.from_tasks([
+        make_task(1, next_execution_time="2024-01-15T09:00:00Z"),
+        make_task(2, state="PAUSED", target_type="webhook"),
+        make_task(3, state="DISABLED", next_execution_time="2099-01-01T00:00:00Z"),
+        make_task(4, target_type="webhook", next_execution_time="2024-01-15T10:00:00"),
+    ])
+
+
+class TestTaskTable:
+    """欄式任務表測試類"""
+
+    def test_columns(self, table):
+        """測試欄位型別"""
+        assert len(table) == 4
+        assert table.column("id").tolist() == [1, 2, 3, 4]
+        assert table.column("state").tolist() == ["ENABLED", "PAUSED", "DISABLED", "ENABLED"]
+        assert table.column("updated_at").dtype == np.dtype("datetime64[us]")
+        # 帶時區的時間轉換為 UTC
+        assert str(table.column("updated_at")[0]) == "2024-01-15T01:00:01.000000"
+        assert np.isnat(table.column("next_execution_time")[1])
+
+    def test_count_by(self, table):
+        """測試分組計數"""
+        assert table.count_by("state") == {"ENABLED": 2, "PAUSED": 1, "DISABLED": 1}
+        assert table.count_by("target_type") == {"http": 2, "webhook": 2}
+
+    def test_where(self, table):
+        """測試條件過濾"""
+        enabled = table.where(state=TaskState.ENABLED)
+        assert enabled.column("id").tolist() == [1, 4]
+        assert table.where(state=["PAUSED", "DISABLED"]).column("id").tolist() == [2, 3]
+        assert table.where(state="ENABLED", target_type="webhook").column("id").tolist() == [4]
+        assert len(table.where(state="UNKNOWN")) == 0
+        assert table.where(id=3).column("id").tolist() == [3]
+
+    def test_overdue(self, table):
+        """測試找出過期任務"""
+        now = datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+        assert table.overdue(now=now).column("id").tolist() == [1, 4]
+        assert table.overdue(now=now, grace=timedelta(hours=2, minutes=30)).column("id").tolist() == [1]
+
+    def test_sort_by(self, table):
+        """測試排序"""
+        assert table.sort_by("execution_count", descending=True).column("id").tolist() == [4, 3, 2, 1]
+        assert table.sort_by("state").column("state").tolist() == ["DISABLED", "ENABLED", "ENABLED", "PAUSED"]
+        assert table.sort_by("updated_at").column("id").tolist() == [1, 2, 3, 4]
+
+    def test_sort_by_keeps_ties_stable_when_descending(self, table):
+        """測試遞減排序保持相同值的原有順序，NaT 排在最後"""
+        assert table.sort_by("state", descending=True).column("id").tolist() == [2, 1, 4, 3]
+        assert table.sort_by("next_execution_time").column("id").tolist() == [1, 4, 3, 2]
+        assert table.sort_by("next_execution_time", descending=True).column("id").tolist() == [3, 4, 1, 2]
+
+    def test_sort_by_nullable_object_column(self):
+        """測試含 None 的字串欄位排序，None 無論方向都排在最後"""
+        tasks = [make_task(i) for i in range(1, 6)]
+        for task, description in zip(tasks, ["b", None, "a", "b", None]):
+            task["description"] = description
+        table = TaskTable.from_tasks(tasks)
+        assert table.sort_by("description").column("id").tolist() == [3, 1, 4, 2, 5]
+        assert table.sort_by("description", descending=True).column("id").tolist() == [1, 4, 3, 2, 5]
+        with pytest.raises(ValueError):
+            table.sort_by("target_input")
+
+    def test_task_stats(self, table):
+        """測試本地統計"""
+        assert table.task_stats() == {
+            "total_tasks": 4,
+            "enabled_tasks": 2,
+            "disabled_tasks": 1,
+            "paused_tasks": 1,
+        }
+
+    def test_rows(self, table):
+        """測試取得單列與切片"""
+        record = table[0]
+        assert isinstance(record, TaskRecord)
+        assert record.target_input == {"index": 1}
+        assert record.created_at == datetime(2024, 1, 15, 9, tzinfo=timezone.utc)
+        assert record.next_execution_time == datetime(2024, 1, 15, 9, tzinfo=timezone.utc)
+        assert [r.id for r in table[1:3]] == [2, 3]
+        assert record.to_response().id == 1
+
+    def test_from_models_and_records(self):
+        """測試從模型與記錄建立"""
+        data = [make_task(1), make_task(2, state="PAUSED")]
+        from_models = TaskTable.from_tasks(ScheduledTaskResponse(**task) for task in data)
+        from_records = TaskTable.from_tasks(TaskRecord.from_dict(task) for task in data)
+        assert from_models.count_by("state") == from_records.count_by("state") == {"ENABLED": 1, "PAUSED": 1}
+
+    @pytest.mark.asyncio
+    async def test_matches_server_stats(self):
+        """測試本地統計與伺服器統計一致"""
+        fake = FakeEScheduler()
+        fake.seed_tasks(3001)
+        async with ESchedulerSDK(base_url="http://escheduler.test", transport=fake.transport) as sdk:
+            table = await sdk.scheduler.get_task_table()
+            stats = await sdk.scheduler.get_scheduler_stats()
+
+        local = table.task_stats()
+        assert local["total_tasks"] == stats.total_tasks
+        assert local["enabled_tasks"] == stats.enabled_tasks
+        assert local["disabled_tasks"] == stats.disabled_tasks
@@ -0,0 +1,93 @@
+"""EScheduler SDK 任務範本測試"""
+
+import json
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK, ScheduledTaskCreate, TargetType, TaskTemplate
+from escheduler_sdk.bulk import BulkJournal, BulkRunner
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+def base_task():
+    return ScheduledTaskCreate(
+        name="同步",
+        schedule_expression="rate(5 minutes)",
+        target_type=TargetType.HTTP,
+        target_arn="https://example.com/sync",
+        target_input={"region": "ap-northeast-1", "shard": 0, "options": {"dry_run": False}}
+    )
+
+
+def expected_body(**changes):
+    """以一般方式建立任務時送出的內容"""
+    data = base_task().model_dump(exclude_none=True)
+    target_input = dict(data["target_input"], **changes.pop("target_input", {}))
+    data.update(changes, target_input=target_input)
+    return json.loads(ScheduledTaskCreate(**data).model_dump_json(exclude_none=True))
+
+
+class TestTaskTemplate:
+    """任務範本測試類"""
+
+    def test_render_matches_model_dump(self):
+        template = TaskTemplate(base_task(), fields=("name", "max_retry_attempts"), input_keys=("shard", "options"))
+
+        assert json.loads(template.render()) == expected_body()
+        body = template.render(name="同步-\"42\"", shard=42, options={"dry_run": True, "tags": ["a"]})
+        assert json.loads(body) == expected_body(
+            name="同步-\"42\"", target_input={"shard": 42, "options": {"dry_run": True, "tags": ["a"]}}
+        )
+        assert json.loads(template.render(max_retry_attempts=5))["max_retry_attempts"] == 5
+        assert template.to_create(shard=7).target_input["shard"] == 7
+
+    def test_field_values_are_validated(self):
+        template = TaskTemplate(base_task(), fields=("name", "schedule_expression"))
+        with pytest.raises(ValueError):
+            template.render(name="")
+        with pytest.raises(ValueError):
+            template.render(schedule_expression="every 5 minutes")
+        with pytest.raises(ValueError):
+            template.render(region="us-east-1")
+        # 驗證失敗不影響之後的項目
+        assert json.loads(template.render(name="ok"))["name"] == "ok"
+
+    def test_invalid_templates(self):
+        with pytest.raises(ValueError):
+            TaskTemplate(base_task(), fields=("title",))
+        with pytest.raises(ValueError):
+            TaskTemplate(base_task(), input_keys=("missing",))
+        with pytest.raises(ValueError):
+            TaskTemplate(base_task(), fields=("name",), input_keys=("name",))
+
+
+class TestTemplateCreation:
+    """以範本建立任務測試類"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    async def test_bulk_create_from_template(self, compression):
+        fake = FakeEScheduler()
+        template = TaskTemplate(base_task(), input_keys=("shard",))
+        items = [{"name": f"同步-{i}", "shard": i} for i in range(30)]
+        async with ESchedulerSDK(
+            base_url=BASE_URL, compression=compression, compression_threshold=64, transport=fake.transport
+        ) as sdk:
+            created = await sdk.scheduler.create_task_from_template(template, name="單筆")
+            assert created.target_input == base_task().target_input
+
+            with BulkJournal(":memory:") as journal:
+                runner = BulkRunner(sdk.scheduler, journal, concurrency=4)
+                result = await runner.create_from_template(template, items)
+                assert result.succeeded == 30
+                resumed = await runner.create_from_template(template, items)
+                assert resumed.skipped == 30
+
+                for position, task_id in journal.results("create").items():
+                    task = fake.get_task(int(task_id))
+                    assert task["name"] == f"同步-{position}"
+                    assert task["target_input"]["shard"] == int(position)
+                    assert task["target_input"]["region"] == "ap-northeast-1"
@@ -0,0 +1,167 @@
+"""EScheduler SDK 本地模擬伺服器測試"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError
+)
+from escheduler_sdk.models import (
+    ExecutionStatus,
+    ScheduledTaskCreate,
+    ScheduledTaskUpdate,
+    TargetType,
+    TaskState
+)
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+def make_task_data(name="測試任務"):
+    """建立任務創建數據"""
+    return ScheduledTaskCreate(
+        name=name,
+        description="模擬伺服器測試",
+        schedule_expression="rate(5 minutes)",
+        target_type=TargetType.HTTP,
+        target_arn="https://httpbin.org/post",
+        target_input={"message": "test"}
+    )
+
+
+class TestFakeEScheduler:
+    """本地模擬伺服器測試類"""
+
+    @pytest.fixture
+    def fake(self):
+        return FakeEScheduler(seed=0)
+
+    @pytest.fixture
+    async def sdk(self, fake):
+        sdk = ESchedulerSDK(base_url=BASE_URL, transport=fake.transport)
+        yield sdk
+        await sdk.close()
+
+    @pytest.mark.asyncio
+    async def test_task_lifecycle(self, sdk, fake):
+        """測試任務 CRUD 與狀態管理"""
+        task = await sdk.scheduler.create_task(make_task_data())
+        assert task.id == 1
+        assert task.target_input == {"message": "test"}
+
+        fetched = await sdk.scheduler.get_task(task.id)
+        assert fetched.name == "測試任務"
+
+        updated = await sdk.scheduler.update_task(task.id, ScheduledTaskUpdate(name="新名稱"))
+        assert updated.name == "新名稱"
+
+        paused = await sdk.scheduler.pause_task(task.id)
+        assert paused.state == TaskState.PAUSED
+
+        assert len(await sdk.scheduler.get_all_tasks(state=TaskState.PAUSED)) == 1
+        assert len(await sdk.scheduler.get_all_tasks(state=TaskState.ENABLED)) == 0
+        assert [t.id for t in await sdk.scheduler.search_tasks("新名")] == [task.id]
+
+        result = await sdk.scheduler.delete_task(task.id)
+        assert str(task.id) in result.message
+        with pytest.raises(NotFoundError):
+            await sdk.scheduler.get_task(task.id)
+        assert fake.task_count == 0
+
+    @pytest.mark.asyncio
+    async def test_trigger_and_executions(self, sdk):
+        """測試觸發與執行記錄"""
+        task = await sdk.scheduler.create_task(make_task_data())
+        await sdk.scheduler.trigger_task(task.id)
+
+        executions = await sdk.scheduler.get_task_executions(task.id)
+        assert len(executions) == 1
+        assert executions[0].status == ExecutionStatus.SUCCEEDED
+
+        execution = await sdk.scheduler.trigger_and_wait(task.id, timeout=5)
+        assert execution.id == 2
+
+        stats = await sdk.scheduler.get_scheduler_stats()
+        assert stats.total_tasks == 1
+        assert stats.successful_executions_today == 2
+
+    @pytest.mark.asyncio
+    async def test_seed_tasks_and_stats(self, sdk, fake):
+        """測試批量建立任務"""
+        fake.seed_tasks(3000)
+        stats = await sdk.scheduler.get_scheduler_stats()
+        assert stats.total_tasks == 3000
+        assert stats.enabled_tasks == 1000
+
+        tasks = await sdk.scheduler.get_all_tasks(state=TaskState.DISABLED)
+        assert len(tasks) == 1000
+        assert all(t.state == "DISABLED" for t in tasks)
+
+    @pytest.mark.asyncio
+    async def test_validation_error(self, sdk):
+        """測試缺少必要欄位時返回 400"""
+        with pytest.raises(ValidationError):
+            await sdk.client.post("/api/scheduler", json_data={"name": "x"})
+
+    @pytest.mark.asyncio
+    async def test_team_auth(self, sdk):
+        """測試團隊認證"""
+        teams = await sdk.team.get_all_teams()
+        assert [t.name for t in teams] == ["第1小隊"]
+        assert (await sdk.team.get_team_by_token("ABCD")).id == 1
+
+        assert await sdk.authenticate("ABCD")
+        assert sdk.is_authenticated()
+        assert not (await sdk.team.auth_team("WXYZ")).status
+
+    @pytest.mark.asyncio
+    async def test_require_auth(self):
+        """測試要求認證時未帶 token 返回 401"""
+        fake = FakeEScheduler(require_auth=True)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            with pytest.raises(AuthenticationError):
+                await sdk.scheduler.get_all_tasks()
+            await sdk.authenticate("ABCD")
+            assert await sdk.scheduler.get_all_tasks() == []
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self, sdk, fake):
+        """測試錯誤注入"""
+        fake.fail_next(429, 503)
+        with pytest.raises(RateLimitError):
+            await sdk.scheduler.get_all_tasks()
+        with pytest.raises(ServerError):
+            await sdk.scheduler.get_all_tasks()
+
+        # 逾時與連線錯誤由客戶端重試後成功
+        fake.fail_next(httpx.ReadTimeout, httpx.ConnectError)
+        with patch("asyncio.sleep"):
+            assert await sdk.scheduler.get_all_tasks() == []
+        assert fake.request_count == 5
+
+    @pytest.mark.asyncio
+    async def test_random_error_rate(self):
+        """測試隨機錯誤率"""
+        fake = FakeEScheduler(error_rate=1.0, error_status_codes=[500], seed=1)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+            with pytest.raises(ServerError):
+                await sdk.scheduler.get_scheduler_stats()
+
+    @pytest.mark.asyncio
+    async def test_asgi_app(self, fake):
+        """測試以 ASGI 應用程式使用"""
+        fake.seed_tasks(5)
+        transport = httpx.ASGITransport(app=fake)
+        async with ESchedulerSDK(base_url=BASE_URL, transport=transport) as sdk:
+            tasks = await sdk.scheduler.get_all_tasks()
+            assert [t.id for t in tasks] == [1, 2, 3, 4, 5]
+            task = await sdk.scheduler.create_task(make_task_data())
+            assert task.id == 6
@@ -0,0 +1,165 @@
+"""EScheduler SDK 任務匯出與匯入測試"""
+
+import json
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.bulk import BulkJournal
+from escheduler_sdk.exceptions import AuthenticationError
+from escheduler_sdk.transfer import read_tasks
+from escheduler_sdk.testing import FakeEScheduler
+
+
+BASE_URL = "http://escheduler.test"
+
+
+@pytest.fixture
+def source():
+    fake = FakeEScheduler()
+    fake.seed_tasks(25)
+    fake.add_task(
+        name="帶參數的任務",
+        schedule_expression="cron(0 2 * * *)",
+        target_type="webhook",
+        target_arn="https://example.com/hook",
+        target_input={"key": "值", "nested": [1, 2]},
+        retry_policy={"backoff": 2},
+        next_execution_time="2024-01-15T09:00:00Z",
+    )
+    return fake
+
+
+async def export(fake, path, **kwargs):
+    async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+        return await sdk.scheduler.export_tasks(path, **kwargs)
+
+
+async def import_(fake, path, **kwargs):
+    async with ESchedulerSDK(base_url=BASE_URL, transport=fake.transport) as sdk:
+        return await sdk.scheduler.import_tasks(path, **kwargs)
+
+
+def inventory(fake):
+    """以可比較的形式列出任務（排除 ID 與時間戳）"""
+    keys = ("name", "schedule_expression", "target_type", "target_arn", "target_input", "retry_policy", "state")
+    return sorted(
+        tuple(json.dumps(fake.get_task(task_id)[key], sort_keys=True) for key in keys)
+        for task_id in fake._tasks
+    )
+
+
+class TestExportImport:
+    """匯出與匯入測試類"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filename", ["tasks.ndjson", "tasks.parquet"])
+    async def test_round_trip(self, source, tmp_path, filename):
+        """測試匯出後匯入到另一個環境"""
+        if filename.endswith(".parquet"):
+            pytest.importorskip("pyarrow")
+        path = tmp_path / filename
+
+        assert await export(source, path) == 26
+
+        target = FakeEScheduler()
+        result = await import_(target, path, concurrency=4)
+        assert (result.created, result.skipped, result.failed) == (26, 0, 0)
+        assert inventory(target) == inventory(source)
+
+    @pytest.mark.asyncio
+    async def test_export_state_filter(self, source, tmp_path):
+        """測試依狀態匯出"""
+        from escheduler_sdk.models import TaskState
+
+        path = tmp_path / "paused.ndjson"
+        count = await export(source, path, state=TaskState.PAUSED)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert count == len(lines) > 0
+        assert all(json.loads(line)["state"] == "PAUSED" for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_validation_errors_are_reported(self, tmp_path):
+        """測試驗證失敗的任務不會中止匯入"""
+        path = tmp_path / "tasks.ndjson"
+        rows = [
+            {"name": "ok", "schedule_expression": "rate(1 minute)", "target_type": "http", "target_arn": "x"},
+            {"name": "bad", "schedule_expression": "every minute", "target_type": "http", "target_arn": "x"},
+            {"name": "ok2", "schedule_expression": "rate(1 minute)", "target_type": "http", "target_arn": "x"},
+        ]
+        path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+        target = FakeEScheduler()
+        result = await import_(target, path)
+        assert result.created == 2
+        assert [position for position, _ in result.errors] == [1]
+        assert target.task_count == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_lines_are_reported(self, tmp_path):
+        """測試無法解析的 NDJSON 行記錄行號後繼續匯入"""
+        path = tmp_path / "tasks.ndjson"
+        ok = {"name": "ok", "schedule_expression": "rate(1 minute)", "target_type": "http", "target_arn": "x"}
+        bad = dict(ok, schedule_expression="every minute")
+        path.write_text(
+            json.dumps(ok) + "\n\n" + '{"name": "broken",\n' + "[1, 2]\n"
+            + json.dumps(bad) + "\n" + json.dumps(ok) + "\n",
+            encoding="utf-8"
+        )
+
+        target = FakeEScheduler()
+        result = await import_(target, path)
+        assert result.created == 2
+        assert target.task_count == 2
+        assert [position for position, _ in result.errors] == [1, 2, 3]
+        assert [message.split(":")[0] for _, message in result.errors] == ["第 3 行", "第 4 行", "第 5 行"]
+        with pytest.raises(ValueError, match="第 3 行"):
+            list(read_tasks(path))
+
+    @pytest.mark.asyncio
+    async def test_invalid_state_is_reported(self, tmp_path):
+        """測試無效的任務狀態記錄為失敗且不建立該任務"""
+        path = tmp_path / "tasks.ndjson"
+        ok = {"name": "ok", "schedule_expression": "rate(1 minute)", "target_type": "http", "target_arn": "x"}
+        rows = [dict(ok, state="PAUSED"), dict(ok, name="bad", state="PAUSED_X"), dict(ok, state="ENABLED")]
+        path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+        target = FakeEScheduler()
+        result = await import_(target, path, concurrency=1)
+        assert result.created == 2
+        assert [position for position, _ in result.errors] == [1]
+        assert result.errors[0][1] == "第 2 行: 無效的任務狀態: 'PAUSED_X'"
+        assert sorted(target.get_task(task_id)["state"] for task_id in target._tasks) == ["ENABLED", "PAUSED"]
+
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint(self, source, tmp_path):
+        """測試中斷後從檢查點繼續不會重複建立"""
+        path = tmp_path / "tasks.ndjson"
+        checkpoint = tmp_path / "import.checkpoint"
+        await export(source, path)
+
+        target = FakeEScheduler()
+        async with ESchedulerSDK(base_url=BASE_URL, transport=target.transport) as sdk:
+            # 前 10 個請求正常處理，之後認證失敗中止匯入
+            target.fail_next(*([None] * 10), 401)
+            with pytest.raises(AuthenticationError):
+                await sdk.scheduler.import_tasks(path, concurrency=1, checkpoint=checkpoint)
+        first_run = target.task_count
+        assert 0 < first_run < 26
+        with BulkJournal(checkpoint) as journal:
+            assert journal.summary("import")["succeeded"] == first_run
+
+        result = await import_(target, path, concurrency=4, checkpoint=checkpoint)
+        assert (result.created, result.skipped) == (26 - first_run, first_run)
+        assert inventory(target) == inventory(source)
+
+    def test_read_tasks_in_chunks(self, tmp_path):
+        """測試逐塊讀取"""
+        path = tmp_path / "tasks.ndjson"
+        path.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(7)) + "\n", encoding="utf-8")
+        assert [len(chunk) for chunk in read_tasks(path, chunk_size=3)] == [3, 3, 1]
+
+    def test_unknown_format(self, tmp_path):
+        """測試不支援的格式"""
+        with pytest.raises(ValueError):
+            list(read_tasks(tmp_path / "tasks.csv", format="csv"))
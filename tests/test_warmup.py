@@ -0,0 +1,79 @@
+"""EScheduler SDK 連線預熱與 keep-alive 測試"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from escheduler_sdk import ESchedulerSDK
+from escheduler_sdk.testing import FakeEScheduler
+
+
+@pytest.fixture
+async def served():
+    """在本機埠上提供服務的模擬伺服器"""
+    fake = FakeEScheduler()
+    fake.seed_tasks(3)
+    server = await fake.serve()
+    port = server.sockets[0].getsockname()[1]
+    yield fake, f"http://127.0.0.1:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+async def wait_until(predicate, timeout=5.0):
+    """等到條件成立，超過 timeout 秒則測試失敗"""
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestWarmup:
+    """連線預熱測試類"""
+
+    @pytest.mark.asyncio
+    async def test_warm_connections_are_reused(self, served):
+        fake, base_url = served
+        async with ESchedulerSDK(base_url=base_url) as sdk:
+            assert await sdk.warmup(5) == 5
+            assert fake.connections_opened == 5
+            assert fake.endpoint_counts == {("HEAD", "/"): 5}
+
+            tasks = await asyncio.gather(*(sdk.scheduler.get_task(i % 3 + 1) for i in range(5)))
+            assert [task.id for task in tasks] == [1, 2, 3, 1, 2]
+            assert fake.connections_opened == 5
+
+    @pytest.mark.asyncio
+    async def test_warmup_failures_are_counted(self):
+        async with ESchedulerSDK(base_url="http://127.0.0.1:9", max_retries=0) as sdk:
+            assert await sdk.warmup(2) == 0
+
+
+class TestKeepalive:
+    """背景 keep-alive 測試類"""
+
+    @pytest.mark.asyncio
+    async def test_pings_only_when_idle(self, served, monkeypatch):
+        fake, base_url = served
+        # 以手動推進的時鐘判斷閒置，結果不受測試機器快慢影響
+        now = [0.0]
+        monkeypatch.setattr("escheduler_sdk.client.time", SimpleNamespace(monotonic=lambda: now[0]))
+        async with ESchedulerSDK(base_url=base_url) as sdk:
+            await sdk.scheduler.get_task(1)
+            sdk.start_keepalive(min_connections=2, interval=0.01)
+            with pytest.raises(RuntimeError):
+                sdk.start_keepalive()
+
+            # 時鐘未前進時連線沒有閒置，不會送出 ping
+            await asyncio.sleep(0.1)
+            assert ("HEAD", "/") not in fake.endpoint_counts
+
+            # 閒置超過 interval 後開始 ping，並重用同一組暖連線
+            now[0] += 1
+            await wait_until(lambda: fake.endpoint_counts[("HEAD", "/")] >= 6)
+            assert fake.connections_opened == 2
+
+            task = sdk.client._keepalive_task
+        assert task.cancelled()
+        assert sdk.client._keepalive_task is None
@@ -0,0 +1,117 @@
+"""EScheduler SDK 任務變更監看測試"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from escheduler_sdk.models import TaskChangeType, TaskState
+from escheduler_sdk.scheduler import SchedulerAPI
+from escheduler_sdk.watch import TaskIndex
+
+
+def make_task(task_id, updated_at="2024-01-15T09:00:00", **overrides):
+    """建立 API 回傳格式的任務字典"""
+    task = {
+        "id": task_id,
+        "name": f"任務 {task_id}",
+        "description": None,
+        "schedule_expression": "rate(5 minutes)",
+        "timezone": "Asia/Taipei",
+        "target_type": "http",
+        "target_arn": "https://httpbin.org/post",
+        "target_input": None,
+        "state": "ENABLED",
+        "last_execution_time": None,
+        "next_execution_time": "2024-01-15T09:05:00",
+        "execution_count": 0,
+        "max_retry_attempts": 3,
+        "retry_policy": None,
+        "dead_letter_config": None,
+        "created_at": "2024-01-15T09:00:00",
+        "updated_at": updated_at,
+    }
+    task.update(overrides)
+    return task
+
+
+class TestTaskIndex:
+    """任務索引測試類"""
+
+    def test_diff_detects_changes(self):
+        """測試比對新增、更新與刪除"""
+        index = TaskIndex()
+        events = index.diff([make_task(1), make_task(2)])
+        assert [(e.type, e.task_id) for e in events] == [
+            (TaskChangeType.CREATED, 1),
+            (TaskChangeType.CREATED, 2),
+        ]
+        assert events[0].task.name == "任務 1"
+
+        events = index.diff([
+            make_task(1, updated_at="2024-01-15T10:00:00"),
+            make_task(3),
+        ])
+        assert [(e.type, e.task_id) for e in events] == [
+            (TaskChangeType.UPDATED, 1),
+            (TaskChangeType.CREATED, 3),
+            (TaskChangeType.DELETED, 2),
+        ]
+        assert events[2].task is None
+        assert len(index) == 2
+
+    def test_unchanged_snapshot_yields_nothing(self):
+        """測試沒有變更時不產生事件"""
+        index = TaskIndex()
+        index.load([make_task(1), make_task(2)])
+        assert index.diff([make_task(1), make_task(2)]) == []
+
+    def test_next_execution_time_change_is_detected(self):
+        """測試 next_execution_time 變動視為更新"""
+        index = TaskIndex()
+        index.load([make_task(1)])
+        events = index.diff([make_task(1, next_execution_time="2024-01-15T09:10:00")])
+        assert [(e.type, e.task_id) for e in events] == [(TaskChangeType.UPDATED, 1)]
+
+
+class TestSchedulerWatch:
+    """SchedulerAPI.watch 測試類"""
+
+    @pytest.mark.asyncio
+    async def test_watch_yields_only_changes(self):
+        """測試 watch 只產出變更事件"""
+        client = Mock()
+        client.get = AsyncMock(side_effect=[
+            [make_task(1)],
+            [make_task(1)],
+            [make_task(1, state="PAUSED", updated_at="2024-01-15T10:00:00")],
+        ])
+        scheduler = SchedulerAPI(client)
+
+        events = []
+        with patch("escheduler_sdk.scheduler.asyncio.sleep", new=AsyncMock()):
+            async for event in scheduler.watch(interval=5, state=TaskState.ENABLED):
+                events.append(event)
+                if len(events) == 2:
+                    break
+
+        assert [(e.type, e.task_id) for e in events] == [
+            (TaskChangeType.CREATED, 1),
+            (TaskChangeType.UPDATED, 1),
+        ]
+        assert events[1].task.state == "PAUSED"
+        client.get.assert_called_with("/api/scheduler", params={"state": "ENABLED"}, priority=None)
+
+    @pytest.mark.asyncio
+    async def test_watch_without_initial_events(self):
+        """測試 emit_initial=False 時略過第一輪快照"""
+        client = Mock()
+        client.get = AsyncMock(side_effect=[
+            [make_task(1), make_task(2)],
+            [make_task(1)],
+        ])
+        scheduler = SchedulerAPI(client)
+
+        with patch("escheduler_sdk.scheduler.asyncio.sleep", new=AsyncMock()):
+            async for event in scheduler.watch(emit_initial=False):
+                assert event.type == TaskChangeType.DELETED
+                assert event.task_id == 2
+                break